@@ -0,0 +1,86 @@
+"""
+Memory held by parsed ASTs: slotted node classes with source spans (the
+current layout) against the same slotted classes without spans, and
+against classes with a per-instance __dict__ (the original layout).
+
+    python benchmarks/bench_ast_memory.py [--messages N]
+
+Sizes are measured with tracemalloc as the bytes still allocated once
+the trees are built, and include the strings, lists and dicts they own.
+"""
+
+from __future__ import annotations
+
+import argparse
+import dataclasses
+import gc
+import tracemalloc
+
+from corpus import example_sources, synthetic_pub
+
+import axon_parser
+from axon_parser import ASTNode, parse
+
+
+def _twins(slots: bool) -> dict[type, type]:
+    """Span-less twins of every node class, built from the same fields."""
+    return {
+        cls: dataclasses.make_dataclass(
+            cls.__name__, [f.name for f in dataclasses.fields(cls) if f.compare], slots=slots)
+        for cls in vars(axon_parser).values()
+        if isinstance(cls, type) and issubclass(cls, ASTNode)
+    }
+
+
+_DICT_CLASSES = _twins(slots=False)
+_PLAIN_CLASSES = _twins(slots=True)
+
+
+def _to_twins(value, classes: dict[type, type]):
+    if isinstance(value, ASTNode):
+        twin = classes[type(value)]
+        return twin(*(_to_twins(getattr(value, f.name), classes)
+                      for f in dataclasses.fields(value) if f.compare))
+    if isinstance(value, list):
+        return [_to_twins(v, classes) for v in value]
+    if isinstance(value, dict):
+        return {k: _to_twins(v, classes) for k, v in value.items()}
+    return value
+
+
+def _retained(build) -> tuple[int, object]:
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return size, result
+
+
+def measure(name: str, source: str):
+    parse(source)  # warm up any lazily built module state
+    span_size, messages = _retained(lambda: parse(source))
+    plain_size, _ = _retained(lambda: _to_twins(parse(source), _PLAIN_CLASSES))
+    dict_size, _ = _retained(lambda: _to_twins(parse(source), _DICT_CLASSES))
+    count = len(messages)
+    print(f"{name:28} {count:>8} {dict_size / count:>10.0f} {plain_size / count:>11.0f}"
+          f" {1 - plain_size / dict_size:>8.1%} {span_size / count:>11.0f}"
+          f" {span_size / plain_size - 1:>+9.1%}")
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--messages", type=int, default=20000,
+                    help="size of the synthetic PUB corpus")
+    args = ap.parse_args()
+
+    print(f"{'corpus':28} {'messages':>8} {'dict B/msg':>10} {'slots B/msg':>11} {'saved':>8}"
+          f" {'spans B/msg':>11} {'span cost':>9}")
+    for name, source in example_sources().items():
+        measure(name, source)
+    measure(f"synthetic PUB x{args.messages}", synthetic_pub(args.messages))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Wire formats compared: text AXON through parse(), the binary encoding
+through decode(), and json.loads() of the same AST written as JSON.
+
+The JSON column is a lower bound for a JSON wire format: loads() stops at
+dicts and lists, where parse() and decode() build the AST nodes.
+
+    python benchmarks/bench_binary.py [--messages N] [--repeat R]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+
+from corpus import example_sources, synthetic_pub
+
+from axon_parser import Message, parse
+from axon_binary import decode, encode
+from axon_serializer import dumps
+
+
+def _best(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _jsonable(node):
+    """The AST as plain JSON values: {"type": class name, field: value}."""
+    if isinstance(node, Message):
+        routing = node.routing
+        return {"type": "Message", "performative": node.performative,
+                "sender": routing.sender, "receiver": routing.receiver,
+                "meta": None if node.meta is None else _jsonable(node.meta.fields),
+                "content": _jsonable(node.content)}
+    if isinstance(node, dict):
+        return {key: _jsonable(value) for key, value in node.items()}
+    if isinstance(node, list):
+        return [_jsonable(value) for value in node]
+    if hasattr(node, "__dataclass_fields__"):
+        out = {"type": type(node).__name__}
+        for name in node.__dataclass_fields__:
+            out[name] = _jsonable(getattr(node, name))
+        return out
+    return node
+
+
+def measure(name: str, source: str, repeat: int):
+    messages = parse(source)
+    payload = encode(messages)
+    assert decode(payload) == messages
+    text = dumps(messages)
+    as_json = json.dumps([_jsonable(m) for m in messages], separators=(",", ":"))
+
+    parse_t = _best(lambda: parse(text), repeat)
+    decode_t = _best(lambda: decode(payload), repeat)
+    json_t = _best(lambda: json.loads(as_json), repeat)
+    encode_t = _best(lambda: encode(messages), repeat)
+    per = 1e6 / len(messages)
+    print(f"{name:28} {len(text.encode()):>8} {len(payload):>8} {len(as_json):>8}"
+          f" {parse_t * per:>8.1f} {decode_t * per:>9.1f} {json_t * per:>8.1f}"
+          f" {encode_t * per:>9.1f} {parse_t / decode_t:>9.1f}x")
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--messages", type=int, default=5000)
+    ap.add_argument("--repeat", type=int, default=5)
+    args = ap.parse_args()
+
+    print(f"{'input':28} {'text B':>8} {'binary B':>8} {'json B':>8} {'parse us':>8}"
+          f" {'decode us':>9} {'json us':>8} {'encode us':>9} {'vs parse':>10}")
+    for name, source in example_sources().items():
+        measure(name, source, args.repeat)
+    measure("synthetic PUB", synthetic_pub(args.messages), args.repeat)
+
+
+if __name__ == "__main__":
+    main()
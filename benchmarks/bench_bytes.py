@@ -0,0 +1,83 @@
+"""
+Lexing and parsing a file in place: ByteLexer / parse_bytes() over an
+mmap of the file, against reading and decoding it first for RegexLexer /
+parse(). Peak is the memory traced while scanning, over the trees
+(for a scan, tokens are counted and dropped).
+
+    python benchmarks/bench_bytes.py [--messages N] [--repeat R]
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import mmap
+import os
+import tempfile
+import time
+import tracemalloc
+
+from corpus import example_sources, synthetic_pub
+
+from axon_parser import ByteLexer, RegexLexer, parse, parse_bytes
+
+
+def _best(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _peak(fn) -> int:
+    gc.collect()
+    tracemalloc.start()
+    fn()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+
+def _count(tokens) -> int:
+    return sum(1 for _ in tokens)
+
+
+def measure(name: str, path: str, repeat: int):
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        def read():
+            with open(path, encoding="utf-8") as f:
+                return f.read()
+
+        scans = (lambda: _count(RegexLexer(read()).iter_tokens()),
+                 lambda: _count(ByteLexer(data).iter_tokens()))
+        parses = (lambda: parse(read()), lambda: parse_bytes(data))
+        times = [_best(fn, repeat) for fn in scans + parses]
+        peaks = [_peak(fn) for fn in scans]
+    size = os.path.getsize(path)
+    print(f"{name:28} {size / 1e6:>6.1f}" + "".join(f" {t * 1e3:>9.1f}" for t in times)
+          + "".join(f" {p / 1e6:>8.1f}" for p in peaks))
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--messages", type=int, default=20000)
+    ap.add_argument("--repeat", type=int, default=3)
+    args = ap.parse_args()
+
+    print(f"{'corpus':28} {'MB':>6} {'scan ms':>9} {'bytes ms':>9} {'parse ms':>9}"
+          f" {'bytes ms':>9} {'peak MB':>8} {'bytes MB':>8}")
+    examples = "\n".join(example_sources().values())
+    corpora = [("examples x100", "\n".join([examples] * 100)),
+               (f"synthetic PUB x{args.messages}", synthetic_pub(args.messages))]
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, source in corpora:
+            path = os.path.join(tmp, "corpus.axon")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(source)
+            measure(name, path, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Canonicalizer throughput and savings: tokens before and after, and the
+per-message cost of canonicalize() next to parse() on the same text.
+The first pass over a feed searches each new shape; the second runs on
+memoized decisions, as an ingest loop does.
+
+    python benchmarks/bench_canonical.py [--encoding cl100k_base|o200k_base|chars]
+                                         [--messages N] [--repeat R]
+
+`chars` counts characters instead of tokens (no tiktoken needed).
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+
+from corpus import ROOT, example_sources, synthetic_pub
+
+from axon_canonical import ENCODINGS, Canonicalizer
+from axon_parser import parse
+
+
+def _best(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def measure(name: str, source: str, encoding: str, repeat: int):
+    if encoding == "chars":
+        sys.path.insert(0, os.path.join(ROOT, "experiments", "lib"))
+        from token_counter import count_characters
+        canon = Canonicalizer(counter=count_characters)
+    else:
+        canon = Canonicalizer(encoding)
+    start = time.perf_counter()
+    results = canon.canonicalize(source)
+    first = time.perf_counter() - start
+    warm = _best(lambda: canon.canonicalize(source), repeat)
+    parse_t = _best(lambda: parse(source), repeat)
+
+    before = sum(r.original_tokens for r in results)
+    after = sum(r.tokens for r in results)
+    per = 1e6 / len(results)
+    print(f"{name:28} {len(results):>6} {before:>9} {after:>9} {(before - after) / before:>7.1%}"
+          f" {parse_t * per:>9.1f} {first * per:>9.1f} {warm * per:>9.1f}")
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--encoding", default="cl100k_base", choices=ENCODINGS + ("chars",))
+    ap.add_argument("--messages", type=int, default=5000)
+    ap.add_argument("--repeat", type=int, default=3)
+    args = ap.parse_args()
+
+    print(f"{'input':28} {'msgs':>6} {'before':>9} {'after':>9} {'saved':>7}"
+          f" {'parse us':>9} {'first us':>9} {'warm us':>9}")
+    for name, source in example_sources().items():
+        measure(name, source, args.encoding, args.repeat)
+    measure("synthetic PUB", synthetic_pub(args.messages), args.encoding, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
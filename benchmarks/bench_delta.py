@@ -0,0 +1,85 @@
+"""
+Telemetry bandwidth and receive cost with delta-coded PUB streams:
+full records every interval against DeltaEncoder keyframes and deltas,
+for feeds where a few (or all) fields change per message.
+
+    python benchmarks/bench_delta.py [--messages N] [--interval K] [--repeat R]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+
+from corpus import synthetic_pub
+
+from axon_parser import parse
+from axon_delta import DeltaDecoder, DeltaEncoder
+from axon_serializer import dumps
+
+FIELDS = ("cpu", "mem", "reqs", "errors", "p50", "p99", "disk", "net_in", "net_out", "status")
+
+
+def telemetry(count: int, changes: int, seed: int = 0) -> str:
+    """`count` PUBs from 8 monitors, `changes` fields changing per message."""
+    rnd = random.Random(seed)
+    units = ("%", "GB", "", "", "ms", "ms", "%", "MB", "MB", None)
+    state = {}
+    lines = []
+    for i in range(count):
+        source = f"@monitor-{i % 8}"
+        values = state.setdefault(source, {f: rnd.randrange(100) for f in FIELDS})
+        for field in rnd.sample(FIELDS, changes):
+            values[field] = rnd.randrange(100)
+        body = ", ".join(
+            f"{f}:{'#ok' if v < 90 else '#warn'}" if unit is None else f"{f}:{v}{unit}"
+            for (f, v), unit in zip(values.items(), units))
+        lines.append(f'[ts:{1700000000 + i}] PUB({source}>@dashboard): {{{body}}}')
+    return "\n".join(lines) + "\n"
+
+
+def _best(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def measure(name: str, source: str, interval: int, repeat: int):
+    messages = parse(source)
+    encoder = DeltaEncoder(interval)
+    wire = dumps([encoder.encode(m) for m in messages])
+
+    def receive():
+        decoder = DeltaDecoder()
+        return [decoder.decode(m) for m in parse(wire)]
+
+    assert receive() == messages
+    full_t = _best(lambda: parse(source), repeat)
+    delta_t = _best(receive, repeat)
+    per = 1e6 / len(messages)
+    full_b, delta_b = len(source.encode()), len(wire.encode())
+    print(f"{name:28} {full_b / len(messages):>8.1f} {delta_b / len(messages):>8.1f}"
+          f" {delta_b / full_b:>6.0%} {full_t * per:>9.1f} {delta_t * per:>9.1f}")
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--messages", type=int, default=5000)
+    ap.add_argument("--interval", type=int, default=32, help="keyframe interval")
+    ap.add_argument("--repeat", type=int, default=5)
+    args = ap.parse_args()
+
+    print(f"{'stream':28} {'full B':>8} {'delta B':>8} {'ratio':>6} {'parse us':>9}"
+          f" {'receive us':>9}")
+    for changes in (1, 3, len(FIELDS)):
+        measure(f"telemetry, {changes} changed", telemetry(args.messages, changes),
+                args.interval, args.repeat)
+    measure("synthetic PUB", synthetic_pub(args.messages), args.interval, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Re-parsing after a keystroke: IncrementalDocument.edit() against a full
+parse() of the edited text. Each keystroke types a space at the start
+of a line near the top, middle or end of the file, and the next one
+deletes it again.
+
+    python benchmarks/bench_incremental.py [--messages N] [--repeat R]
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+from corpus import example_sources, synthetic_pub
+
+from axon_incremental import IncrementalDocument
+from axon_parser import parse
+
+
+def _best(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _keystrokes(doc: IncrementalDocument, at: int, count: int = 50):
+    for _ in range(count):
+        doc.edit(at, at, " ")
+        doc.edit(at, at + 1, "")
+
+
+def measure(name: str, source: str, repeat: int):
+    full = _best(lambda: parse(source), repeat)
+    doc = IncrementalDocument(source)
+    times = []
+    for where in (0.0, 0.5, 1.0):
+        at = source.rfind("\n", 0, int(len(source) * where)) + 1
+        times.append(_best(lambda: _keystrokes(doc, at), repeat) / 100)
+    print(f"{name:28} {full * 1e3:>10.1f}" + "".join(f" {t * 1e3:>9.3f}" for t in times)
+          + f" {full / max(times):>8.0f}x")
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--messages", type=int, default=5000)
+    ap.add_argument("--repeat", type=int, default=3)
+    args = ap.parse_args()
+
+    print(f"{'corpus':28} {'parse ms':>10} {'top ms':>9} {'mid ms':>9} {'end ms':>9}"
+          f" {'speedup':>9}")
+    examples = "\n".join(example_sources().values())
+    measure("examples x100", "\n".join([examples] * 100), args.repeat)
+    measure(f"synthetic PUB x{args.messages}", synthetic_pub(args.messages), args.repeat)
+
+
+if __name__ == "__main__":
+    main()
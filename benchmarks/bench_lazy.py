@@ -0,0 +1,57 @@
+"""
+Forwarding cost: eager parse against lazy parse, where only meta,
+performative and routing are read and the content is never touched,
+and against an eager parse with lazy literals (string and number values
+never read).
+
+    python benchmarks/bench_lazy.py [--messages N] [--repeat R]
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+from corpus import example_sources, synthetic_pub
+
+from axon_parser import parse
+
+
+def _best(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _route(messages):
+    for m in messages:
+        m.meta, m.performative, m.routing
+
+
+def measure(name: str, source: str, repeat: int):
+    eager = _best(lambda: _route(parse(source)), repeat)
+    lazy = _best(lambda: _route(parse(source, lazy=True)), repeat)
+    full = _best(lambda: [m.content for m in parse(source, lazy=True)], repeat)
+    literals = _best(lambda: _route(parse(source, lazy_literals=True)), repeat)
+    print(f"{name:28} {eager * 1e3:>10.1f} {lazy * 1e3:>10.1f} {eager / lazy:>7.1f}x"
+          f" {full * 1e3:>12.1f} {literals * 1e3:>13.1f}")
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--messages", type=int, default=20000)
+    ap.add_argument("--repeat", type=int, default=5)
+    args = ap.parse_args()
+
+    print(f"{'corpus':28} {'eager ms':>10} {'lazy ms':>10} {'speedup':>8} {'lazy+all ms':>12}"
+          f" {'literals ms':>13}")
+    examples = "\n".join(example_sources().values())
+    measure("examples x100", "\n".join([examples] * 100), args.repeat)
+    measure(f"synthetic PUB x{args.messages}", synthetic_pub(args.messages), args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+parse_many() and parse_document() scaling: wall time for a backfill
+batch, and for one large document cut at its message boundaries, on
+1..N worker processes, against plain parse().
+
+    python benchmarks/bench_parse_many.py [--sources N] [--max-workers W] [--repeat R]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import time
+
+from corpus import example_sources, synthetic_pub
+
+from axon_parallel import parse_document, parse_many
+from axon_parser import message_boundaries, parse
+
+
+def _best(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--sources", type=int, default=400)
+    ap.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    ap.add_argument("--repeat", type=int, default=3)
+    args = ap.parse_args()
+
+    examples = list(example_sources().values())
+    sources = [
+        synthetic_pub(50, seed=i) if i % 2 else examples[i // 2 % len(examples)]
+        for i in range(args.sources)
+    ]
+    size = sum(len(s) for s in sources)
+    print(f"{args.sources} sources, {size / 1e6:.1f} MB, {os.cpu_count()} cores")
+
+    serial = _best(lambda: [parse(s) for s in sources], args.repeat)
+    print(f"{'workers':>8} {'seconds':>9} {'MB/s':>8} {'speedup':>8}")
+    print(f"{'parse()':>8} {serial:>9.3f} {size / serial / 1e6:>8.2f} {1:>7.2f}x")
+    for workers in range(1, args.max_workers + 1):
+        elapsed = _best(lambda: parse_many(sources, workers=workers), args.repeat)
+        print(f"{workers:>8} {elapsed:>9.3f} {size / elapsed / 1e6:>8.2f} {serial / elapsed:>7.2f}x")
+
+    document = "\n".join(sources)
+    scan = _best(lambda: message_boundaries(document), args.repeat)
+    serial = _best(lambda: parse(document), args.repeat)
+    print(f"\none document: boundary scan {scan:.3f}s ({serial / scan:.1f}x faster than parse)")
+    print(f"{'workers':>8} {'seconds':>9} {'MB/s':>8} {'speedup':>8}")
+    print(f"{'parse()':>8} {serial:>9.3f} {size / serial / 1e6:>8.2f} {1:>7.2f}x")
+    for workers in range(1, args.max_workers + 1):
+        elapsed = _best(lambda: parse_document(document, workers=workers), args.repeat)
+        print(f"{workers:>8} {elapsed:>9.3f} {size / elapsed / 1e6:>8.2f} {serial / elapsed:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+Send-path cost: serializing messages with dumps() against parsing the
+same text, and against format_ast()'s debug tree as the only previous
+way to print an AST.
+
+    python benchmarks/bench_serializer.py [--messages N] [--repeat R]
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+from corpus import example_sources, synthetic_pub
+
+from axon_parser import format_ast, parse
+from axon_serializer import dumps
+
+
+def _best(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def measure(name: str, source: str, repeat: int):
+    messages = parse(source)
+    assert parse(dumps(messages)) == messages
+    parse_t = _best(lambda: parse(source), repeat)
+    dumps_t = _best(lambda: dumps(messages), repeat)
+    debug_t = _best(lambda: [format_ast(m) for m in messages], repeat)
+    per = 1e6 / len(messages)
+    print(f"{name:28} {len(messages):>6} {parse_t * per:>9.1f} {dumps_t * per:>9.1f}"
+          f" {debug_t * per:>13.1f} {parse_t / dumps_t:>9.1f}x")
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--messages", type=int, default=5000)
+    ap.add_argument("--repeat", type=int, default=5)
+    args = ap.parse_args()
+
+    print(f"{'input':28} {'msgs':>6} {'parse us':>9} {'dumps us':>9} {'format_ast us':>13}"
+          f" {'vs parse':>10}")
+    for name, source in example_sources().items():
+        measure(name, source, args.repeat)
+    measure("synthetic PUB", synthetic_pub(args.messages), args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Per-message parse cost on PUB traffic: full parse against ShapeCache,
+whose hits lex the message and fill a cached template instead of
+running the parser. Lexing is not skipped, so the gain is bounded by
+the parser's share of the cost; routing and tag names are part of the
+shape, so feeds with many distinct names hit less often.
+
+    python benchmarks/bench_shape_cache.py [--messages N] [--repeat R] [--maxsize M]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+
+from corpus import synthetic_pub
+
+from axon_cache import ShapeCache
+from axon_parser import parse
+
+
+def _best(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def monitor_feed(count: int, seed: int = 0) -> list[str]:
+    """Fixed-shape feed: one route, one record layout, varying numbers."""
+    rnd = random.Random(seed)
+    return [
+        f"PUB(@monitor>@dashboard): {{cpu:{rnd.randrange(101)}%, "
+        f"mem:{rnd.uniform(0.5, 16):.1f}GB, reqs:{rnd.randrange(10000)}}}"
+        for _ in range(count)
+    ]
+
+
+def measure(name: str, lines: list[str], maxsize: int, repeat: int):
+    cache = ShapeCache(maxsize)
+    for line in lines:
+        assert cache.parse(line) == parse(line)
+    info = cache.info()
+
+    full = _best(lambda: [parse(line) for line in lines], repeat)
+    cached = _best(lambda: [cache.parse(line) for line in lines], repeat)
+    per = 1e6 / len(lines)
+    print(f"{name:20} {info.size:>7} {info.hit_rate:>9.1%} {full * per:>9.1f}"
+          f" {cached * per:>10.1f} {full / cached:>7.2f}x")
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--messages", type=int, default=20000)
+    ap.add_argument("--repeat", type=int, default=5)
+    ap.add_argument("--maxsize", type=int, default=8192)
+    args = ap.parse_args()
+
+    print(f"{'feed':20} {'shapes':>7} {'hit rate':>9} {'parse us':>9} {'cached us':>10} {'speedup':>8}")
+    measure("monitor", monitor_feed(args.messages), args.maxsize, args.repeat)
+    measure("synthetic PUB", synthetic_pub(args.messages).splitlines(), args.maxsize, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Per-message overhead of a long conversation with and without the
+session symbol dictionary (SymbolEncoder/SymbolDecoder): average size of
+the messages in successive windows of the conversation, plain against
+dictionary-coded, and the decode cost against parse().
+
+    python benchmarks/bench_symbols.py [--messages N] [--maxsize M]
+                                       [--encoding cl100k_base|o200k_base]
+
+With --encoding, tokens are counted too (needs tiktoken).
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+from corpus import example_sources, synthetic_pub
+
+from axon_parser import SymbolDecoder, SymbolEncoder, parse
+from axon_serializer import dumps
+from axon_canonical import ENCODINGS, token_counter
+
+WINDOWS = (1, 10, 100, 1000, 10000)
+
+
+def measure(name: str, texts: list[str], maxsize: int, counter):
+    encoder = SymbolEncoder(maxsize)
+    coded = [encoder.encode(text) for text in texts]
+
+    start = time.perf_counter()
+    for text in texts:
+        parse(text)
+    parse_t = time.perf_counter() - start
+    decoder = SymbolDecoder(maxsize)
+    start = time.perf_counter()
+    for text in coded:
+        decoder.decode(text)
+    decode_t = time.perf_counter() - start
+
+    lo = 0
+    for hi in WINDOWS:
+        hi = min(hi, len(texts))
+        if hi <= lo:
+            break
+        count = hi - lo
+        plain = sum(len(t.encode()) for t in texts[lo:hi]) / count
+        small = sum(len(t.encode()) for t in coded[lo:hi]) / count
+        line = f"{name:28} {f'{lo + 1}-{hi}':>11} {plain:>9.1f} {small:>9.1f} {small / plain:>7.0%}"
+        if counter is not None:
+            plain_tok = sum(counter(t) for t in texts[lo:hi]) / count
+            small_tok = sum(counter(t) for t in coded[lo:hi]) / count
+            line += f" {plain_tok:>9.1f} {small_tok:>9.1f}"
+        print(line)
+        lo = hi
+    print(f"{'':28} decode {decode_t * 1e6 / len(texts):.1f} us/msg,"
+          f" parse {parse_t * 1e6 / len(texts):.1f} us/msg")
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--messages", type=int, default=5000)
+    ap.add_argument("--maxsize", type=int, default=1000)
+    ap.add_argument("--encoding", choices=ENCODINGS)
+    args = ap.parse_args()
+    counter = token_counter(args.encoding) if args.encoding else None
+
+    header = f"{'conversation':28} {'messages':>11} {'plain B':>9} {'dict B':>9} {'ratio':>7}"
+    if counter is not None:
+        header += f" {'plain tok':>9} {'dict tok':>9}"
+    print(header)
+    examples = [dumps(m) for source in example_sources().values() for m in parse(source)]
+    replayed = (examples * (args.messages // len(examples) + 1))[:args.messages]
+    measure("examples, replayed", replayed, args.maxsize, counter)
+    pub = [dumps(m) for m in parse(synthetic_pub(args.messages))]
+    measure("synthetic PUB", pub, args.maxsize, counter)
+
+
+if __name__ == "__main__":
+    main()
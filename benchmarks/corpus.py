@@ -0,0 +1,39 @@
+"""
+Shared inputs for the benchmarks: the example files and a synthetic
+stream of PUB messages shaped like a sensor subscription feed.
+"""
+
+from __future__ import annotations
+
+import glob
+import os
+import random
+import sys
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+
+def example_sources() -> dict[str, str]:
+    """Return {file name: text} for examples/*.axon."""
+    sources = {}
+    for path in sorted(glob.glob(os.path.join(ROOT, "examples", "*.axon"))):
+        with open(path) as f:
+            sources[os.path.basename(path)] = f.read()
+    return sources
+
+
+def synthetic_pub(count: int, seed: int = 0) -> str:
+    """Return `count` PUB messages, one per line, with varying values."""
+    rnd = random.Random(seed)
+    statuses = ["#ok", "#warn", "#fault", "#offline"]
+    lines = []
+    for i in range(count):
+        lines.append(
+            f'[id:"m{i}", ts:{1700000000 + i}] '
+            f"PUB(@sensor-{rnd.randrange(64)}>@hub): "
+            f"{{temp: {rnd.uniform(-20, 60):.1f}, load: {rnd.randrange(101)}%, "
+            f"latency: {rnd.randrange(1, 500)}ms, status: {rnd.choice(statuses)}, "
+            f'tags: [#edge, #zone-{rnd.randrange(8)}], note: "reading {i}"}}'
+        )
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,310 @@
+"""
+AXON Archive — random access to large .axon files
+
+An archive is a UTF-8 .axon file that only ever grows by appending. A
+sidecar index (ARCHIVE.idx, JSON) records per message its byte offset
+and length plus the id, re, ctx and ts values of its meta block, so
+message N, or the message with a given id, is found without reading
+the rest of the file; ArchiveReader maps the archive with mmap and
+parses only that message's slice.
+
+The index remembers how much of the archive it covers and a digest of
+windows sampled evenly across that part, the last ending where it ends.
+When the archive has grown and those windows are unchanged, only the
+new part is scanned, starting again from the last indexed message,
+which the appended text may have continued; truncation or a change to a
+sampled window rebuilds the index from scratch. Archives up to
+_SAMPLES * _SAMPLE_BYTES (64 KiB) are covered completely; in a larger
+one, an edit that keeps the size and misses every window goes
+unnoticed, so remove the sidecar after rewriting an archive in place.
+
+Usage:
+    with ArchiveReader("conversation.axon") as archive:
+        archive[41]              # Message
+        archive.by_id("m42")     # Message
+        archive.entries[41].ts   # meta value from the index
+"""
+
+from __future__ import annotations
+
+import codecs
+import hashlib
+import json
+import mmap
+import os
+from dataclasses import astuple, dataclass
+from typing import Iterator
+
+from axon_parser import (
+    BooleanLiteral,
+    LexerError,
+    Message,
+    NumberLiteral,
+    ParseError,
+    StringLiteral,
+    message_boundaries,
+    parse,
+)
+
+INDEX_VERSION = 2
+INDEX_SUFFIX = ".idx"
+
+# Meta keys copied into the index
+INDEXED_META = ("id", "re", "ctx", "ts")
+
+# Windows of the indexed part that must be unchanged for an update
+_SAMPLES = 16
+_SAMPLE_BYTES = 4096
+
+# Bytes decoded at a time while scanning
+_WINDOW_BYTES = 1 << 22
+
+
+@dataclass(slots=True)
+class IndexEntry:
+    """Where one message lies in the archive, and its indexed meta."""
+    offset: int
+    length: int
+    id: str | int | float | bool | None = None
+    re: str | int | float | bool | None = None
+    ctx: str | int | float | bool | None = None
+    ts: str | int | float | bool | None = None
+
+
+@dataclass
+class ArchiveIndex:
+    """Index of an archive: entries for the first `size` bytes."""
+    entries: list[IndexEntry]
+    size: int = 0
+    digest: str = ""
+
+    def to_json(self) -> str:
+        return json.dumps({
+            "version": INDEX_VERSION,
+            "size": self.size,
+            "digest": self.digest,
+            "entries": [astuple(entry) for entry in self.entries],
+        }, separators=(",", ":"))
+
+    @classmethod
+    def from_json(cls, text: str) -> ArchiveIndex:
+        data = json.loads(text)
+        if data.get("version") != INDEX_VERSION:
+            raise ValueError(f"unsupported index version {data.get('version')!r}")
+        return cls([IndexEntry(*row) for row in data["entries"]], data["size"], data["digest"])
+
+
+def _digest(data, size: int) -> str:
+    """Digest of _SAMPLES windows spread evenly over data[:size]."""
+    h = hashlib.blake2b(digest_size=16)
+    for k in range(1, _SAMPLES + 1):
+        end = size * k // _SAMPLES
+        h.update(data[max(0, end - _SAMPLE_BYTES):end])
+    return h.hexdigest()
+
+
+def _literal(node) -> str | int | float | bool | None:
+    if isinstance(node, (StringLiteral, NumberLiteral, BooleanLiteral)):
+        return node.value
+    return None
+
+
+def _scan(data, start: int, end: int) -> tuple[list[IndexEntry], int]:
+    """Index the messages in data[start:end].
+
+    Returns the entries and the offset up to which the bytes were
+    decoded (an incomplete UTF-8 sequence at the end is left for later).
+    The last message may be unfinished; it is indexed as far as it goes
+    and rescanned by the next update.
+
+    The bytes are decoded _WINDOW_BYTES at a time, cut at the start of
+    the last message in the window, which is scanned again with the
+    next one; a window holding less than one whole message is widened.
+    """
+    entries = []
+    window = _WINDOW_BYTES
+    while True:
+        stop = min(end, start + window)
+        final = stop == end
+        decoder = codecs.getincrementaldecoder("utf-8")()
+        text = decoder.decode(data[start:stop], final=False)
+        starts = message_boundaries(text)
+        if not final and len(starts) < 2:
+            window *= 2
+            continue
+        window = _WINDOW_BYTES
+        entries.extend(_index_window(text, starts, start, final))
+        if final:
+            return entries, stop - len(decoder.getstate()[0])
+        start += len(text[:starts[-1]].encode("utf-8"))
+
+
+def _index_window(text: str, starts: list[int], start: int,
+                  final: bool) -> Iterator[IndexEntry]:
+    """Entries for the messages of `text`, decoded from byte `start` on.
+
+    Unless the window is `final`, its last message is left out.
+    """
+    ascii_text = text.isascii()
+    byte_pos, char_pos = start, 0
+
+    def byte_offset(char_offset: int) -> int:
+        nonlocal byte_pos, char_pos
+        if ascii_text:
+            return start + char_offset
+        byte_pos += len(text[char_pos:char_offset].encode("utf-8"))
+        char_pos = char_offset
+        return byte_pos
+
+    count = len(starts) if final else len(starts) - 1
+    for n in range(count):
+        begin = starts[n]
+        piece_end = starts[n + 1] if n + 1 < len(starts) else len(text)
+        try:
+            messages = parse(text[begin:piece_end], lazy=True)
+        except (LexerError, ParseError):
+            if n + 1 < len(starts):
+                raise
+            return  # an unfinished last message: picked up once complete
+        message = messages[0]
+        meta = message.meta.fields if message.meta is not None else {}
+        first = byte_offset(begin)
+        last = byte_offset(begin + message.content_span[1])
+        yield IndexEntry(first, last - first,
+                         *(_literal(meta.get(key)) for key in INDEXED_META))
+
+
+def update_index(archive_path: str, index_path: str | None = None) -> ArchiveIndex:
+    """Bring the sidecar index of `archive_path` up to date and return it.
+
+    Only the part appended since the last update is scanned; a missing,
+    unreadable or mismatching index is rebuilt. The sidecar file is
+    rewritten only when the index changed.
+    """
+    if index_path is None:
+        index_path = archive_path + INDEX_SUFFIX
+    try:
+        with open(index_path) as f:
+            index = ArchiveIndex.from_json(f.read())
+    except (OSError, ValueError, KeyError, TypeError):
+        index = None
+
+    with open(archive_path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if size else b""
+        try:
+            if (index is None or size < index.size
+                    or _digest(data, index.size) != index.digest):
+                index = ArchiveIndex([])
+            elif size == index.size:
+                return index
+            entries = index.entries
+            start = entries[-1].offset if entries else 0
+            new_entries, consumed = _scan(data, start, size)
+            if entries:
+                entries.pop()
+            entries.extend(new_entries)
+            index.size = consumed
+            index.digest = _digest(data, consumed)
+        finally:
+            if size:
+                data.close()
+
+    tmp_path = index_path + ".tmp"
+    with open(tmp_path, "w") as f:
+        f.write(index.to_json())
+    os.replace(tmp_path, index_path)
+    return index
+
+
+class ArchiveReader:
+    """Random access to the messages of an archive through its index.
+
+    The archive is memory-mapped; reading message N decodes and parses
+    only its slice. refresh() picks up messages appended since opening.
+    """
+
+    def __init__(self, archive_path: str, index_path: str | None = None):
+        self.path = archive_path
+        self.index_path = index_path
+        self._file = open(archive_path, "rb")
+        self._map: mmap.mmap | None = None
+        self._ids: dict | None = None
+        self.refresh()
+
+    def refresh(self):
+        """Update the index and the mapping after the archive has grown."""
+        self.index = update_index(self.path, self.index_path)
+        self._ids = None
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        if os.fstat(self._file.fileno()).st_size:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    @property
+    def entries(self) -> list[IndexEntry]:
+        return self.index.entries
+
+    def __len__(self) -> int:
+        return len(self.index.entries)
+
+    def source(self, n: int) -> str:
+        """The text of message `n`."""
+        entry = self.index.entries[n]
+        return self._map[entry.offset:entry.offset + entry.length].decode("utf-8")
+
+    def __getitem__(self, n: int) -> Message:
+        return parse(self.source(n))[0]
+
+    def __iter__(self):
+        for n in range(len(self)):
+            yield self[n]
+
+    def find_id(self, message_id) -> int:
+        """Index of the last message whose meta id is `message_id`."""
+        if self._ids is None:
+            self._ids = {entry.id: n for n, entry in enumerate(self.index.entries)
+                         if entry.id is not None}
+        return self._ids[message_id]
+
+    def by_id(self, message_id) -> Message:
+        return self[self.find_id(message_id)]
+
+    def close(self):
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
+
+    def __enter__(self) -> ArchiveReader:
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def main():
+    import sys
+
+    from axon_parser import format_ast
+
+    args = sys.argv[1:]
+    if not args:
+        print("AXON Archive")
+        print("Usage: python3 axon_archive.py <archive.axon>            (update the index)")
+        print("       python3 axon_archive.py <archive.axon> N          (show message N)")
+        print("       python3 axon_archive.py <archive.axon> --id ID    (show message with id)")
+        sys.exit(0)
+
+    with ArchiveReader(args[0]) as archive:
+        if len(args) == 1:
+            print(f"{len(archive)} messages indexed in {archive.index_path or args[0] + INDEX_SUFFIX}")
+        elif args[1] == "--id" and len(args) > 2:
+            print(format_ast(archive.by_id(args[2])))
+        else:
+            print(format_ast(archive[int(args[1])]))
+
+
+if __name__ == "__main__":
+    main()
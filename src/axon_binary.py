@@ -0,0 +1,479 @@
+"""
+AXON Binary — compact wire encoding of the AST
+
+For agent-to-agent links that never pass through an LLM, text AXON costs
+a full lex and parse on every hop. The binary form carries the parsed
+AST instead:
+
+    payload  = b"AXB" version  symbols  nodes
+    version  = VERSION, plus SPANS when nodes carry their source spans
+    symbols  = varint count, varint length, the UTF-8 names joined by NUL
+    nodes    = tagged nodes in post-order (children before their parent)
+
+Every name (performatives, endpoints, refs, tags, variables, identifiers,
+record and meta keys, call names, path parts) is stored once in the
+symbol table and referenced by a varint index. Numbers fold their unit
+code (from UNITS) into the tag; floats that are short decimals are sent
+as a scaled integer. Decoding is one loop over a value stack.
+
+The round trip is lossless: decode(encode(messages)) == messages, with
+the same int/float types, operator spellings and key order, so
+dumps(decode(encode(parse(text)))) == dumps(parse(text)). With
+spans=True each node is followed by its span (varint offset + 1,
+varint length; a message by its routing's span, then its own), and
+decode() restores them.
+
+Usage:
+    payload = encode(parse(text))
+    messages = decode(payload)
+"""
+
+from __future__ import annotations
+
+import struct
+from typing import Iterable
+
+from axon_parser import (
+    NAMES,
+    UNITS,
+    Message,
+    Routing,
+    MetaBlock,
+    StringLiteral,
+    NumberLiteral,
+    BooleanLiteral,
+    NullLiteral,
+    Reference,
+    Tag,
+    Variable,
+    Identifier,
+    ListExpr,
+    RecordExpr,
+    RangeExpr,
+    CallExpr,
+    NamedArg,
+    BinaryExpr,
+    PathExpr,
+)
+from axon_serializer import _CLASSES, _node_class
+
+MAGIC = b"AXB"
+VERSION = 1
+SPANS = 0x80   # flag on the version byte
+
+
+class BinaryFormatError(ValueError):
+    """A payload that is not a well-formed AXON binary encoding."""
+
+
+# ── Tags ─────────────────────────────────────────────────────────────
+#
+# Each tag is followed by the listed fields; "pops" is the number of
+# decoded children it takes from the value stack.
+
+_STRING = 0         # varint length, UTF-8 bytes
+_TRUE = 1
+_FALSE = 2
+_NULL = 3
+_REF = 4            # symbol
+_TAG = 5            # symbol
+_TAG_BODY = 6       # symbol; pops body
+_VAR = 7            # symbol
+_IDENT = 8          # symbol
+_LIST = 9           # varint count; pops count
+_RECORD = 10        # varint count, count key symbols; pops count
+_RANGE = 11         # pops start, end
+_CALL = 12          # symbol, varint count; pops count
+_NAMED_ARG = 13     # symbol; pops value
+_PATH = 14          # varint count, count symbols
+_META = 15          # as _RECORD
+_MESSAGE = 16       # symbol, endpoint, endpoint; pops content
+_MESSAGE_META = 17  # as _MESSAGE; pops meta, content
+
+# Numbers: tag = base + unit code (0: no unit, else 1 + index in _UNITS)
+_UNITS = (None,) + tuple(sorted(UNITS))
+_INT = 32           # varint value
+_DECIMAL = 48       # varint scale, varint digits: value = digits / 10**scale
+_FLOAT = 64         # 8-byte little-endian IEEE double
+
+# Binary operators: tag = _BINARY + code; pops left, right
+_OPS = ("<-", "->", "&", "|", "<", ">", "<=", ">=", "!=", "=", "==", "+", "-", "*", "/")
+_BINARY = 96
+
+_NAME_NODES = {_REF: Reference, _TAG: Tag, _VAR: Variable, _IDENT: Identifier}
+_OP_TAGS = {op: _BINARY + n for n, op in enumerate(_OPS)}
+_UNIT_CODES = {unit: n for n, unit in enumerate(_UNITS)}
+_POW10 = tuple(10.0 ** n for n in range(23))
+_MAX_DIGITS = 2 ** 53   # integers below this are exact as doubles
+
+_double = struct.Struct("<d")
+
+
+# ── Encoding ─────────────────────────────────────────────────────────
+
+def _put_varint(out: bytearray, n: int):
+    if n < 0:
+        raise ValueError(f"cannot encode negative integer {n}")
+    while n >= 0x80:
+        out.append((n & 0x7F) | 0x80)
+        n >>= 7
+    out.append(n)
+
+
+def _put_number(out: bytearray, node: NumberLiteral):
+    value, unit = node.value, node.unit
+    code = _UNIT_CODES.get(unit)
+    if code is None:
+        raise ValueError(f"unknown unit {unit!r}")
+    if type(value) is int:
+        out.append(_INT + code)
+        if 0 <= value < 0x80:
+            out.append(value)
+        else:
+            _put_varint(out, value)
+        return
+    text = repr(value)
+    whole, dot, frac = text.partition(".")
+    if dot and whole.isdigit() and frac.isdigit() and len(frac) < len(_POW10):
+        digits = int(whole + frac)
+        if digits < _MAX_DIGITS:
+            out.append(_DECIMAL + code)
+            out.append(len(frac))
+            _put_varint(out, digits)
+            return
+    out.append(_FLOAT + code)
+    out += _double.pack(value)
+
+
+def encode(messages: Message | Iterable[Message], spans: bool = False) -> bytes:
+    """Encode one message or a sequence of messages, with their node
+    spans if `spans`."""
+    if isinstance(messages, Message):
+        messages = (messages,)
+    body = bytearray()
+    emit = body.append
+    symbols: dict[str, int] = {}
+
+    def span(node):
+        _put_varint(body, node.offset + 1)
+        count(node.length)
+
+    def sym(name: str):
+        n = symbols.get(name)
+        if n is None:
+            n = symbols[name] = len(symbols)
+        if n < 0x80:
+            emit(n)
+        else:
+            _put_varint(body, n)
+
+    def count(n: int):
+        if n < 0x80:
+            emit(n)
+        else:
+            _put_varint(body, n)
+
+    def endpoint(value: str | list[str]):
+        # 2*symbol for one endpoint, 2*count+1 then symbols for a list
+        if isinstance(value, str):
+            n = symbols.get(value)
+            if n is None:
+                n = symbols[value] = len(symbols)
+            _put_varint(body, 2 * n)
+        else:
+            _put_varint(body, 2 * len(value) + 1)
+            for name in value:
+                sym(name)
+
+    todo: list = list(reversed(list(messages)))
+    while todo:
+        node = todo.pop()
+        cls = type(node)
+        if cls is tuple:
+            # Deferred parent: (tag, fields..., node) queued before its children
+            tag = node[0]
+            emit(tag)
+            if tag == _RECORD or tag == _META:
+                keys = node[1]
+                count(len(keys))
+                for key in keys:
+                    sym(key)
+            elif tag == _LIST:
+                count(node[1])
+            elif tag == _CALL:
+                sym(node[1])
+                count(node[2])
+            elif tag == _MESSAGE or tag == _MESSAGE_META:
+                sym(node[1])
+                endpoint(node[2])
+                endpoint(node[3])
+                if spans:
+                    span(node[4])
+            elif tag == _TAG_BODY or tag == _NAMED_ARG:
+                sym(node[1])
+            if spans:
+                span(node[-1])
+            continue
+        cls = _CLASSES.get(cls) or _node_class(node)
+        if cls is StringLiteral:
+            data = node.value.encode("utf-8")
+            emit(_STRING)
+            count(len(data))
+            body += data
+        elif cls is NumberLiteral:
+            _put_number(body, node)
+        elif cls is Reference:
+            emit(_REF)
+            sym(node.name)
+        elif cls is Tag:
+            if node.body is None:
+                emit(_TAG)
+                sym(node.name)
+            else:
+                todo.append((_TAG_BODY, node.name, node))
+                todo.append(node.body)
+                continue
+        elif cls is RecordExpr:
+            todo.append((_RECORD, tuple(node.fields), node))
+            todo.extend(reversed(node.fields.values()))
+            continue
+        elif cls is ListExpr:
+            todo.append((_LIST, len(node.elements), node))
+            todo.extend(reversed(node.elements))
+            continue
+        elif cls is BooleanLiteral:
+            emit(_TRUE if node.value else _FALSE)
+        elif cls is Identifier:
+            emit(_IDENT)
+            sym(node.name)
+        elif cls is Variable:
+            emit(_VAR)
+            sym(node.name)
+        elif cls is NullLiteral:
+            emit(_NULL)
+        elif cls is BinaryExpr:
+            todo.append((_OP_TAGS[node.op], node))
+            todo.append(node.right)
+            todo.append(node.left)
+            continue
+        elif cls is CallExpr:
+            todo.append((_CALL, node.func, len(node.args), node))
+            todo.extend(reversed(node.args))
+            continue
+        elif cls is NamedArg:
+            todo.append((_NAMED_ARG, node.name, node))
+            todo.append(node.value)
+            continue
+        elif cls is RangeExpr:
+            todo.append((_RANGE, node))
+            todo.append(node.end)
+            todo.append(node.start)
+            continue
+        elif cls is PathExpr:
+            emit(_PATH)
+            count(len(node.parts))
+            for part in node.parts:
+                sym(part)
+        elif cls is Message:
+            routing = node.routing
+            header = (node.performative, routing.sender, routing.receiver, routing, node)
+            if node.meta is None:
+                todo.append((_MESSAGE,) + header)
+                todo.append(node.content)
+            else:
+                todo.append((_MESSAGE_META,) + header)
+                todo.append(node.content)
+                fields = node.meta.fields
+                todo.append((_META, tuple(fields), node.meta))
+                todo.extend(reversed(fields.values()))
+            continue
+        if spans:
+            span(node)
+
+    table = "\0".join(symbols).encode("utf-8")
+    if table.count(0) > max(len(symbols) - 1, 0):
+        raise ValueError("names cannot contain NUL")
+    out = bytearray(MAGIC)
+    out.append(VERSION | SPANS if spans else VERSION)
+    _put_varint(out, len(symbols))
+    _put_varint(out, len(table))
+    out += table
+    out += body
+    return bytes(out)
+
+
+# ── Decoding ─────────────────────────────────────────────────────────
+
+def _varint(data: bytes, pos: int) -> tuple[int, int]:
+    """Decode the varint at `pos`; return (value, position after it)."""
+    n = shift = 0
+    while True:
+        b = data[pos]
+        pos += 1
+        n |= (b & 0x7F) << shift
+        if b < 0x80:
+            return n, pos
+        shift += 7
+
+
+def _endpoint(data: bytes, pos: int, symbols: list[str]) -> tuple[str | list[str], int]:
+    n = data[pos]
+    if n < 0x80:
+        pos += 1
+    else:
+        n, pos = _varint(data, pos)
+    if not n & 1:
+        return symbols[n >> 1], pos
+    agents = []
+    for _ in range(n >> 1):
+        k, pos = _varint(data, pos)
+        agents.append(symbols[k])
+    return agents, pos
+
+
+def decode(payload: bytes) -> list[Message]:
+    """Rebuild the messages written by encode(), spans included if sent."""
+    data = bytes(payload)
+    if data[:3] != MAGIC:
+        raise BinaryFormatError("not an AXON binary payload")
+    if len(data) < 4 or data[3] & ~SPANS != VERSION:
+        raise BinaryFormatError(f"unsupported version {data[3] if len(data) > 3 else None}")
+    try:
+        return _decode(data, bool(data[3] & SPANS))
+    except (IndexError, KeyError, UnicodeDecodeError, struct.error) as e:
+        raise BinaryFormatError(f"malformed payload: {e}") from None
+
+
+def _decode(data: bytes, spans: bool) -> list[Message]:
+    count, pos = _varint(data, 4)
+    n, pos = _varint(data, pos)
+    symbols = list(map(NAMES, data[pos:pos + n].decode("utf-8").split("\0"))) if count else []
+    if len(symbols) != count:
+        raise BinaryFormatError("symbol table does not match its count")
+    pos += n
+
+    stack: list = []
+    push, pop = stack.append, stack.pop
+    end = len(data)
+
+    def span(node, pos: int) -> int:
+        offset, pos = _varint(data, pos)
+        node.offset = offset - 1
+        node.length, pos = _varint(data, pos)
+        return pos
+
+    while pos < end:
+        tag = data[pos]
+        pos += 1
+        if tag >= _INT:
+            if tag >= _BINARY:
+                right = pop()
+                stack[-1] = BinaryExpr(_OPS[tag - _BINARY], stack[-1], right)
+            elif tag >= _FLOAT:
+                push(NumberLiteral(_double.unpack_from(data, pos)[0], _UNITS[tag - _FLOAT]))
+                pos += 8
+            else:
+                n = data[pos]
+                pos += 1
+                if n >= 0x80:
+                    n, pos = _varint(data, pos - 1)
+                if tag < _DECIMAL:
+                    push(NumberLiteral(n, _UNITS[tag - _INT]))
+                else:
+                    digits = data[pos]
+                    pos += 1
+                    if digits >= 0x80:
+                        digits, pos = _varint(data, pos - 1)
+                    push(NumberLiteral(digits / _POW10[n], _UNITS[tag - _DECIMAL]))
+            if spans:
+                pos = span(stack[-1], pos)
+            continue
+        if _TRUE <= tag <= _NULL or tag == _RANGE:
+            if tag == _TRUE:
+                push(BooleanLiteral(True))
+            elif tag == _FALSE:
+                push(BooleanLiteral(False))
+            elif tag == _NULL:
+                push(NullLiteral())
+            else:
+                end_node = pop()
+                stack[-1] = RangeExpr(stack[-1], end_node)
+            if spans:
+                pos = span(stack[-1], pos)
+            continue
+
+        # Every other tag has a leading varint: a symbol, count or length
+        n = data[pos]
+        pos += 1
+        if n >= 0x80:
+            n, pos = _varint(data, pos - 1)
+        if tag == _STRING:
+            push(StringLiteral(data[pos:pos + n].decode("utf-8")))
+            pos += n
+        elif tag <= _IDENT:
+            if tag == _TAG_BODY:
+                stack[-1] = Tag(symbols[n], stack[-1])
+            else:
+                push(_NAME_NODES[tag](symbols[n]))
+        elif tag == _RECORD or tag == _META:
+            if n:
+                keys = []
+                for _ in range(n):
+                    k = data[pos]
+                    pos += 1
+                    if k >= 0x80:
+                        k, pos = _varint(data, pos - 1)
+                    keys.append(symbols[k])
+                if len(keys) != len(set(keys)) or len(stack) < n:
+                    raise BinaryFormatError(f"bad fields at offset {pos}")
+                fields = dict(zip(keys, stack[-n:]))
+                del stack[-n:]
+            else:
+                fields = {}
+            push(RecordExpr(fields) if tag == _RECORD else MetaBlock(fields))
+        elif tag == _LIST:
+            if n:
+                if len(stack) < n:
+                    raise BinaryFormatError(f"bad list at offset {pos}")
+                elements = stack[-n:]
+                del stack[-n:]
+            else:
+                elements = []
+            push(ListExpr(elements))
+        elif tag == _MESSAGE or tag == _MESSAGE_META:
+            sender, pos = _endpoint(data, pos, symbols)
+            receiver, pos = _endpoint(data, pos, symbols)
+            routing = Routing(sender, receiver)
+            if spans:
+                pos = span(routing, pos)
+            content = pop()
+            meta = pop() if tag == _MESSAGE_META else None
+            push(Message(symbols[n], routing, content, meta))
+        elif tag == _CALL:
+            k = data[pos]
+            pos += 1
+            if k >= 0x80:
+                k, pos = _varint(data, pos - 1)
+            if k:
+                if len(stack) < k:
+                    raise BinaryFormatError(f"bad call at offset {pos}")
+                args = stack[-k:]
+                del stack[-k:]
+            else:
+                args = []
+            push(CallExpr(symbols[n], args))
+        elif tag == _NAMED_ARG:
+            stack[-1] = NamedArg(symbols[n], stack[-1])
+        elif tag == _PATH:
+            parts = []
+            for _ in range(n):
+                k, pos = _varint(data, pos)
+                parts.append(symbols[k])
+            push(PathExpr(parts))
+        else:
+            raise BinaryFormatError(f"unknown tag {tag}")
+        if spans:
+            pos = span(stack[-1], pos)
+    if pos != end or not all(type(node) is Message for node in stack):
+        raise BinaryFormatError("payload does not decode to messages")
+    return stack
@@ -0,0 +1,419 @@
+"""
+AXON Cache — memoised parsing and validation
+
+ParseCache sits in front of parse() and validate(): identical source
+text is lexed, parsed and validated once, and later calls are answered
+from a bounded LRU table keyed by a digest of the text (plus the tier
+for validation). Cached ASTs are frozen so that no caller can alter
+what the next caller receives.
+
+ShapeCache serves traffic whose structure repeats with different
+literals: it is keyed by the token sequence with string, number, unit
+and boolean values abstracted out, and on a hit fills the cached AST
+template with the new literals without running the parser.
+
+Usage:
+    cache = ParseCache(maxsize=4096)
+    messages = cache.parse('ACK(@w1>@planner): _')
+    cache.info()   # CacheInfo(hits=..., misses=..., evictions=..., ...)
+    editable = thaw(messages)
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import NamedTuple
+
+import axon_parser
+from axon_parser import (
+    ASTNode, BooleanLiteral, NumberLiteral, Parser, RegexLexer, StringLiteral,
+    TokenType, parse,
+)
+from axon_validator import ValidationResult, validate
+
+
+# ── Frozen ASTs ──────────────────────────────────────────────────────
+
+class FrozenList(tuple):
+    """Immutable list of AST values; compares equal to the same list."""
+
+    __slots__ = ()
+
+    def __eq__(self, other):
+        if isinstance(other, list):
+            other = tuple(other)
+        return tuple.__eq__(self, other)
+
+    def __ne__(self, other):
+        return not self == other
+
+    __hash__ = tuple.__hash__
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+
+class FrozenDict(dict):
+    """Immutable mapping of AST fields; compares equal to the same dict."""
+
+    __slots__ = ()
+
+    def _immutable(self, *args, **kwargs):
+        raise TypeError("frozen AST fields cannot be modified")
+
+    __setitem__ = __delitem__ = __ior__ = _immutable
+    clear = pop = popitem = setdefault = update = _immutable
+
+    def __hash__(self) -> int:
+        return hash(frozenset(self.items()))
+
+    def __reduce__(self):
+        # Not the dict default, which would fill the copy item by item
+        return (FrozenDict, (dict(self),))
+
+
+def _make_frozen(cls: type) -> type:
+    # The compared fields; the span (offset, length) is copied as is
+    names = tuple(f.name for f in dataclasses.fields(cls) if f.compare)
+
+    def __init__(self, *args, **kwargs):
+        template = cls(*args, **kwargs)
+        for name in names:
+            object.__setattr__(self, name, freeze(getattr(template, name)))
+        object.__setattr__(self, "offset", template.offset)
+        object.__setattr__(self, "length", template.length)
+
+    def __setattr__(self, name, value):
+        raise dataclasses.FrozenInstanceError(f"cannot assign to field {name!r}")
+
+    def __delattr__(self, name):
+        raise dataclasses.FrozenInstanceError(f"cannot delete field {name!r}")
+
+    def __eq__(self, other):
+        if not isinstance(other, cls):
+            return NotImplemented
+        return all(getattr(self, n) == getattr(other, n) for n in names)
+
+    def __hash__(self):
+        return hash((cls.__name__,) + tuple(getattr(self, n) for n in names))
+
+    def __reduce__(self):
+        return (_new_frozen, (type(self), tuple(getattr(self, n) for n in names),
+                              self.offset, self.length))
+
+    name = f"Frozen{cls.__name__}"
+    frozen = type(name, (cls,), {
+        "__slots__": (),
+        "__module__": __name__,
+        "__qualname__": name,
+        "__init__": __init__,
+        "__setattr__": __setattr__,
+        "__delattr__": __delattr__,
+        "__eq__": __eq__,
+        "__hash__": __hash__,
+        "__reduce__": __reduce__,
+        "_fields": names,
+    })
+    # Found by name when a frozen node is unpickled
+    globals()[name] = frozen
+    return frozen
+
+
+_FROZEN: dict[type, type] = {
+    cls: _make_frozen(cls)
+    for cls in vars(axon_parser).values()
+    if isinstance(cls, type) and issubclass(cls, ASTNode) and dataclasses.is_dataclass(cls)
+    and cls.__module__ == axon_parser.__name__ and "__dataclass_fields__" in cls.__dict__
+}
+_FROZEN_TYPES = frozenset(_FROZEN.values())
+_THAWED = {frozen: cls for cls, frozen in _FROZEN.items()}
+
+
+def frozen_class(cls: type) -> type:
+    """The frozen twin of node class `cls` (or of its nearest base)."""
+    for base in cls.__mro__:
+        if base in _FROZEN:
+            return _FROZEN[base]
+    raise TypeError(f"{cls.__name__} is not an AST node class")
+
+
+def _new_frozen(frozen: type, values, offset: int = -1, length: int = 0) -> ASTNode:
+    node = frozen.__new__(frozen)
+    for name, value in zip(frozen._fields, values):
+        object.__setattr__(node, name, value)
+    object.__setattr__(node, "offset", offset)
+    object.__setattr__(node, "length", length)
+    return node
+
+
+def freeze(value):
+    """Return an immutable copy of an AST node, list or dict of nodes.
+
+    Frozen nodes are instances of subclasses of the node classes, so
+    isinstance checks and equality with unfrozen nodes still hold;
+    they are also hashable.
+    """
+    cls = type(value)
+    if cls in _FROZEN_TYPES or cls is FrozenList or cls is FrozenDict:
+        return value
+    if isinstance(value, ASTNode):
+        frozen = frozen_class(cls)
+        return _new_frozen(frozen, [freeze(getattr(value, n)) for n in frozen._fields],
+                           value.offset, value.length)
+    if isinstance(value, list):
+        return FrozenList(freeze(v) for v in value)
+    if isinstance(value, dict):
+        return FrozenDict((k, freeze(v)) for k, v in value.items())
+    return value
+
+
+def thaw(value):
+    """Return a mutable copy of a frozen node, FrozenList or FrozenDict.
+
+    The copy is made of the plain node classes, lists and dicts, as
+    parse() returns them, spans included; anything not frozen is
+    returned as it is.
+    """
+    cls = _THAWED.get(type(value))
+    if cls is not None:
+        fields = {n: thaw(getattr(value, n)) for n in value._fields}
+        return cls(**fields, offset=value.offset, length=value.length)
+    if type(value) is FrozenList:
+        return [thaw(v) for v in value]
+    if type(value) is FrozenDict:
+        return {k: thaw(v) for k, v in value.items()}
+    return value
+
+
+# ── LRU cache ────────────────────────────────────────────────────────
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    maxsize: int
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+def _digest(source: str) -> bytes:
+    return hashlib.blake2b(source.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+
+
+class _LRU:
+    """OrderedDict-backed LRU table with hit/miss/eviction counters."""
+
+    def __init__(self, maxsize: int):
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be positive, got {maxsize}")
+        self.maxsize = maxsize
+        self.hits = self.misses = self.evictions = 0
+        self._table: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            value = self._table.get(key)
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._table.move_to_end(key)
+            return value
+
+    def put(self, key, value):
+        with self._lock:
+            self._table[key] = value
+            self._table.move_to_end(key)
+            if len(self._table) > self.maxsize:
+                self._table.popitem(last=False)
+                self.evictions += 1
+
+    def info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.evictions,
+                             len(self._table), self.maxsize)
+
+    def clear(self):
+        with self._lock:
+            self._table.clear()
+            self.hits = self.misses = self.evictions = 0
+
+
+class ParseCache:
+    """Bounded LRU cache of parse() and validate() results.
+
+    Keys are 128-bit BLAKE2b digests of the source text, so large
+    sources are not kept alive by the table. parse() returns a
+    FrozenList of frozen messages; validate() returns a fresh
+    ValidationResult each time. Sources that fail to parse are not
+    cached; the error is raised on every call.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        self._lru = _LRU(maxsize)
+
+    def parse(self, source: str) -> FrozenList:
+        key = _digest(source)
+        messages = self._lru.get(key)
+        if messages is None:
+            messages = freeze(parse(source))
+            self._lru.put(key, messages)
+        return messages
+
+    def validate(self, source: str, tier: int = 1) -> ValidationResult:
+        key = (_digest(source), tier)
+        result = self._lru.get(key)
+        if result is None:
+            result = validate(source, tier)
+            self._lru.put(key, result)
+        return dataclasses.replace(
+            result, diagnostics=[dataclasses.replace(d) for d in result.diagnostics])
+
+    def info(self) -> CacheInfo:
+        return self._lru.info()
+
+    def clear(self):
+        self._lru.clear()
+
+
+# ── Shape cache ──────────────────────────────────────────────────────
+
+# Key entries standing in for literal tokens. Every other token is keyed
+# by its value, which determines its type; NEWLINE tokens are dropped,
+# as the parser drops them.
+_STRING_SLOT, _NUMBER_SLOT, _UNIT_SLOT, _BOOLEAN_SLOT = "\0S", "\0N", "\0U", "\0B"
+
+# Template plan entries
+_CONST, _SLOT, _NODE, _LIST, _DICT = range(5)
+
+
+class _SlotParser(Parser):
+    """Parser that records the literal nodes it builds, in token order."""
+
+    def __init__(self, tokens):
+        super().__init__(tokens)
+        self.slots: list[ASTNode] = []
+
+    def _parse_atom(self) -> ASTNode:
+        ttype = self._peek().type
+        node = super()._parse_atom()
+        if ttype is TokenType.STRING or ttype is TokenType.NUMBER or ttype is TokenType.BOOLEAN:
+            self.slots.append(node)
+        return node
+
+
+def _compile(value, slot_index: dict[int, int], seen: list[int]) -> tuple:
+    """Turn a parsed value into a plan; literal-free subtrees become frozen constants."""
+    if isinstance(value, ASTNode):
+        slot = slot_index.get(id(value))
+        if slot is not None:
+            seen.append(slot)
+            return (_SLOT, slot)
+        frozen = frozen_class(type(value))
+        entries = [_compile(getattr(value, n), slot_index, seen) for n in frozen._fields]
+        if all(e[0] == _CONST for e in entries):
+            return (_CONST, _new_frozen(frozen, [e[1] for e in entries]))
+        return (_NODE, frozen, entries)
+    if isinstance(value, list):
+        entries = [_compile(v, slot_index, seen) for v in value]
+        if all(e[0] == _CONST for e in entries):
+            return (_CONST, FrozenList(e[1] for e in entries))
+        return (_LIST, entries)
+    if isinstance(value, dict):
+        entries = [_compile(v, slot_index, seen) for v in value.values()]
+        if all(e[0] == _CONST for e in entries):
+            return (_CONST, FrozenDict(zip(value, (e[1] for e in entries))))
+        return (_DICT, tuple(value), entries)
+    return (_CONST, value)
+
+
+def _instantiate(entry: tuple, literals: list[ASTNode]):
+    tag = entry[0]
+    if tag == _CONST:
+        return entry[1]
+    if tag == _SLOT:
+        return literals[entry[1]]
+    if tag == _NODE:
+        return _new_frozen(entry[1], [_instantiate(e, literals) for e in entry[2]])
+    if tag == _LIST:
+        return FrozenList(_instantiate(e, literals) for e in entry[1])
+    return FrozenDict(zip(entry[1], [_instantiate(e, literals) for e in entry[2]]))
+
+
+_FROZEN_STRING = _FROZEN[StringLiteral]
+_FROZEN_NUMBER = _FROZEN[NumberLiteral]
+_FROZEN_BOOLEAN = _FROZEN[BooleanLiteral]
+
+
+def _shape(source: str) -> tuple[tuple, list[ASTNode], list]:
+    """Lex `source` into (shape key, frozen literal nodes, tokens)."""
+    tokens = RegexLexer(source).tokenize()
+    key = []
+    literals = []
+    string, number, unit = TokenType.STRING, TokenType.NUMBER, TokenType.UNIT
+    boolean, newline = TokenType.BOOLEAN, TokenType.NEWLINE
+    for tok in tokens:
+        ttype = tok.type
+        if ttype is string:
+            key.append(_STRING_SLOT)
+            literals.append(_new_frozen(_FROZEN_STRING, (tok.value,)))
+        elif ttype is number:
+            key.append(_NUMBER_SLOT)
+            text = tok.value
+            # As Parser._parse_atom; a UNIT token always follows its NUMBER
+            value = float(text) if "." in text else int(text)
+            literals.append(_new_frozen(_FROZEN_NUMBER, (value, None)))
+        elif ttype is unit:
+            key.append(_UNIT_SLOT)
+            literals[-1] = _new_frozen(_FROZEN_NUMBER, (literals[-1].value, tok.value))
+        elif ttype is boolean:
+            key.append(_BOOLEAN_SLOT)
+            literals.append(_new_frozen(_FROZEN_BOOLEAN, (tok.value == "T",)))
+        elif ttype is not newline:
+            key.append(tok.value)
+    return tuple(key), literals, tokens
+
+
+class ShapeCache:
+    """Bounded LRU cache of AST templates keyed by message shape.
+
+    Sources whose token sequences agree except for literal values share
+    a template: the first is parsed in full, later ones are only lexed
+    and the template is instantiated with their literals. The parser's
+    decisions depend on token types and non-literal values alone, so the
+    result always equals parse(); subtrees without literals are shared
+    between results, which is safe because they are frozen. Sources of
+    one shape differ in length, so template nodes carry no span (-1).
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        self._lru = _LRU(maxsize)
+
+    def parse(self, source: str) -> FrozenList:
+        key, literals, tokens = _shape(source)
+        plan = self._lru.get(key)
+        if plan is None:
+            parser = _SlotParser(tokens)
+            messages = parser.parse()
+            slot_index = {id(node): i for i, node in enumerate(parser.slots)}
+            seen: list[int] = []
+            plan = _compile(messages, slot_index, seen)
+            if sorted(seen) != list(range(len(literals))):
+                # Some literal is not used exactly once: no template
+                return freeze(messages)
+            self._lru.put(key, plan)
+        return _instantiate(plan, literals)
+
+    def info(self) -> CacheInfo:
+        return self._lru.info()
+
+    def clear(self):
+        self._lru.clear()
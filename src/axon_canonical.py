@@ -0,0 +1,331 @@
+"""
+AXON Canonicalizer — the cheapest spelling of a message for a tokenizer
+
+AXON exists to save LLM tokens, and one message has many spellings that
+parse to the same AST: separator spacing, compact operators, optional
+grouping and record key order. The canonicalizer picks, per message,
+the spelling with the fewest tokens under a target encoding (cl100k_base
+or o200k_base, counted by experiments/lib/token_counter) and reports the
+tokens saved against the text it was given, with its comments removed,
+so dropping them is not counted as a saving. `=` and `==` are written
+as they were: the AST keeps the spelling.
+
+Evaluation is memoized at three levels: token counts by text, the chosen
+Style by message shape (the AST without its literal values and routing)
+and the key order by record layout. Once a shape has been seen, a
+message costs one serialization and at most two counts.
+
+Usage:
+    canon = Canonicalizer("o200k_base")
+    for result in canon.canonicalize(source):
+        send(result.text)
+        saved += result.saved
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import sys
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from functools import lru_cache, partial
+from typing import Callable
+
+from axon_parser import (
+    Message,
+    StringLiteral,
+    NumberLiteral,
+    BooleanLiteral,
+    NullLiteral,
+    Reference,
+    Tag,
+    Variable,
+    Identifier,
+    ListExpr,
+    RecordExpr,
+    RangeExpr,
+    CallExpr,
+    NamedArg,
+    BinaryExpr,
+    PathExpr,
+    RegexLexer,
+    _scan_comment,
+    message_boundaries,
+    parse,
+)
+from axon_serializer import CANONICAL, Style, dumps
+
+ENCODINGS = ("cl100k_base", "o200k_base")
+
+_TOKEN_COUNTER_DIR = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..", "experiments", "lib")
+
+# Two word characters that a removed comment separated, and the spaces
+# it leaves on either side
+_WORDS = re.compile(r"\w\w")
+_BLANKS = re.compile(r"[ \t]{2,}")
+
+# Style fields searched, with their alternatives (defaults first)
+_KNOBS = (
+    ("comma", (", ", ",")),
+    ("colon", (":", ": ")),
+    ("spaced", (True, False)),
+    ("header", (": ", ":")),
+    ("meta_end", (" ", "")),
+    ("grouped", (False, True)),
+)
+
+
+def token_counter(encoding: str = "cl100k_base") -> Callable[[str], int]:
+    """count_tokens() of experiments/lib/token_counter bound to `encoding`.
+
+    tiktoken is imported by the first count, not here.
+    """
+    if _TOKEN_COUNTER_DIR not in sys.path:
+        sys.path.insert(0, _TOKEN_COUNTER_DIR)
+    from token_counter import count_tokens
+    return partial(count_tokens, encoding=encoding)
+
+
+@dataclass(slots=True)
+class Canonical:
+    """One message in its cheapest spelling."""
+    message: Message
+    text: str
+    tokens: int
+    original_tokens: int
+
+    @property
+    def saved(self) -> int:
+        return self.original_tokens - self.tokens
+
+
+def _strip_comments(text: str) -> str:
+    """`text` without its comments; the spaces around one are squeezed
+    to one, and a space stands for one that separated two words."""
+    if "(*" not in text:
+        return text
+    parts = []
+    pos = 0
+    for tok in RegexLexer(text).iter_tokens():
+        gap = text[pos:tok.offset]
+        if "(*" in gap:
+            # Between tokens there is only whitespace and comments
+            kept = []
+            start = 0
+            at = gap.find("(*")
+            while at != -1:
+                kept.append(gap[start:at])
+                start = _scan_comment(gap, at + 2, 1)[0]
+                at = gap.find("(*", start)
+            kept.append(gap[start:])
+            gap = _BLANKS.sub(" ", "".join(kept))
+            if not gap and _WORDS.fullmatch(text[pos - 1:pos] + text[tok.offset:tok.offset + 1]):
+                gap = " "
+        parts.append(gap)
+        parts.append(text[tok.offset:tok.end])
+        pos = tok.end
+    return "".join(parts)
+
+
+def _shape(message: Message) -> tuple:
+    """The message with literal values and routing left out.
+
+    Messages of one shape differ only inside literals, so the spelling
+    chosen for one suits the others.
+    """
+    parts: list = [message.performative]
+    append = parts.append
+    stack: list = [message.content]
+    if message.meta is not None:
+        append(tuple(message.meta.fields))
+        stack.extend(message.meta.fields.values())
+    while stack:
+        node = stack.pop()
+        if isinstance(node, StringLiteral):
+            append('"')
+        elif isinstance(node, NumberLiteral):
+            append((type(node.value) is float, node.unit))
+        elif isinstance(node, (Reference, Tag, Variable, Identifier)):
+            append(node.name)
+            if isinstance(node, Tag) and node.body is not None:
+                stack.append(node.body)
+        elif isinstance(node, RecordExpr):
+            append(tuple(node.fields))
+            stack.extend(node.fields.values())
+        elif isinstance(node, ListExpr):
+            append(len(node.elements))
+            stack.extend(node.elements)
+        elif isinstance(node, BinaryExpr):
+            append(node.op)
+            stack.append(node.right)
+            stack.append(node.left)
+        elif isinstance(node, CallExpr):
+            append((node.func, len(node.args)))
+            stack.extend(node.args)
+        elif isinstance(node, NamedArg):
+            append((node.name,))
+            stack.append(node.value)
+        elif isinstance(node, RangeExpr):
+            append("..")
+            stack.append(node.end)
+            stack.append(node.start)
+        elif isinstance(node, PathExpr):
+            append(tuple(node.parts))
+        elif isinstance(node, Message):
+            append((node.performative,))
+            stack.append(node.content)
+        elif isinstance(node, (BooleanLiteral, NullLiteral)):
+            append(type(node).__name__)
+    return tuple(parts)
+
+
+def _field_blocks(message: Message) -> list[dict]:
+    """Fields of every record and meta block, innermost first."""
+    blocks = []
+    stack: list = [message.content]
+    if message.meta is not None:
+        blocks.append(message.meta.fields)
+    while stack:
+        node = stack.pop()
+        if isinstance(node, RecordExpr):
+            blocks.append(node.fields)
+            stack.extend(node.fields.values())
+        elif isinstance(node, ListExpr):
+            stack.extend(node.elements)
+        elif isinstance(node, BinaryExpr):
+            stack.append(node.left)
+            stack.append(node.right)
+        elif isinstance(node, CallExpr):
+            stack.extend(node.args)
+        elif isinstance(node, NamedArg):
+            stack.append(node.value)
+        elif isinstance(node, RangeExpr):
+            stack.append(node.start)
+            stack.append(node.end)
+        elif isinstance(node, Tag) and node.body is not None:
+            stack.append(node.body)
+        elif isinstance(node, Message):
+            stack.append(node.content)
+    blocks.reverse()
+    return blocks
+
+
+class Canonicalizer:
+    """Rewrites messages into their cheapest equivalent spelling.
+
+    `counter` maps text to a token count; by default it is
+    token_counter(encoding). At most `maxsize` counts, shapes and key
+    layouts are remembered each.
+    """
+
+    def __init__(self, encoding: str = "cl100k_base",
+                 counter: Callable[[str], int] | None = None, maxsize: int = 4096):
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be positive, got {maxsize}")
+        self.encoding = encoding
+        self.count = lru_cache(maxsize)(counter or token_counter(encoding))
+        self.maxsize = maxsize
+        self._styles: OrderedDict[tuple, Style] = OrderedDict()
+        self._orders: OrderedDict[tuple, tuple] = OrderedDict()
+
+    def message(self, message: Message, original: str | None = None) -> Canonical:
+        """The cheapest spelling of `message`.
+
+        Savings are counted against `original`, the text the message was
+        received as (default: its canonical dumps()); should that text be
+        cheaper after all, it is kept.
+        """
+        shape = _shape(message)
+        style = self._styles.get(shape)
+        if style is None:
+            style = self._choose(message)
+            self._styles[shape] = style
+            if len(self._styles) > self.maxsize:
+                self._styles.popitem(last=False)
+        else:
+            self._styles.move_to_end(shape)
+        text = dumps(message, style)
+        tokens = self.count(text)
+        if original is None:
+            original = dumps(message)
+        original_tokens = self.count(original)
+        if original_tokens < tokens:
+            text, tokens = original, original_tokens
+        return Canonical(message, text, tokens, original_tokens)
+
+    def canonicalize(self, source: str) -> list[Canonical]:
+        """Canonicalize every message of `source`, saving against its text
+        less comments."""
+        messages = parse(source)
+        starts = message_boundaries(source)
+        if len(starts) != len(messages):
+            return [self.message(message) for message in messages]
+        ends = starts[1:] + [len(source)]
+        return [self.message(message, _strip_comments(source[start:end]).strip())
+                for message, start, end in zip(messages, starts, ends)]
+
+    def _choose(self, message: Message) -> Style:
+        """Search key orders, then each Style field in turn."""
+        orders = self._orders
+        style = replace(CANONICAL, key_order=orders)
+        cost = self.count(dumps(message, style))
+
+        for fields in _field_blocks(message):
+            keys = tuple(fields)
+            if len(keys) < 2 or keys in orders:
+                continue
+            # Which key goes first, then which goes last: brackets merge
+            # into tokens with the key or value next to them
+            best = keys
+            for key in keys[1:]:
+                order = (key,) + tuple(k for k in keys if k != key)
+                orders[keys] = order
+                candidate_cost = self.count(dumps(message, style))
+                if candidate_cost < cost:
+                    best, cost = order, candidate_cost
+            first = best
+            for key in first[1:-1]:
+                order = tuple(k for k in first if k != key) + (key,)
+                orders[keys] = order
+                candidate_cost = self.count(dumps(message, style))
+                if candidate_cost < cost:
+                    best, cost = order, candidate_cost
+            orders[keys] = best
+            if len(orders) > self.maxsize:
+                orders.popitem(last=False)
+
+        for name, values in _KNOBS:
+            current = getattr(style, name)
+            for value in values:
+                if value == current:
+                    continue
+                candidate = replace(style, **{name: value})
+                candidate_cost = self.count(dumps(message, candidate))
+                if candidate_cost < cost:
+                    style, cost = candidate, candidate_cost
+        return style
+
+
+def main():
+    import argparse
+
+    ap = argparse.ArgumentParser(description="Rewrite AXON messages into their cheapest spelling")
+    ap.add_argument("file")
+    ap.add_argument("--encoding", default="cl100k_base", choices=ENCODINGS)
+    args = ap.parse_args()
+
+    with open(args.file) as f:
+        source = f.read()
+    results = Canonicalizer(args.encoding).canonicalize(source)
+    for result in results:
+        print(result.text)
+    before = sum(r.original_tokens for r in results)
+    after = sum(r.tokens for r in results)
+    print(f"# {len(results)} messages, {before} -> {after} tokens ({args.encoding}), "
+          f"saved {before - after}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
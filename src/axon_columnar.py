@@ -0,0 +1,590 @@
+"""
+AXON Columnar AST — flat-array node storage for bulk corpora
+
+Nodes of any number of messages live in parallel typed arrays instead
+of one Python object each:
+
+    kind[i]           NodeKind of node i
+    first_child[i]    index of its first child, or -1
+    next_sibling[i]   index of its next sibling, or -1
+    value[i]          index into the interned string table, or -1
+    offset[i]         source span of the node: start offset and length,
+    length[i]         as ASTNode.offset and ASTNode.length (-1 and 0
+                      when unknown, and for FIELD, ENDPOINT, AGENTS and
+                      UNIT, which have no node class of their own)
+
+Scans over a ColumnarAST are loops over these arrays, with no per-node
+allocation. View classes (MessageView, RecordView, ...) wrap an index
+and expose the accessors of the matching node classes. Conversion from
+and to the dataclass AST is lossless.
+
+Usage:
+    arena = parse_columnar(source)
+    refs = [arena.strings[arena.value[i]] for i in arena.find(NodeKind.REF)]
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterator
+from enum import IntEnum
+
+from axon_parser import (
+    ASTNode,
+    Parser,
+    RegexLexer,
+    Message,
+    Routing,
+    MetaBlock,
+    StringLiteral,
+    NumberLiteral,
+    BooleanLiteral,
+    NullLiteral,
+    Reference,
+    Tag,
+    Variable,
+    Identifier,
+    ListExpr,
+    RecordExpr,
+    RangeExpr,
+    CallExpr,
+    NamedArg,
+    BinaryExpr,
+    PathExpr,
+)
+
+
+# ── Node kinds ───────────────────────────────────────────────────────
+
+class NodeKind(IntEnum):
+    MESSAGE = 0    # value: performative; children: routing, content[, meta]
+    ROUTING = 1    # children: sender, receiver endpoints
+    ENDPOINT = 2   # value: "@ref" or "*"
+    AGENTS = 3     # children: ENDPOINT per agent of a [@a, @b] endpoint
+    META = 4       # children: FIELD
+    FIELD = 5      # value: key; child: value (in META and RECORD)
+    STRING = 6     # value: the string
+    NUMBER = 7     # value: repr of the number; child: UNIT if any
+    UNIT = 8       # value: unit
+    BOOLEAN = 9    # value: "T" or "F"
+    NULL = 10
+    REF = 11       # value: name
+    TAG = 12       # value: name; child: RECORD body if any
+    VAR = 13       # value: name
+    IDENT = 14     # value: name
+    LIST = 15      # children: elements
+    RECORD = 16    # children: FIELD
+    RANGE = 17     # children: start, end
+    CALL = 18      # value: func; children: args
+    NAMED_ARG = 19  # value: name; child: value
+    BINARY = 20    # value: op; children: left, right
+    PATH = 21      # value: parts joined with "."
+
+
+_NAME_KINDS = {
+    Reference: NodeKind.REF,
+    Variable: NodeKind.VAR,
+    Identifier: NodeKind.IDENT,
+}
+
+
+def _encode(node) -> tuple[NodeKind, str | None, list]:
+    """Split `node` into (kind, value, children) for the arena.
+
+    Children are AST nodes or already-split (kind, value, children)
+    tuples for the helper kinds with no node class of their own.
+    """
+    if isinstance(node, tuple):
+        return node
+    cls = type(node)
+    if cls is Message:
+        children = [node.routing, node.content]
+        if node.meta is not None:
+            children.append(node.meta)
+        return NodeKind.MESSAGE, node.performative, children
+    if cls is Routing:
+        return NodeKind.ROUTING, None, [_endpoint(node.sender), _endpoint(node.receiver)]
+    if cls is MetaBlock or cls is RecordExpr:
+        kind = NodeKind.META if cls is MetaBlock else NodeKind.RECORD
+        return kind, None, [(NodeKind.FIELD, k, [v]) for k, v in node.fields.items()]
+    if cls is StringLiteral:
+        return NodeKind.STRING, node.value, []
+    if cls is NumberLiteral:
+        unit = [] if node.unit is None else [(NodeKind.UNIT, node.unit, [])]
+        return NodeKind.NUMBER, repr(node.value), unit
+    if cls is BooleanLiteral:
+        return NodeKind.BOOLEAN, "T" if node.value else "F", []
+    if cls is NullLiteral:
+        return NodeKind.NULL, None, []
+    if cls in _NAME_KINDS:
+        return _NAME_KINDS[cls], node.name, []
+    if cls is Tag:
+        return NodeKind.TAG, node.name, [] if node.body is None else [node.body]
+    if cls is ListExpr:
+        return NodeKind.LIST, None, list(node.elements)
+    if cls is RangeExpr:
+        return NodeKind.RANGE, None, [node.start, node.end]
+    if cls is CallExpr:
+        return NodeKind.CALL, node.func, list(node.args)
+    if cls is NamedArg:
+        return NodeKind.NAMED_ARG, node.name, [node.value]
+    if cls is BinaryExpr:
+        return NodeKind.BINARY, node.op, [node.left, node.right]
+    if cls is PathExpr:
+        return NodeKind.PATH, ".".join(node.parts), []
+    raise TypeError(f"Cannot store {cls.__name__} in a ColumnarAST")
+
+
+def _endpoint(endpoint: str | list[str]) -> tuple:
+    if isinstance(endpoint, str):
+        return NodeKind.ENDPOINT, endpoint, []
+    return NodeKind.AGENTS, None, [(NodeKind.ENDPOINT, ref, []) for ref in endpoint]
+
+
+def _number(text: str) -> int | float:
+    try:
+        return int(text)
+    except ValueError:
+        return float(text)
+
+
+def _decode(kind: int, value: str | None, children: list):
+    """Inverse of _encode for one node, given its decoded children."""
+    if kind == NodeKind.MESSAGE:
+        meta = children[2] if len(children) > 2 else None
+        return Message(performative=value, routing=children[0], content=children[1], meta=meta)
+    if kind == NodeKind.ROUTING:
+        return Routing(sender=children[0], receiver=children[1])
+    if kind == NodeKind.ENDPOINT:
+        return value
+    if kind == NodeKind.AGENTS:
+        return children
+    if kind == NodeKind.META:
+        return MetaBlock(fields=dict(children))
+    if kind == NodeKind.RECORD:
+        return RecordExpr(fields=dict(children))
+    if kind == NodeKind.FIELD:
+        return value, children[0]
+    if kind == NodeKind.STRING:
+        return StringLiteral(value=value)
+    if kind == NodeKind.NUMBER:
+        return NumberLiteral(value=_number(value), unit=children[0] if children else None)
+    if kind == NodeKind.UNIT:
+        return value
+    if kind == NodeKind.BOOLEAN:
+        return BooleanLiteral(value=value == "T")
+    if kind == NodeKind.NULL:
+        return NullLiteral()
+    if kind == NodeKind.REF:
+        return Reference(name=value)
+    if kind == NodeKind.TAG:
+        return Tag(name=value, body=children[0] if children else None)
+    if kind == NodeKind.VAR:
+        return Variable(name=value)
+    if kind == NodeKind.IDENT:
+        return Identifier(name=value)
+    if kind == NodeKind.LIST:
+        return ListExpr(elements=children)
+    if kind == NodeKind.RANGE:
+        return RangeExpr(start=children[0], end=children[1])
+    if kind == NodeKind.CALL:
+        return CallExpr(func=value, args=children)
+    if kind == NodeKind.NAMED_ARG:
+        return NamedArg(name=value, value=children[0])
+    if kind == NodeKind.BINARY:
+        return BinaryExpr(op=value, left=children[0], right=children[1])
+    if kind == NodeKind.PATH:
+        return PathExpr(parts=value.split("."))
+    raise ValueError(f"Unknown node kind {kind}")
+
+
+# ── Arena ────────────────────────────────────────────────────────────
+
+class ColumnarAST:
+    """Nodes of a sequence of messages stored in parallel typed arrays.
+
+    `roots[n]` is the node index of message n. Strings (names, values,
+    operators, numbers as text) are interned once in `strings`.
+    """
+
+    def __init__(self):
+        self.kind = array("B")
+        self.first_child = array("i")
+        self.next_sibling = array("i")
+        self.value = array("i")
+        self.offset = array("q")
+        self.length = array("q")
+        self.roots = array("i")
+        self.strings: list[str] = []
+        self._string_index: dict[str, int] = {}
+
+    @classmethod
+    def from_messages(cls, messages) -> ColumnarAST:
+        arena = cls()
+        for message in messages:
+            arena.append(message)
+        return arena
+
+    def __len__(self) -> int:
+        return len(self.roots)
+
+    def __getitem__(self, n: int) -> MessageView:
+        return MessageView(self, self.roots[n])
+
+    def __iter__(self) -> Iterator[MessageView]:
+        for root in self.roots:
+            yield MessageView(self, root)
+
+    def intern(self, text: str) -> int:
+        index = self._string_index.get(text)
+        if index is None:
+            index = self._string_index[text] = len(self.strings)
+            self.strings.append(text)
+        return index
+
+    def append(self, message: Message) -> int:
+        """Store `message`, spans included, and return its root node index."""
+        kinds, first_child, next_sibling = self.kind, self.first_child, self.next_sibling
+        values, offsets, lengths = self.value, self.offset, self.length
+        last_child: dict[int, int] = {}
+        root = len(kinds)
+        stack = [(message, -1)]
+        while stack:
+            node, parent = stack.pop()
+            kind, value, children = _encode(node)
+            index = len(kinds)
+            kinds.append(kind)
+            first_child.append(-1)
+            next_sibling.append(-1)
+            values.append(-1 if value is None else self.intern(value))
+            if isinstance(node, ASTNode):
+                offsets.append(node.offset)
+                lengths.append(node.length)
+            else:
+                offsets.append(-1)
+                lengths.append(0)
+            if parent >= 0:
+                if parent in last_child:
+                    next_sibling[last_child[parent]] = index
+                else:
+                    first_child[parent] = index
+                last_child[parent] = index
+            stack.extend((child, index) for child in reversed(children))
+        self.roots.append(root)
+        return root
+
+    def children(self, index: int) -> Iterator[int]:
+        child = self.first_child[index]
+        next_sibling = self.next_sibling
+        while child >= 0:
+            yield child
+            child = next_sibling[child]
+
+    def find(self, kind: NodeKind, value: str | None = None) -> Iterator[int]:
+        """Yield indices of all nodes of `kind` (and `value`, if given)."""
+        want_value = -1 if value is None else self._string_index.get(value)
+        if want_value is None:
+            return
+        kinds, values = self.kind, self.value
+        for index, k in enumerate(kinds):
+            if k == kind and (value is None or values[index] == want_value):
+                yield index
+
+    def to_ast(self, index: int):
+        """Rebuild the dataclass node (or endpoint value) at `index`."""
+        kinds, values, strings = self.kind, self.value, self.strings
+        offsets, lengths = self.offset, self.length
+        results: list = []
+        stack: list[tuple[int, bool]] = [(index, False)]
+        counts: dict[int, int] = {}
+        while stack:
+            node, built = stack.pop()
+            if built:
+                n = counts.pop(node)
+                children = results[len(results) - n:]
+                del results[len(results) - n:]
+                v = values[node]
+                value = _decode(kinds[node], None if v < 0 else strings[v], children)
+                if isinstance(value, ASTNode):
+                    value.offset, value.length = offsets[node], lengths[node]
+                results.append(value)
+                continue
+            children = list(self.children(node))
+            counts[node] = len(children)
+            stack.append((node, True))
+            stack.extend((child, False) for child in reversed(children))
+        return results[0]
+
+    def to_messages(self) -> list[Message]:
+        return [self.to_ast(root) for root in self.roots]
+
+
+# ── Views ────────────────────────────────────────────────────────────
+
+class NodeView:
+    """A node of a ColumnarAST, read through the arrays on access."""
+
+    __slots__ = ("arena", "index")
+
+    def __init__(self, arena: ColumnarAST, index: int):
+        self.arena = arena
+        self.index = index
+
+    @property
+    def kind(self) -> NodeKind:
+        return NodeKind(self.arena.kind[self.index])
+
+    @property
+    def offset(self) -> int:
+        return self.arena.offset[self.index]
+
+    @property
+    def length(self) -> int:
+        return self.arena.length[self.index]
+
+    @property
+    def span(self) -> tuple[int, int]:
+        offset = self.arena.offset[self.index]
+        return offset, offset + self.arena.length[self.index]
+
+    def _value(self) -> str | None:
+        v = self.arena.value[self.index]
+        return None if v < 0 else self.arena.strings[v]
+
+    def _children(self) -> list[int]:
+        return list(self.arena.children(self.index))
+
+    def _child(self, n: int):
+        return view(self.arena, self._children()[n])
+
+    def to_ast(self):
+        return self.arena.to_ast(self.index)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, NodeView):
+            return self.to_ast() == other.to_ast()
+        return self.to_ast() == other
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(index={self.index})"
+
+
+class MessageView(NodeView):
+    __slots__ = ()
+
+    @property
+    def performative(self) -> str:
+        return self._value()
+
+    @property
+    def routing(self) -> RoutingView:
+        return self._child(0)
+
+    @property
+    def content(self) -> NodeView:
+        return self._child(1)
+
+    @property
+    def meta(self) -> MetaView | None:
+        children = self._children()
+        return view(self.arena, children[2]) if len(children) > 2 else None
+
+
+class RoutingView(NodeView):
+    __slots__ = ()
+
+    @property
+    def sender(self) -> str | list[str]:
+        return self.arena.to_ast(self._children()[0])
+
+    @property
+    def receiver(self) -> str | list[str]:
+        return self.arena.to_ast(self._children()[1])
+
+
+class _FieldsView(NodeView):
+    __slots__ = ()
+
+    @property
+    def fields(self) -> dict[str, NodeView]:
+        arena = self.arena
+        return {
+            arena.strings[arena.value[f]]: view(arena, arena.first_child[f])
+            for f in arena.children(self.index)
+        }
+
+
+class MetaView(_FieldsView):
+    __slots__ = ()
+
+
+class RecordView(_FieldsView):
+    __slots__ = ()
+
+
+class StringView(NodeView):
+    __slots__ = ()
+
+    @property
+    def value(self) -> str:
+        return self._value()
+
+
+class NumberView(NodeView):
+    __slots__ = ()
+
+    @property
+    def value(self) -> int | float:
+        return _number(self._value())
+
+    @property
+    def unit(self) -> str | None:
+        child = self.arena.first_child[self.index]
+        return None if child < 0 else self.arena.strings[self.arena.value[child]]
+
+
+class BooleanView(NodeView):
+    __slots__ = ()
+
+    @property
+    def value(self) -> bool:
+        return self._value() == "T"
+
+
+class NullView(NodeView):
+    __slots__ = ()
+
+
+class _NameView(NodeView):
+    __slots__ = ()
+
+    @property
+    def name(self) -> str:
+        return self._value()
+
+
+class ReferenceView(_NameView):
+    __slots__ = ()
+
+
+class VariableView(_NameView):
+    __slots__ = ()
+
+
+class IdentifierView(_NameView):
+    __slots__ = ()
+
+
+class TagView(_NameView):
+    __slots__ = ()
+
+    @property
+    def body(self) -> RecordView | None:
+        child = self.arena.first_child[self.index]
+        return None if child < 0 else view(self.arena, child)
+
+
+class ListView(NodeView):
+    __slots__ = ()
+
+    @property
+    def elements(self) -> list[NodeView]:
+        return [view(self.arena, c) for c in self.arena.children(self.index)]
+
+
+class RangeView(NodeView):
+    __slots__ = ()
+
+    @property
+    def start(self) -> NodeView:
+        return self._child(0)
+
+    @property
+    def end(self) -> NodeView:
+        return self._child(1)
+
+
+class CallView(NodeView):
+    __slots__ = ()
+
+    @property
+    def func(self) -> str:
+        return self._value()
+
+    @property
+    def args(self) -> list[NodeView]:
+        return [view(self.arena, c) for c in self.arena.children(self.index)]
+
+
+class NamedArgView(_NameView):
+    __slots__ = ()
+
+    @property
+    def value(self) -> NodeView:
+        return self._child(0)
+
+
+class BinaryView(NodeView):
+    __slots__ = ()
+
+    @property
+    def op(self) -> str:
+        return self._value()
+
+    @property
+    def left(self) -> NodeView:
+        return self._child(0)
+
+    @property
+    def right(self) -> NodeView:
+        return self._child(1)
+
+
+class PathView(NodeView):
+    __slots__ = ()
+
+    @property
+    def parts(self) -> list[str]:
+        return self._value().split(".")
+
+
+_VIEWS = {
+    NodeKind.MESSAGE: MessageView,
+    NodeKind.ROUTING: RoutingView,
+    NodeKind.META: MetaView,
+    NodeKind.RECORD: RecordView,
+    NodeKind.STRING: StringView,
+    NodeKind.NUMBER: NumberView,
+    NodeKind.BOOLEAN: BooleanView,
+    NodeKind.NULL: NullView,
+    NodeKind.REF: ReferenceView,
+    NodeKind.TAG: TagView,
+    NodeKind.VAR: VariableView,
+    NodeKind.IDENT: IdentifierView,
+    NodeKind.LIST: ListView,
+    NodeKind.RANGE: RangeView,
+    NodeKind.CALL: CallView,
+    NodeKind.NAMED_ARG: NamedArgView,
+    NodeKind.BINARY: BinaryView,
+    NodeKind.PATH: PathView,
+}
+
+
+def view(arena: ColumnarAST, index: int) -> NodeView:
+    """Return the view class matching the kind of node `index`."""
+    return _VIEWS.get(arena.kind[index], NodeView)(arena, index)
+
+
+# ── Parse target ─────────────────────────────────────────────────────
+
+def parse_columnar(source: str, arena: ColumnarAST | None = None) -> ColumnarAST:
+    """Parse AXON source straight into a ColumnarAST (new or `arena`).
+
+    Messages are parsed one at a time and only their arrays are kept,
+    so the object trees never outlive a single message.
+    """
+    if arena is None:
+        arena = ColumnarAST()
+    for message in Parser(RegexLexer(source).iter_tokens()).iter_messages():
+        arena.append(message)
+    return arena
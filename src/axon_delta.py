@@ -0,0 +1,244 @@
+"""
+AXON Delta — delta coding for PUB subscription streams (spec §9.3)
+
+A subscription resends its whole record every interval even when one
+field changed:
+
+    PUB(@monitor>@dashboard): {cpu:72%, mem:4.2GB, reqs:1250}
+    PUB(@monitor>@dashboard): {cpu:68%, mem:4.2GB, reqs:1180}
+
+DeltaEncoder sends the second as only the fields that changed against
+the last PUB of the same subscription (same routing), numbered in meta:
+
+    [seq:0] PUB(@monitor>@dashboard): {cpu:72%, mem:4.2GB, reqs:1250}
+    [seq:1, delta:T] PUB(@monitor>@dashboard): {cpu:68%, reqs:1180}
+
+Removed fields are listed as `drop:[key, ...]`. A keyframe (the full
+record, without `delta`) goes out first, every `keyframe_interval`
+messages, and whenever the delta, meta included, would not be shorter.
+DeltaDecoder rebuilds the full RecordExpr, sharing unchanged field nodes
+with the previous one. A delta that does not follow the receiver's last
+message raises DeltaError; the receiver answers with nak(), and the
+sender's receive() of that NAK makes the next message a keyframe.
+
+Messages that are not PUBs with record content pass through unchanged.
+
+Usage:
+    wire = encoder.encode(message)        # publisher
+    message = decoder.decode(wire)        # subscriber
+    ...
+    except DeltaError:
+        encoder.receive(decoder.nak(wire))
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from axon_parser import (
+    Message,
+    Routing,
+    MetaBlock,
+    NumberLiteral,
+    BooleanLiteral,
+    Tag,
+    Identifier,
+    ListExpr,
+    RecordExpr,
+)
+from axon_serializer import dumps
+
+# Meta keys written by the codec
+SEQ = "seq"
+DELTA = "delta"
+DROP = "drop"
+_RESERVED = (SEQ, DELTA, DROP)
+
+_RESYNC = "#resync"
+
+
+class DeltaError(ValueError):
+    """A delta that cannot be applied to the receiver's state."""
+
+
+@dataclass(slots=True)
+class _Stream:
+    """Last record of one subscription, as both ends know it."""
+    seq: int
+    fields: dict
+    keyframe: int = 0  # seq of the last keyframe (sender only)
+
+
+def _key(routing: Routing) -> tuple:
+    """A subscription: its (sender, receiver) routing."""
+    sender, receiver = routing.sender, routing.receiver
+    return (sender if isinstance(sender, str) else tuple(sender),
+            receiver if isinstance(receiver, str) else tuple(receiver))
+
+
+def _is_stream(message: Message) -> bool:
+    return message.performative == "PUB" and isinstance(message.content, RecordExpr)
+
+
+def _seq(meta: MetaBlock | None) -> int | None:
+    if meta is None:
+        return None
+    node = meta.fields.get(SEQ)
+    if not isinstance(node, NumberLiteral) or type(node.value) is not int:
+        return None
+    return node.value
+
+
+def _same(old, new) -> bool:
+    """Whether a field is sent unchanged. Literals compare by value, so
+    1 and 1.0 are equal nodes; their text tells them apart."""
+    return old == new and dumps(old) == dumps(new)
+
+
+def _user_meta(fields: dict) -> MetaBlock | None:
+    """The meta fields left once the codec's own are removed."""
+    rest = {key: value for key, value in fields.items() if key not in _RESERVED}
+    return MetaBlock(rest) if rest else None
+
+
+# ── Sender ───────────────────────────────────────────────────────────
+
+class DeltaEncoder:
+    """Publisher side: turns full PUB records into keyframes and deltas."""
+
+    def __init__(self, keyframe_interval: int = 32):
+        if keyframe_interval < 1:
+            raise ValueError(f"keyframe_interval must be positive, got {keyframe_interval}")
+        self.keyframe_interval = keyframe_interval
+        self._streams: dict[tuple, _Stream] = {}
+
+    def encode(self, message: Message) -> Message:
+        """The message to send for `message`."""
+        if not _is_stream(message):
+            return message
+        meta = message.meta.fields if message.meta is not None else {}
+        for key in _RESERVED:
+            if key in meta:
+                raise ValueError(f"meta key {key!r} is reserved for delta coding")
+        key = _key(message.routing)
+        fields = message.content.fields
+        stream = self._streams.get(key)
+        if stream is None:
+            stream = self._streams[key] = _Stream(-1, {}, -1)
+        stream.seq += 1
+        seq = stream.seq
+
+        changed = drop = None
+        if stream.keyframe >= 0 and seq - stream.keyframe < self.keyframe_interval:
+            old = stream.fields
+            old_kept = [k for k in old if k in fields]
+            new_keys = [k for k in fields if k not in old]
+            # Kept keys must stay in order, new ones come last
+            if list(fields) == old_kept + new_keys:
+                changed = {k: v for k, v in fields.items() if k not in old or not _same(old[k], v)}
+                drop = [k for k in old if k not in fields]
+        stream.fields = fields
+
+        wire = dict(meta)
+        wire[SEQ] = NumberLiteral(seq)
+        keyframe = Message(message.performative, message.routing, message.content,
+                           MetaBlock(wire))
+        if changed is not None:
+            wire = dict(wire)
+            wire[DELTA] = BooleanLiteral(True)
+            if drop:
+                wire[DROP] = ListExpr([Identifier(k) for k in drop])
+            delta = Message(message.performative, message.routing, RecordExpr(changed),
+                            MetaBlock(wire))
+            # Whichever is shorter on the wire: for a small record, or
+            # a long drop list, the delta's meta costs more than it saves
+            if len(dumps(delta)) < len(dumps(keyframe)):
+                return delta
+        stream.keyframe = seq
+        return keyframe
+
+    def resync(self, routing: Routing | None = None):
+        """Make the next message a keyframe (for `routing`, or every stream)."""
+        if routing is None:
+            for stream in self._streams.values():
+                stream.keyframe = -1
+        else:
+            stream = self._streams.get(_key(routing))
+            if stream is not None:
+                stream.keyframe = -1
+
+    def receive(self, message: Message):
+        """Act on a message from a subscriber.
+
+        A NAK with reason #resync forces a keyframe; UNS forgets the
+        subscription. Anything else is ignored.
+        """
+        routing = message.routing
+        back = Routing(routing.receiver, routing.sender)
+        if message.performative == "UNS":
+            self._streams.pop(_key(back), None)
+        elif message.performative == "NAK" and isinstance(message.content, RecordExpr):
+            reason = message.content.fields.get("reason")
+            if isinstance(reason, Tag) and reason.name == _RESYNC:
+                self.resync(back)
+
+
+# ── Receiver ─────────────────────────────────────────────────────────
+
+class DeltaDecoder:
+    """Subscriber side: rebuilds full PUB records from keyframes and deltas."""
+
+    def __init__(self):
+        self._streams: dict[tuple, _Stream] = {}
+
+    def decode(self, message: Message) -> Message:
+        """The full message `message` stands for."""
+        seq = _seq(message.meta)
+        if seq is None or not _is_stream(message):
+            return message
+        meta = message.meta.fields
+        key = _key(message.routing)
+        content = message.content
+
+        if DELTA not in meta:
+            self._streams[key] = _Stream(seq, content.fields)
+            return Message(message.performative, message.routing, content, _user_meta(meta))
+
+        stream = self._streams.get(key)
+        if stream is None:
+            raise DeltaError(f"delta {seq} without a keyframe")
+        if seq != stream.seq + 1:
+            raise DeltaError(f"delta {seq} does not follow {stream.seq}")
+        drop = meta.get(DROP)
+        dropped = set()
+        if drop is not None:
+            if not isinstance(drop, ListExpr) or not all(
+                    isinstance(k, Identifier) for k in drop.elements):
+                raise DeltaError(f"malformed {DROP} list")
+            dropped = {k.name for k in drop.elements}
+        changed = content.fields
+        fields = {k: changed.get(k, v) for k, v in stream.fields.items() if k not in dropped}
+        for k, v in changed.items():
+            if k not in fields:
+                fields[k] = v
+        stream.seq = seq
+        stream.fields = fields
+        return Message(message.performative, message.routing, RecordExpr(fields),
+                       _user_meta(meta))
+
+    def nak(self, message: Message) -> Message:
+        """The NAK asking the sender of `message` for a keyframe.
+
+        The subscription's state is dropped: deltas that arrive before
+        the keyframe fail too.
+        """
+        routing = message.routing
+        self._streams.pop(_key(routing), None)
+        fields = {"reason": Tag(_RESYNC)}
+        seq = _seq(message.meta)
+        if seq is not None:
+            fields[SEQ] = NumberLiteral(seq)
+        return Message("NAK", Routing(routing.receiver, routing.sender), RecordExpr(fields))
+
+    def reset(self):
+        self._streams.clear()
@@ -0,0 +1,304 @@
+"""
+AXON Incremental — re-lex and re-parse a document after each edit
+
+An editor re-validating a playbook on every keystroke cannot afford a
+full parse() of a long file each time. IncrementalDocument keeps the
+token stream and the messages of the last text that parsed, grouped
+per top-level message, and turns an edit into work proportional to the
+messages it touches:
+
+  - Lexing restarts after the last token the edit cannot affect (one
+    whose lookahead ends before it), which is always a point outside
+    strings and comments. Relexing stops at the first new token past
+    the edit that starts where an old token started: from there on the
+    text, and so the tokens, are the old ones.
+  - Parsing restarts at the message holding that last unaffected token
+    and stops at the first old message whose tokens were all reused.
+    Top-level messages are independent, so the rest are kept as they
+    are.
+
+Kept tokens and nodes after the edit move by its length difference.
+The move is recorded per message and applied when that message is next
+read, so an edit near the top of a long file costs no walk over the
+rest. Positions are those parse() gives for the whole text: spans,
+token offsets and line:col.
+
+A failed edit (LexerError, ParseError) raises, and the document keeps
+the messages of the last text that parsed; the next edit re-parses the
+whole range damaged since then.
+
+Usage:
+    doc = IncrementalDocument(open("playbook.axon").read())
+    change = doc.edit(start, end, "new text")   # source[start:end] replaced
+    revalidate(change.messages)                  # messages[change.index:...]
+"""
+
+from __future__ import annotations
+
+import dataclasses
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from typing import Iterator
+
+from axon_parser import (
+    _LOOKAHEAD_MARGIN,
+    ASTNode,
+    LineTable,
+    Message,
+    ParseLimits,
+    Parser,
+    RegexLexer,
+    StackParser,
+    Token,
+    TokenType,
+)
+
+
+@dataclass(slots=True)
+class Change:
+    """What an edit did to the message list: messages[index:index + removed]
+    of the previous version were replaced by `messages`."""
+    index: int
+    removed: int
+    messages: list[Message]
+
+
+@dataclass(slots=True)
+class _Segment:
+    """One top-level message with its tokens, up to the next message.
+
+    The first segment of a document holds the tokens before the first
+    message and no message. Stored offsets are `shift` short of the
+    true ones; the shift is applied by _move().
+    """
+    tokens: list[Token]
+    message: Message | None
+    shift: int = 0
+
+
+# ── Moving nodes ─────────────────────────────────────────────────────
+
+_CHILD_FIELDS: dict[type, tuple[str, ...]] = {}
+
+
+def _child_fields(cls: type) -> tuple[str, ...]:
+    names = _CHILD_FIELDS.get(cls)
+    if names is None:
+        names = _CHILD_FIELDS[cls] = tuple(
+            f.name for f in dataclasses.fields(cls) if f.compare)
+    return names
+
+
+def _move_nodes(node: ASTNode, delta: int):
+    """Add `delta` to the offset of every node under `node`."""
+    stack = [node]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, ASTNode):
+            value.offset += delta
+            stack.extend(getattr(value, name) for name in _child_fields(type(value)))
+        elif isinstance(value, list):
+            stack.extend(value)
+        elif isinstance(value, dict):
+            stack.extend(value.values())
+
+
+def _move(segment: _Segment, delta: int = 0):
+    """Store `segment` at its true offsets plus `delta`.
+
+    Its shift becomes -delta, so the true offsets of the version it was
+    moved from are still known if the edit it was moved for fails.
+    """
+    step = segment.shift + delta
+    if step:
+        for tok in segment.tokens:
+            tok.offset += step
+            tok.end += step
+        if segment.message is not None:
+            _move_nodes(segment.message, step)
+    segment.shift = -delta
+
+
+# ── Document ─────────────────────────────────────────────────────────
+
+class IncrementalDocument:
+    """An AXON document kept parsed across edits.
+
+    `source` is the current text. `messages` and `tokens` are those of
+    the last text that parsed: the current one unless the last edit
+    raised. With `limits`, messages are parsed by StackParser, as for
+    parse(). A `source` that does not parse raises, like parse().
+    """
+
+    def __init__(self, source: str = "", limits: ParseLimits | None = None):
+        self.limits = limits
+        self.source = ""
+        self.lines = LineTable("")
+        self._valid = ""                  # the text the segments belong to
+        self._segments = [_Segment([], None)]
+        self._starts = [0]                # true offset of each segment
+        self._damage: tuple[int, int] | None = None
+        if source:
+            self.edit(0, 0, source)
+
+    @property
+    def messages(self) -> list[Message]:
+        segments = self._segments
+        for segment in segments:
+            if segment.shift:
+                _move(segment)
+        return [segment.message for segment in segments[1:]]
+
+    @property
+    def tokens(self) -> list[Token]:
+        """The token stream, as RegexLexer(text).tokenize() gives it."""
+        tokens = []
+        for segment in self._segments:
+            if segment.shift:
+                _move(segment)
+            tokens.extend(segment.tokens)
+        n = len(self._valid)
+        tokens.append(Token(TokenType.EOF, "", n, n, self.lines))
+        return tokens
+
+    def edit(self, start: int, end: int, text: str) -> Change:
+        """Replace source[start:end] with `text` and re-parse what it affects."""
+        old = self.source
+        if not 0 <= start <= end <= len(old):
+            raise ValueError(f"edit range {start}:{end} outside a {len(old)}-character text")
+        self.source = source = old[:start] + text + old[end:]
+        # The text damaged since the last version that parsed lies after
+        # a common prefix of `start` characters and before a common
+        # suffix of `tail`
+        tail = len(old) - end
+        if self._damage is not None:
+            start, tail = min(start, self._damage[0]), min(tail, self._damage[1])
+        self._damage = (start, tail)
+        change = self._update(start, len(self._valid) - tail, len(source) - tail)
+        self._damage = None
+        return change
+
+    def _update(self, start: int, old_end: int, new_end: int) -> Change:
+        """Bring the segments of self._valid, whose [start, old_end) is
+        now source[start:new_end], up to date with self.source."""
+        source = self.source
+        delta = new_end - old_end
+        segments, starts = self._segments, self._starts
+        first, restart = self._restart(start)
+
+        lexer = RegexLexer(source)
+        lexer.pos, lexer.lines = restart, self.lines
+        # Reused segments by the id of their first token
+        reused: dict[int, int] = {}
+
+        def stream() -> Iterator[Token]:
+            segment = segments[first]
+            yield from (tok for tok in segment.tokens if tok.end <= restart)
+            for tok in lexer._lex(final=True):
+                if tok.offset >= new_end:
+                    found = self._find(tok.offset - delta)
+                    if found is not None:
+                        break
+                yield tok
+            else:
+                n = len(source)
+                yield Token(TokenType.EOF, "", n, n, self.lines)
+                return
+            k, index = found
+            if index:
+                # The rest of a segment whose message is re-parsed; its
+                # tokens may still be needed where they are
+                segment = segments[k]
+                step = segment.shift + delta
+                for tok in segment.tokens[index:]:
+                    yield Token(tok.type, tok.value, tok.offset + step, tok.end + step, tok.lines)
+                k += 1
+            while k < len(segments):
+                segment = segments[k]
+                _move(segment, delta)
+                reused[id(segment.tokens[0])] = k
+                yield from segment.tokens
+                k += 1
+            n = len(source)
+            yield Token(TokenType.EOF, "", n, n, self.lines)
+
+        self.lines.reset(source)
+        try:
+            consumed = []
+            tokens = stream()
+            parser = self._parser(consumed.append(tok) or tok for tok in tokens)
+            messages = []
+            while True:
+                tok = parser._peek()
+                if tok.type is TokenType.EOF:
+                    last = len(segments)
+                    break
+                last = reused.get(id(tok))
+                if last is not None:
+                    break
+                messages.append(parser._parse_message())
+        except Exception:
+            self.lines.reset(self._valid)
+            raise
+
+        # The tokens before the first kept segment, cut at message starts
+        stop = tok.offset
+        new = [] if first else [_Segment([], None)]
+        bounds = iter([m.offset for m in messages] + [stop])
+        bound = next(bounds)
+        for tok in consumed:
+            if tok.offset >= stop:
+                break
+            if tok.offset >= bound:
+                new.append(_Segment([], messages[len(new) - (0 if first else 1)]))
+                bound = next(bounds)
+            new[-1].tokens.append(tok)
+        for segment in segments[last:]:
+            segment.shift += delta
+        index = max(first, 1) - 1
+        change = Change(index, last - max(first, 1), messages)
+        segments[first:last] = new
+        starts[first:] = ([0] if not first else []) + [m.offset for m in messages] + [
+            offset + delta for offset in starts[last:]]
+        self._valid = source
+        return change
+
+    def _restart(self, start: int) -> tuple[int, int]:
+        """(segment, offset) to re-lex and re-parse from for an edit at
+        `start`: just after the last lexeme whose lookahead ends before
+        it, and the segment holding that lexeme."""
+        segments = self._segments
+        k = bisect_right(self._starts, start) - 1
+        after = None
+        while k >= 0:
+            segment = segments[k]
+            if segment.shift:
+                _move(segment)
+            for tok in reversed(segment.tokens):
+                # A number and its unit are one lexeme
+                if (tok.end + _LOOKAHEAD_MARGIN <= start
+                        and not (after is not None and after.type is TokenType.UNIT
+                                 and after.offset == tok.end)):
+                    return k, tok.end
+                after = tok
+            k -= 1
+        return 0, 0
+
+    def _find(self, offset: int) -> tuple[int, int] | None:
+        """(segment, index) of the old lexeme starting at `offset`, if any."""
+        k = bisect_right(self._starts, offset) - 1
+        if k < 0:
+            return None
+        tokens = self._segments[k].tokens
+        stored = offset - self._segments[k].shift
+        index = bisect_left(tokens, stored, key=lambda tok: tok.offset)
+        # A unit starts no lexeme: it was read with its number
+        if (index < len(tokens) and tokens[index].offset == stored
+                and tokens[index].type is not TokenType.UNIT):
+            return k, index
+        return None
+
+    def _parser(self, tokens) -> Parser:
+        if self.limits is None:
+            return Parser(tokens)
+        return StackParser(tokens, self.limits)
@@ -8,7 +8,12 @@ Validates and parses AXON messages into structured Python objects.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import codecs
+import re
+from bisect import bisect_right
+from collections import OrderedDict, deque
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
 from enum import Enum
 
 
@@ -70,13 +75,207 @@ UNITS = {
     "tok", "usd", "eur",
 }
 
+# Two-character operators, checked before their one-character prefixes
+OPERATORS = {
+    "->": TokenType.ARROW,
+    "<-": TokenType.BACKARROW,
+    "<=": TokenType.LTE,
+    ">=": TokenType.GTE,
+    "!=": TokenType.NEQ,
+    "..": TokenType.DOTDOT,
+    "%%": TokenType.DOUBLE_PERCENT,
+    "==": TokenType.EQ,
+}
+
+SIMPLE_TOKENS = {
+    "(": TokenType.LPAREN, ")": TokenType.RPAREN,
+    "[": TokenType.LBRACKET, "]": TokenType.RBRACKET,
+    "{": TokenType.LBRACE, "}": TokenType.RBRACE,
+    ":": TokenType.COLON, ",": TokenType.COMMA,
+    ">": TokenType.GT, "<": TokenType.LT,
+    "&": TokenType.AMP, "|": TokenType.PIPE,
+    "!": TokenType.BANG, "?": TokenType.QUESTION,
+    "~": TokenType.TILDE, "^": TokenType.CARET,
+    "=": TokenType.EQ, ".": TokenType.DOT,
+    "*": TokenType.STAR, "+": TokenType.PLUS,
+    "-": TokenType.MINUS, "/": TokenType.SLASH,
+}
+
+
+# Binary operators: token type -> (precedence level, associativity).
+# Levels follow spec §5, lowest first; level 9 is prefix ~ ! - and primaries.
+BINARY_OPERATORS = {
+    TokenType.BACKARROW: (1, "right"),
+    TokenType.ARROW: (2, "left"),
+    TokenType.AMP: (3, "left"),
+    TokenType.PIPE: (4, "left"),
+    TokenType.LT: (5, "none"),
+    TokenType.GT: (5, "none"),
+    TokenType.LTE: (5, "none"),
+    TokenType.GTE: (5, "none"),
+    TokenType.NEQ: (5, "none"),
+    TokenType.EQ: (5, "none"),
+    TokenType.PLUS: (6, "left"),
+    TokenType.MINUS: (6, "left"),
+    TokenType.STAR: (7, "left"),
+    TokenType.SLASH: (7, "left"),
+    TokenType.DOTDOT: (8, "none"),
+}
+
+_MAX_LEVEL = 9
+
 
 @dataclass
 class Token:
     type: TokenType
     value: str
-    line: int
-    col: int
+    offset: int = -1  # character offset of the token in the source
+    end: int = -1     # offset just past its last character
+    lines: LineTable | None = field(default=None, repr=False, compare=False)
+
+    @property
+    def position(self) -> tuple[int, int]:
+        """(line, col), both 1-based; (0, 0) when unknown."""
+        if self.lines is None:
+            return 0, 0
+        return self.lines.position(self.offset)
+
+    @property
+    def line(self) -> int:
+        return self.position[0]
+
+    @property
+    def col(self) -> int:
+        return self.position[1]
+
+    def __reduce__(self):
+        # Keep the position, not the line table: that holds the whole
+        # source the token was read from
+        value = self.value
+        if value is None and self.type is TokenType.STRING and self.lines is not None:
+            value = _string_at(self.lines.source, self.offset)  # a lazy string
+        line, col = self.position
+        return (_token_at, (self.type, value, self.offset, self.end, line, col))
+
+
+def _token_at(type: TokenType, value: str, offset: int, end: int, line: int, col: int) -> Token:
+    """A token whose line table knows only its own position."""
+    lines = LineTable("", offset, line, col) if line else None
+    return Token(type, value, offset, end, lines)
+
+
+# ── Line table ───────────────────────────────────────────────────────
+
+_NEWLINE_RE = re.compile("\n")
+_BYTE_NEWLINE_RE = re.compile(b"\n")
+
+
+class LineTable:
+    """Turns character offsets into (line, col), both 1-based.
+
+    For bytes source (see ByteLexer) offsets and columns count bytes.
+
+    Tokens carry only their offset. The offsets where lines start are
+    found with one scan of the text the first time a position is asked
+    for (in practice, for an error message), then looked up by binary
+    search; lexing itself does no line bookkeeping.
+
+    `source` sits at offset `base` of the whole input, its first
+    character at `line`:`col` (a piece cut out of a larger document).
+    """
+
+    __slots__ = ("source", "_base", "_starts", "_first", "_scanned")
+
+    def __init__(self, source: str, base: int = 0, line: int = 1, col: int = 1):
+        self.source = source
+        self._base = base
+        self._starts = [base - col + 1]  # line starts found so far
+        self._first = line               # the line starting at _starts[0]
+        self._scanned = base             # offset the scan has reached
+
+    def _scan(self, end: int):
+        base = self._base
+        newline = _NEWLINE_RE if isinstance(self.source, str) else _BYTE_NEWLINE_RE
+        found = newline.finditer(self.source, self._scanned - base, end - base)
+        self._starts.extend([m.end() + base for m in found])
+        self._scanned = end
+
+    def position(self, offset: int) -> tuple[int, int]:
+        if offset >= self._scanned:
+            self._scan(self._base + len(self.source))
+        starts = self._starts
+        index = bisect_right(starts, offset) - 1
+        if index < 0:
+            return 0, 0
+        return self._first + index, offset - starts[index] + 1
+
+    def rebase(self, source: str, base: int):
+        """The text is now `source`, at offset `base`; the lines of any
+        text dropped from the front are recorded first."""
+        if base > self._scanned:
+            self._scan(base)
+        self.source = source
+        self._base = base
+
+    def reset(self, source: str):
+        """The text is now `source`, an edited version: its line starts
+        are found again on the next lookup."""
+        self.source = source
+        del self._starts[1:]
+        self._scanned = self._base
+
+    def discard(self, offset: int):
+        """Forget the lines that end before `offset`."""
+        index = bisect_right(self._starts, offset) - 1
+        if index > 0:
+            del self._starts[:index]
+            self._first += index
+
+
+# ── Interning ────────────────────────────────────────────────────────
+
+class InternTable:
+    """Bounded string intern table.
+
+    Returns one shared object per distinct string, so a name seen a
+    million times is stored once and compares by identity. Two
+    generations of at most `maxsize` entries each are kept: when the
+    current one fills up it becomes the old one, and names still in use
+    are promoted back on their next lookup.
+    """
+
+    def __init__(self, maxsize: int = 65536):
+        self.maxsize = maxsize
+        self._current: dict[str, str] = {}
+        self._old: dict[str, str] = {}
+
+    def __call__(self, text: str) -> str:
+        found = self._current.get(text)
+        if found is not None:
+            return found
+        found = self._old.get(text, text)
+        if len(self._current) >= self.maxsize:
+            self._old = self._current
+            self._current = {}
+        self._current[found] = found
+        return found
+
+    def __len__(self) -> int:
+        return len(self._current.keys() | self._old.keys())
+
+    def clear(self):
+        self._current = {}
+        self._old = {}
+
+
+# Shared by all lexers and parsers: performatives, @refs, #tags, $vars
+# and identifiers, and the AST name fields built from them.
+NAMES = InternTable()
+
+_INTERNED_TYPES = {
+    TokenType.PERFORMATIVE, TokenType.REF, TokenType.TAG,
+    TokenType.VAR, TokenType.IDENT,
+}
 
 
 # ── Lexer ────────────────────────────────────────────────────────────
@@ -84,17 +283,23 @@ class Token:
 class LexerError(Exception):
     def __init__(self, msg: str, line: int, col: int):
         super().__init__(f"Lexer error at {line}:{col}: {msg}")
+        self.msg = msg
         self.line = line
         self.col = col
 
+    def __reduce__(self):
+        return (type(self), (self.msg, self.line, self.col))
+
 
 class Lexer:
     def __init__(self, source: str):
         self.source = source
         self.pos = 0
-        self.line = 1
-        self.col = 1
+        self.lines = LineTable(source)
         self.tokens: list[Token] = []
+        self._start = 0  # offset where the lexeme being read starts
+        # Offset of source[0] within the whole input (see ChunkLexer)
+        self._base = 0
 
     def _peek(self) -> str | None:
         if self.pos < len(self.source):
@@ -110,40 +315,26 @@ class Lexer:
     def _advance(self) -> str:
         ch = self.source[self.pos]
         self.pos += 1
-        if ch == "\n":
-            self.line += 1
-            self.col = 1
-        else:
-            self.col += 1
         return ch
 
-    def _emit(self, ttype: TokenType, value: str, line: int, col: int):
-        self.tokens.append(Token(ttype, value, line, col))
+    def _emit(self, ttype: TokenType, value: str):
+        if ttype in _INTERNED_TYPES:
+            value = NAMES(value)
+        self.tokens.append(Token(ttype, value, self._start, self.pos, self.lines))
+
+    def _error(self, msg: str, pos: int) -> LexerError:
+        """LexerError for source offset `pos`, with its line and column."""
+        return LexerError(msg, *self.lines.position(self._base + pos))
 
     def _read_string(self) -> str:
-        result = []
-        self._advance()  # consume opening "
-        while self.pos < len(self.source):
-            ch = self._peek()
-            if ch == "\\":
-                self._advance()
-                esc = self._advance()
-                if esc == "n":
-                    result.append("\n")
-                elif esc == "t":
-                    result.append("\t")
-                elif esc == '"':
-                    result.append('"')
-                elif esc == "\\":
-                    result.append("\\")
-                else:
-                    result.append(esc)
-            elif ch == '"':
-                self._advance()
-                return "".join(result)
-            else:
-                result.append(self._advance())
-        raise LexerError("Unterminated string", self.line, self.col)
+        # The body up to the closing quote is sliced once, then unescaped
+        start = self.pos + 1
+        end = _STRING_BODY_RE.match(self.source, start).end()
+        if end >= len(self.source) or self.source[end] != '"':
+            self.pos = len(self.source)
+            raise self._error("Unterminated string", self.pos)
+        self.pos = end + 1
+        return _unescape(self.source[start:end])
 
     def _read_number(self) -> str:
         start = self.pos
@@ -163,12 +354,15 @@ class Lexer:
     def _read_identifier(self) -> str:
         start = self.pos
         # First character must be a letter per spec: identifier = letter { letter | digit | "-" | "_" }
-        if self.pos < len(self.source) and self.source[self.pos].isalpha():
+        if self.pos >= len(self.source):
+            raise self._error(
+                "Identifier must start with a letter, got end of input", self.pos)
+        if self.source[self.pos].isalpha():
             self._advance()
         else:
-            raise LexerError(
+            raise self._error(
                 f"Identifier must start with a letter, got {self.source[self.pos]!r}",
-                self.line, self.col,
+                self.pos,
             )
         while self.pos < len(self.source) and (
             self.source[self.pos].isalnum()
@@ -204,258 +398,855 @@ class Lexer:
                 # Don't consume unit if followed by alphanumeric (part of longer word)
                 if end < len(self.source) and (self.source[end].isalnum() or self.source[end] == "_"):
                     continue
-                uline, ucol = self.line, self.col
-                for _ in unit:
-                    self._advance()
-                self._emit(TokenType.UNIT, unit, uline, ucol)
+                self._start = self.pos
+                self.pos = end
+                self._emit(TokenType.UNIT, unit)
                 return
 
     def tokenize(self) -> list[Token]:
         while self.pos < len(self.source):
-            ch = self._peek()
-            line, col = self.line, self.col
+            self._lex_one()
+        self._start = self.pos
+        self._emit(TokenType.EOF, "")
+        return self.tokens
 
-            if ch in " \t\r":
-                self._advance()
-                continue
+    def iter_tokens(self) -> Iterator[Token]:
+        """Yield tokens lazily instead of building the whole list."""
+        while self.pos < len(self.source):
+            self.tokens = []
+            self._lex_one()
+            yield from self.tokens
+        yield Token(TokenType.EOF, "", self.pos, self.pos, self.lines)
 
-            # Comments: (* ... *) — but not (*> which is routing with wildcard
-            if ch == "(" and self._peek_at(1) == "*" and self._peek_at(2) != ">":
-                comment_line, comment_col = self.line, self.col
-                self._advance()
-                self._advance()
-                depth = 1
-                while self.pos < len(self.source) and depth > 0:
-                    if self.source[self.pos] == "*" and self._peek_at(1) == ")":
-                        depth -= 1
-                        self._advance()
-                        self._advance()
-                    elif self.source[self.pos] == "(" and self._peek_at(1) == "*":
-                        depth += 1
-                        self._advance()
-                        self._advance()
-                    else:
-                        self._advance()
-                if depth > 0:
-                    raise LexerError("Unterminated comment", comment_line, comment_col)
-                continue
+    def _lex_one(self):
+        """Consume one lexeme at the current position, emitting 0-2 tokens."""
+        self._start = self.pos
+        ch = self._peek()
 
-            if ch == "\n":
-                self._advance()
-                self._emit(TokenType.NEWLINE, "\n", line, col)
-                continue
+        if ch in " \t\r":
+            self._advance()
+            return
 
-            if ch == '"':
-                s = self._read_string()
-                self._emit(TokenType.STRING, s, line, col)
-                continue
+        # Comments: (* ... *) — but not (*> which is routing with wildcard
+        if ch == "(" and self._peek_at(1) == "*" and self._peek_at(2) != ">":
+            self._advance()
+            self._advance()
+            depth = 1
+            while self.pos < len(self.source) and depth > 0:
+                if self.source[self.pos] == "*" and self._peek_at(1) == ")":
+                    depth -= 1
+                    self._advance()
+                    self._advance()
+                elif self.source[self.pos] == "(" and self._peek_at(1) == "*":
+                    depth += 1
+                    self._advance()
+                    self._advance()
+                else:
+                    self._advance()
+            if depth > 0:
+                raise self._error("Unterminated comment", self._start)
+            return
 
-            # Two-character operators (order matters: check longest first)
-            if ch == "-" and self._peek_at(1) == ">":
-                self._advance()
-                self._advance()
-                self._emit(TokenType.ARROW, "->", line, col)
-                continue
+        if ch == "\n":
+            self._advance()
+            self._emit(TokenType.NEWLINE, "\n")
+            return
 
-            if ch == "<" and self._peek_at(1) == "-":
-                self._advance()
-                self._advance()
-                self._emit(TokenType.BACKARROW, "<-", line, col)
-                continue
+        if ch == '"':
+            s = self._read_string()
+            self._emit(TokenType.STRING, s)
+            return
 
-            if ch == "<" and self._peek_at(1) == "=":
-                self._advance()
-                self._advance()
-                self._emit(TokenType.LTE, "<=", line, col)
-                continue
+        # Two-character operators (order matters: check longest first)
+        op = ch + (self._peek_at(1) or "")
+        if op in OPERATORS:
+            self._advance()
+            self._advance()
+            self._emit(OPERATORS[op], op)
+            return
 
-            if ch == ">" and self._peek_at(1) == "=":
-                self._advance()
-                self._advance()
-                self._emit(TokenType.GTE, ">=", line, col)
-                continue
+        # Numbers (non-negative only; unary minus handled in parser)
+        if ch.isdigit():
+            num = self._read_number()
+            self._emit(TokenType.NUMBER, num)
+            self._try_read_unit()
+            return
 
-            if ch == "!" and self._peek_at(1) == "=":
-                self._advance()
+        # References @qualified.id or @* (wildcard)
+        if ch == "@":
+            self._advance()
+            if self.pos < len(self.source) and self.source[self.pos] == "*":
                 self._advance()
-                self._emit(TokenType.NEQ, "!=", line, col)
-                continue
+                self._emit(TokenType.REF, "@*")
+            else:
+                ident = self._read_qualified_id()
+                self._emit(TokenType.REF, "@" + ident)
+            return
 
-            if ch == "." and self._peek_at(1) == ".":
-                self._advance()
-                self._advance()
-                self._emit(TokenType.DOTDOT, "..", line, col)
-                continue
+        # Tags #qualified.id
+        if ch == "#":
+            self._advance()
+            ident = self._read_qualified_id()
+            self._emit(TokenType.TAG, "#" + ident)
+            return
 
-            if ch == "%" and self._peek_at(1) == "%":
-                self._advance()
-                self._advance()
-                self._emit(TokenType.DOUBLE_PERCENT, "%%", line, col)
-                continue
+        # Variables $qualified.id
+        if ch == "$":
+            self._advance()
+            ident = self._read_qualified_id()
+            self._emit(TokenType.VAR, "$" + ident)
+            return
 
-            if ch == "=" and self._peek_at(1) == "=":
-                self._advance()
-                self._advance()
-                self._emit(TokenType.EQ, "==", line, col)
-                continue
+        # Underscore (null literal)
+        if ch == "_":
+            self._advance()
+            self._emit(TokenType.UNDERSCORE, "_")
+            return
 
-            # Numbers (non-negative only; unary minus handled in parser)
-            if ch.isdigit():
-                num = self._read_number()
-                self._emit(TokenType.NUMBER, num, line, col)
-                self._try_read_unit()
-                continue
+        # Identifiers, performatives, booleans
+        if ch.isalpha():
+            ident = self._read_identifier()
+            if ident in PERFORMATIVES:
+                self._emit(TokenType.PERFORMATIVE, ident)
+            elif ident in ("T", "F"):
+                self._emit(TokenType.BOOLEAN, ident)
+            else:
+                self._emit(TokenType.IDENT, ident)
+            return
 
-            # References @qualified.id or @* (wildcard)
-            if ch == "@":
-                self._advance()
-                if self.pos < len(self.source) and self.source[self.pos] == "*":
-                    self._advance()
-                    self._emit(TokenType.REF, "@*", line, col)
-                else:
-                    ident = self._read_qualified_id()
-                    self._emit(TokenType.REF, "@" + ident, line, col)
-                continue
+        # Single-character tokens
+        if ch in SIMPLE_TOKENS:
+            self._advance()
+            self._emit(SIMPLE_TOKENS[ch], ch)
+            return
 
-            # Tags #qualified.id
-            if ch == "#":
-                self._advance()
-                ident = self._read_qualified_id()
-                self._emit(TokenType.TAG, "#" + ident, line, col)
-                continue
+        raise self._error(f"Unexpected character: {ch!r}", self._start)
+
+
+# ── Compiled lexer ───────────────────────────────────────────────────
+#
+# One master pattern, built once at import from the token tables above.
+# Its alternatives are ordered exactly like the checks in
+# Lexer._lex_one(), so every lexeme is classified the same way.  Rare
+# inputs the ASCII pattern cannot decide (non-ASCII identifier or digit
+# characters, malformed sigils) are handed back to Lexer._lex_one().
+
+_IDENT_PAT = r"[A-Za-z](?:[A-Za-z0-9_]|-(?!>))*"
+_QUALIFIED_PAT = rf"{_IDENT_PAT}(?:\.(?=[A-Za-z]){_IDENT_PAT})*"
+_UNIT_PAT = "(?:{})(?![A-Za-z0-9_])".format("|".join(
+    re.escape(u) + ("(?!%)" if u == "%" else "")
+    for u in sorted(UNITS, key=lambda u: (-len(u), u))
+))
+
+_MASTER_RE = re.compile(r"[ \t\r]*(?:" + "|".join([
+    r"(?P<COMMENT>\(\*(?!>))",
+    r"(?P<NEWLINE>\n)",
+    r'(?P<STRING>"[^"\\]*(?:\\.[^"\\]*)*")',
+    "(?P<OP2>{})".format("|".join(re.escape(op) for op in OPERATORS)),
+    rf"(?P<NUMBER>(?P<DIGITS>[0-9]+(?:\.[0-9]+)?)(?P<UNIT>{_UNIT_PAT})?)",
+    rf"(?P<REF>@(?:\*|{_QUALIFIED_PAT}))",
+    rf"(?P<TAG>#{_QUALIFIED_PAT})",
+    rf"(?P<VAR>\${_QUALIFIED_PAT})",
+    r"(?P<UNDERSCORE>_)",
+    rf"(?P<WORD>{_IDENT_PAT})",
+    "(?P<OP1>[{}])".format("".join(re.escape(c) for c in SIMPLE_TOKENS)),
+    r"(?P<OTHER>.)",
+    r"(?P<END>$)",
+]) + ")", re.DOTALL)
+
+_COMMENT_DELIM_RE = re.compile(r"\(\*|\*\)")
+_STRING_BODY_RE = re.compile(r'[^"\\]*(?:\\.[^"\\]*)*', re.DOTALL)
+# \u{XXXX} (spec §12): one to six hex digits naming a code point
+_ESCAPE_RE = re.compile(r"\\(?:u\{([0-9A-Fa-f]{1,6})\}|(.))", re.DOTALL)
+_ESCAPES = {"n": "\n", "t": "\t"}
+
+_WORD_TYPES = {p: TokenType.PERFORMATIVE for p in PERFORMATIVES}
+_WORD_TYPES.update({"T": TokenType.BOOLEAN, "F": TokenType.BOOLEAN})
+
+_SIGIL_TYPES = {"REF": TokenType.REF, "TAG": TokenType.TAG, "VAR": TokenType.VAR}
+
+
+# Characters the master pattern may examine past the end of a lexeme
+# (a unit suffix plus its word-boundary check); an incremental scan only
+# commits a lexeme once this much text follows it.
+_LOOKAHEAD_MARGIN = max(len(u) for u in UNITS) + 1
+
+
+def _scan_comment(src: str, pos: int, depth: int) -> tuple[int, int]:
+    """Scan a nested comment body from `pos` at nesting `depth`.
+
+    Returns (end, depth). depth is 0 when the comment closed at end;
+    otherwise end is where scanning should resume once more text is
+    available (a trailing "(" or "*" may start a delimiter).
+    """
+    search = _COMMENT_DELIM_RE.search
+    while depth:
+        m = search(src, pos)
+        if m is None:
+            n = len(src)
+            if pos < n and src[n - 1] in "(*":
+                return n - 1, depth
+            return n, depth
+        depth += 1 if m.group() == "(*" else -1
+        pos = m.end()
+    return pos, 0
+
+
+def _unescape_one(m: re.Match) -> str:
+    code, ch = m.groups()
+    if code is None:
+        return _ESCAPES.get(ch, ch)
+    point = int(code, 16)
+    if point > 0x10FFFF or 0xD800 <= point <= 0xDFFF:
+        # Not a character: like any other unknown escape, the backslash goes
+        return m.group()[1:]
+    return chr(point)
+
+
+def _unescape(body: str) -> str:
+    if "\\" not in body:
+        return body
+    return _ESCAPE_RE.sub(_unescape_one, body)
+
+
+class RegexLexer(Lexer):
+    """Table-driven lexer producing the same token stream as Lexer.
+
+    Tokens carry offsets only; lines and columns come from the shared
+    LineTable when asked for. The scanning loop can also stop early and
+    resume once more input is appended to the source, which ChunkLexer
+    builds on.
+
+    With `lazy_strings`, STRING tokens carry no value (None): the body
+    is neither sliced nor unescaped, for a parser that builds LazyString
+    nodes from the token offsets.
+    """
+
+    def __init__(self, source: str, lazy_strings: bool = False):
+        super().__init__(source)
+        self.lazy_strings = lazy_strings
+        # Unfinished string or comment when the input ran out:
+        # ("string", offset, raw_parts) or ("comment", offset, depth)
+        self._pending: tuple | None = None
 
-            # Variables $qualified.id
-            if ch == "$":
-                self._advance()
-                ident = self._read_qualified_id()
-                self._emit(TokenType.VAR, "$" + ident, line, col)
-                continue
+    def tokenize(self) -> list[Token]:
+        self.tokens = list(self.iter_tokens())
+        return self.tokens
 
-            # Underscore (null literal)
-            if ch == "_":
-                self._advance()
-                self._emit(TokenType.UNDERSCORE, "_", line, col)
-                continue
+    def iter_tokens(self) -> Iterator[Token]:
+        yield from self._lex(final=True)
+        n = self._base + len(self.source)
+        yield Token(TokenType.EOF, "", n, n, self.lines)
+
+    def _needs_fallback(self, end: int, dotted: bool) -> bool:
+        """Would a non-ASCII character after `end` extend this lexeme?"""
+        src = self.source
+        if end >= len(src):
+            return False
+        if src[end] >= "\x80":
+            return True
+        return (dotted and src[end] == "."
+                and end + 1 < len(src) and src[end + 1] >= "\x80")
+
+    def _fallback(self, pos: int) -> list[Token]:
+        """Lex one lexeme at `pos` with the reference per-character code."""
+        self.pos = pos
+        self.tokens = []
+        self._lex_one()
+        for tok in self.tokens:
+            tok.offset += self._base
+            tok.end += self._base
+        return self.tokens
 
-            # Identifiers, performatives, booleans
-            if ch.isalpha():
-                ident = self._read_identifier()
-                if ident in PERFORMATIVES:
-                    self._emit(TokenType.PERFORMATIVE, ident, line, col)
-                elif ident in ("T", "F"):
-                    self._emit(TokenType.BOOLEAN, ident, line, col)
+    def _lex(self, final: bool) -> Iterator[Token]:
+        """Yield tokens from self.pos onwards.
+
+        With final=False the loop stops before any lexeme that ends
+        within _LOOKAHEAD_MARGIN characters of the end of the source, and
+        before the end of an unfinished string or comment, leaving
+        self.pos and self._pending ready for a later call once more text
+        has been appended.
+        """
+        src = self.source
+        n = len(src)
+        limit = n if final else n - _LOOKAHEAD_MARGIN
+        match = _MASTER_RE.match
+        word_types = _WORD_TYPES
+        ident = TokenType.IDENT
+        intern = NAMES
+        lines = self.lines
+        lazy_strings = self.lazy_strings
+        base = self._base
+        pos = self.pos
+
+        if self._pending is not None:
+            pending = self._pending
+            if pending[0] == "string":
+                end = _STRING_BODY_RE.match(src, pos).end()
+                closed = end < n and src[end] == '"'
+            else:
+                end, depth = _scan_comment(src, pos, pending[2])
+                closed = depth == 0
+            if closed and pending[0] == "string":
+                body = "".join(pending[2]) + src[pos:end]
+                end += 1
+                yield Token(TokenType.STRING, _unescape(body), pending[1], base + end, lines)
+            elif not closed:
+                if final:
+                    if pending[0] == "string":
+                        raise self._error("Unterminated string", n)
+                    raise LexerError("Unterminated comment", *lines.position(pending[1]))
+                if pending[0] == "string":
+                    pending[2].append(src[pos:end])
                 else:
-                    self._emit(TokenType.IDENT, ident, line, col)
-                continue
+                    self._pending = pending[:2] + (depth,)
+                self.pos = end
+                return
+            self._pending = None
+            pos = end
+
+        while True:
+            m = match(src, pos)
+            kind = m.lastgroup
+            pos = m.start(kind)
+            end = m.end()
+            if end > limit:
+                break
+
+            if kind == "WORD":
+                if end < n and src[end] >= "\x80":
+                    tokens = self._fallback(pos)
+                    end = self.pos
+                    if end > limit:
+                        break
+                    yield from tokens
+                else:
+                    text = intern(m.group(kind))
+                    yield Token(word_types.get(text, ident), text, base + pos, base + end, lines)
+            elif kind == "OP1":
+                ch = src[pos]
+                yield Token(SIMPLE_TOKENS[ch], ch, base + pos, base + end, lines)
+            elif kind == "NUMBER":
+                if self._needs_fallback(end, True):
+                    tokens = self._fallback(pos)
+                    end = self.pos
+                    if end > limit:
+                        break
+                    yield from tokens
+                else:
+                    digits, unit = m.group("DIGITS", "UNIT")
+                    if unit is None:
+                        yield Token(TokenType.NUMBER, digits, base + pos, base + end, lines)
+                    else:
+                        split = base + pos + len(digits)
+                        yield Token(TokenType.NUMBER, digits, base + pos, split, lines)
+                        yield Token(TokenType.UNIT, unit, split, base + end, lines)
+            elif kind == "NEWLINE":
+                yield Token(TokenType.NEWLINE, "\n", base + pos, base + end, lines)
+            elif kind in _SIGIL_TYPES:
+                if self._needs_fallback(end, True):
+                    tokens = self._fallback(pos)
+                    end = self.pos
+                    if end > limit:
+                        break
+                    yield from tokens
+                else:
+                    yield Token(_SIGIL_TYPES[kind], intern(m.group(kind)), base + pos, base + end,
+                                lines)
+            elif kind == "STRING":
+                value = None if lazy_strings else _unescape(src[pos + 1:end - 1])
+                yield Token(TokenType.STRING, value, base + pos, base + end, lines)
+            elif kind == "OP2":
+                op = m.group(kind)
+                yield Token(OPERATORS[op], op, base + pos, base + end, lines)
+            elif kind == "UNDERSCORE":
+                yield Token(TokenType.UNDERSCORE, "_", base + pos, base + end, lines)
+            elif kind == "COMMENT":
+                end, depth = _scan_comment(src, end, 1)
+                if depth:
+                    if final:
+                        raise self._error("Unterminated comment", pos)
+                    self._pending = ("comment", base + pos, depth)
+            elif kind == "END":
+                break
+            elif src[pos] == '"':
+                # An opening quote the STRING alternative could not close
+                end = _STRING_BODY_RE.match(src, pos + 1).end()
+                if final:
+                    raise self._error("Unterminated string", n)
+                self._pending = ("string", base + pos, [src[pos + 1:end]])
+            else:
+                tokens = self._fallback(pos)
+                end = self.pos
+                if end > limit:
+                    break
+                yield from tokens
+
+            pos = end
+            if self._pending is not None:
+                break
+
+        self.pos = pos
+
+
+class ChunkLexer(RegexLexer):
+    """RegexLexer fed incrementally with successive chunks of text.
+
+    feed() returns the tokens that can no longer change, whatever text
+    arrives next; close() flushes the rest and appends EOF. Positions
+    are absolute across chunks. Consumed text is dropped from the
+    buffer (its line starts are kept in the LineTable), and unfinished
+    strings and comments resume where their scan stopped, so no
+    character is scanned twice.
+    """
+
+    def __init__(self):
+        super().__init__("")
+
+    def feed(self, text: str) -> list[Token]:
+        if self.pos:
+            self._base += self.pos
+            self.source = self.source[self.pos:]
+            self.pos = 0
+        self.source += text
+        self.lines.rebase(self.source, self._base)
+        return list(self._lex(final=False))
+
+    def close(self) -> list[Token]:
+        tokens = list(self._lex(final=True))
+        n = self._base + len(self.source)
+        tokens.append(Token(TokenType.EOF, "", n, n, self.lines))
+        return tokens
+
+    @property
+    def unlexed_offset(self) -> int:
+        """Offset of the first character fed but not yet returned in a
+        token: the start of an unfinished string or comment, if any."""
+        if self._pending is not None:
+            return self._pending[1]
+        return self._base + self.pos
+
+
+# ── Byte lexer ───────────────────────────────────────────────────────
+#
+# The master pattern compiled for bytes: re scans bytes, bytearray and
+# mmap objects alike, so UTF-8 input is lexed where it lies. Everything
+# the ASCII pattern matches outside strings is ASCII; only string bodies
+# and the rare lexeme holding non-ASCII characters are decoded.
+
+_BYTE_MASTER_RE = re.compile(_MASTER_RE.pattern.encode(), re.DOTALL)
+_BYTE_COMMENT_DELIM_RE = re.compile(_COMMENT_DELIM_RE.pattern.encode())
+_BYTE_STRING_BODY_RE = re.compile(_STRING_BODY_RE.pattern.encode(), re.DOTALL)
+# Bytes that may continue a lexeme holding non-ASCII characters
+_BYTE_RUN_RE = re.compile(rb"[0-9A-Za-z_.\-\x80-\xff]*")
+
+_BYTE_OPERATORS = {op.encode(): (ttype, op) for op, ttype in OPERATORS.items()}
+_BYTE_SIMPLE_TOKENS = {ord(ch): (ttype, ch) for ch, ttype in SIMPLE_TOKENS.items()}
+_BYTE_UNITS = {unit.encode(): unit for unit in UNITS}
+
+
+class ByteLexer(Lexer):
+    """RegexLexer's token stream, read from UTF-8 bytes.
+
+    `source` is bytes, a bytearray or an mmap, and is never decoded or
+    copied as a whole: names and operators are ASCII slices, string
+    bodies are decoded (and unescaped) when their token is made, or with
+    `lazy_strings` when a LazyString's value is first read. Offsets,
+    and so spans and error columns, count bytes.
+    """
+
+    def __init__(self, source: bytes, lazy_strings: bool = False):
+        super().__init__(source)
+        self.lazy_strings = lazy_strings
+
+    def tokenize(self) -> list[Token]:
+        self.tokens = list(self.iter_tokens())
+        return self.tokens
+
+    def _decode(self, start: int, end: int) -> str:
+        try:
+            return self.source[start:end].decode("utf-8")
+        except UnicodeDecodeError as e:
+            raise self._error("Invalid UTF-8", start + e.start) from None
+
+    def _fallback(self, pos: int) -> list[Token]:
+        """Lex one lexeme at `pos` holding non-ASCII characters: its
+        bytes are decoded and handed to the per-character code."""
+        src = self.source
+        stop = _BYTE_RUN_RE.match(src, pos + 1).end()
+        text = self._decode(pos, stop)
+        # What _lex_one() may look at past the lexeme; never part of it
+        text += src[stop:stop + _LOOKAHEAD_MARGIN].decode("utf-8", "replace")
+        lexer = Lexer(text)
+        try:
+            lexer._lex_one()
+        except LexerError as e:
+            raise self._error(e.msg, pos + len(text[:e.col - 1].encode())) from None
+        for tok in lexer.tokens:
+            tok.offset = pos + len(text[:tok.offset].encode())
+            tok.end = pos + len(text[:tok.end].encode())
+            tok.lines = self.lines
+        self.pos = pos + len(text[:lexer.pos].encode())
+        return lexer.tokens
+
+    def iter_tokens(self) -> Iterator[Token]:
+        src = self.source
+        n = len(src)
+        match = _BYTE_MASTER_RE.match
+        word_types = _WORD_TYPES
+        ident = TokenType.IDENT
+        intern = NAMES
+        lines = self.lines
+        lazy_strings = self.lazy_strings
+        pos = self.pos
+
+        while True:
+            m = match(src, pos)
+            kind = m.lastgroup
+            pos = m.start(kind)
+            end = m.end()
+
+            if kind == "WORD":
+                if end < n and src[end] >= 0x80:
+                    yield from self._fallback(pos)
+                    end = self.pos
+                else:
+                    text = intern(m.group(kind).decode("ascii"))
+                    yield Token(word_types.get(text, ident), text, pos, end, lines)
+            elif kind == "OP1":
+                ttype, ch = _BYTE_SIMPLE_TOKENS[src[pos]]
+                yield Token(ttype, ch, pos, end, lines)
+            elif kind in ("NUMBER", "REF", "TAG", "VAR") and end < n and (
+                    src[end] >= 0x80
+                    or src[end] == 0x2E and end + 1 < n and src[end + 1] >= 0x80):
+                yield from self._fallback(pos)
+                end = self.pos
+            elif kind == "NUMBER":
+                digits, unit = m.group("DIGITS", "UNIT")
+                if unit is None:
+                    yield Token(TokenType.NUMBER, digits.decode("ascii"), pos, end, lines)
+                else:
+                    split = pos + len(digits)
+                    yield Token(TokenType.NUMBER, digits.decode("ascii"), pos, split, lines)
+                    yield Token(TokenType.UNIT, _BYTE_UNITS[unit], split, end, lines)
+            elif kind == "NEWLINE":
+                yield Token(TokenType.NEWLINE, "\n", pos, end, lines)
+            elif kind in _SIGIL_TYPES:
+                yield Token(_SIGIL_TYPES[kind], intern(m.group(kind).decode("ascii")), pos, end,
+                            lines)
+            elif kind == "STRING":
+                value = None if lazy_strings else _unescape(self._decode(pos + 1, end - 1))
+                yield Token(TokenType.STRING, value, pos, end, lines)
+            elif kind == "OP2":
+                ttype, op = _BYTE_OPERATORS[m.group(kind)]
+                yield Token(ttype, op, pos, end, lines)
+            elif kind == "UNDERSCORE":
+                yield Token(TokenType.UNDERSCORE, "_", pos, end, lines)
+            elif kind == "COMMENT":
+                depth = 1
+                while depth:
+                    delim = _BYTE_COMMENT_DELIM_RE.search(src, end)
+                    if delim is None:
+                        raise self._error("Unterminated comment", pos)
+                    depth += 1 if delim.group() == b"(*" else -1
+                    end = delim.end()
+            elif kind == "END":
+                break
+            elif src[pos] == 0x22:
+                raise self._error("Unterminated string", n)
+            else:
+                yield from self._fallback(pos)
+                end = self.pos
+            pos = end
+
+        self.pos = n
+        yield Token(TokenType.EOF, "", n, n, lines)
+
+
+# ── Symbol dictionary ────────────────────────────────────────────────
+#
+# In a long conversation the same @refs, #tags and record keys recur in
+# every message. A SymbolEncoder / SymbolDecoder pair (one per `ctx`,
+# each end holding its own) numbers every symbol on first use; later
+# uses may then be written as the aliases `@12`, `#12` and `12:` (a key,
+# meta key or argument name). Both ends record the same uses in the same
+# order and evict the same entries, so the tables are never sent.
+#
+# Plain AXON is valid dictionary text, so falling back to it is always
+# possible: for a single message, for a peer that does not keep a
+# dictionary, or after an error, when both ends reset().
+
+class SymbolDictionary:
+    """Symbols in least-recently-used order, each with a stable index.
+
+    A new symbol takes the next free index until `maxsize` symbols are
+    held, then the index of the least recently used one, which is
+    evicted. Dictionaries fed the same uses hold the same entries.
+    """
+
+    def __init__(self, maxsize: int = 1000):
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be positive, got {maxsize}")
+        self.maxsize = maxsize
+        self._indices: OrderedDict[str, int] = OrderedDict()
+        self._names: list[str] = []
+
+    def use(self, name: str) -> int | None:
+        """Record a use of `name`; return its index if it had one already."""
+        indices = self._indices
+        index = indices.get(name)
+        if index is not None:
+            indices.move_to_end(name)
+            return index
+        if len(self._names) < self.maxsize:
+            indices[name] = len(self._names)
+            self._names.append(name)
+        else:
+            _, free = indices.popitem(last=False)
+            indices[name] = free
+            self._names[free] = name
+        return None
+
+    def name(self, index: int) -> str:
+        """The symbol holding `index` (IndexError if none does)."""
+        if index >= len(self._names):
+            raise IndexError(f"no symbol {index}")
+        return self._names[index]
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def reset(self):
+        self._indices.clear()
+        self._names = []
+
+
+def _symbol_uses(tokens: list[Token]) -> list[Token]:
+    """The tokens of `tokens` (without NEWLINE) that use a symbol, in order.
+
+    A REF (but not the wildcard @*) or TAG, and the IDENT, or NUMBER
+    alias, before a COLON.
+    """
+    uses = []
+    prev = None
+    for tok in tokens:
+        ttype = tok.type
+        if ttype is TokenType.REF or ttype is TokenType.TAG:
+            if tok.value != "@*":
+                uses.append(tok)
+        elif ttype is TokenType.COLON and prev is not None:
+            if prev.type is TokenType.IDENT or (
+                    prev.type is TokenType.NUMBER and prev.value.isdigit()):
+                uses.append(prev)
+        prev = tok
+    return uses
+
+
+def _is_alias(tok: Token) -> bool:
+    if tok.type is TokenType.IDENT:
+        return False
+    return tok.type is TokenType.NUMBER or "0" <= tok.value[1] <= "9"
+
+
+class _AliasLexer(RegexLexer):
+    """RegexLexer that also reads the aliases `@12` and `#12`."""
 
-            # Single-character tokens
-            simple = {
-                "(": TokenType.LPAREN, ")": TokenType.RPAREN,
-                "[": TokenType.LBRACKET, "]": TokenType.RBRACKET,
-                "{": TokenType.LBRACE, "}": TokenType.RBRACE,
-                ":": TokenType.COLON, ",": TokenType.COMMA,
-                ">": TokenType.GT, "<": TokenType.LT,
-                "&": TokenType.AMP, "|": TokenType.PIPE,
-                "!": TokenType.BANG, "?": TokenType.QUESTION,
-                "~": TokenType.TILDE, "^": TokenType.CARET,
-                "=": TokenType.EQ, ".": TokenType.DOT,
-                "*": TokenType.STAR, "+": TokenType.PLUS,
-                "-": TokenType.MINUS, "/": TokenType.SLASH,
-            }
-            if ch in simple:
+    def _lex_one(self):
+        ch = self._peek()
+        if ch in ("@", "#") and "0" <= (self._peek_at(1) or "") <= "9":
+            start = self.pos
+            self._advance()
+            while "0" <= (self._peek() or "") <= "9":
                 self._advance()
-                self._emit(simple[ch], ch, line, col)
+            ttype = TokenType.REF if ch == "@" else TokenType.TAG
+            self.tokens.append(Token(ttype, self.source[start:self.pos], start, self.pos, self.lines))
+            return
+        super()._lex_one()
+
+
+class SymbolEncoder:
+    """Sending end of a dictionary-coded conversation."""
+
+    def __init__(self, maxsize: int = 1000):
+        self.symbols = SymbolDictionary(maxsize)
+
+    def encode(self, source: str, plain: bool = False) -> str:
+        """`source` (plain AXON) with symbols seen before written as
+        aliases, where the alias is shorter.
+
+        With `plain` the text is returned unchanged, but its symbols are
+        still recorded, as the receiving decoder will record them.
+        """
+        newline = TokenType.NEWLINE
+        tokens = [tok for tok in RegexLexer(source).iter_tokens() if tok.type is not newline]
+        uses = _symbol_uses(tokens)
+        for tok in uses:
+            if tok.type is TokenType.NUMBER:
+                raise ParseError("Expected identifier", tok)
+        use = self.symbols.use
+        out = []
+        pos = 0
+        for tok in uses:
+            name = tok.value
+            index = use(name)
+            if index is None or plain:
                 continue
+            alias = str(index) if tok.type is TokenType.IDENT else name[0] + str(index)
+            if len(alias) < len(name):
+                out.append(source[pos:tok.offset])
+                out.append(alias)
+                pos = tok.offset + len(name)
+        if not out:
+            return source
+        out.append(source[pos:])
+        return "".join(out)
+
+
+class SymbolDecoder:
+    """Receiving end of a dictionary-coded conversation.
+
+    Any error leaves the dictionary empty: the sender, told by a NAK,
+    resets its encoder to match.
+    """
+
+    def __init__(self, maxsize: int = 1000):
+        self.symbols = SymbolDictionary(maxsize)
+
+    def decode(self, source: str, limits: ParseLimits | None = None) -> list[Message]:
+        """Parse dictionary-coded (or plain) AXON text."""
+        symbols = self.symbols
+        try:
+            newline = TokenType.NEWLINE
+            tokens = [tok for tok in _AliasLexer(source).iter_tokens() if tok.type is not newline]
+            for tok in _symbol_uses(tokens):
+                if _is_alias(tok):
+                    index = int(tok.value if tok.type is TokenType.NUMBER else tok.value[1:])
+                    try:
+                        name = symbols.name(index)
+                    except IndexError:
+                        raise ParseError(f"Unknown alias {tok.value!r}", tok) from None
+                    if tok.type is TokenType.NUMBER:
+                        if name[0] in "@#":
+                            raise ParseError(f"Alias {tok.value!r} is not a key", tok)
+                        tok.type = TokenType.IDENT
+                    elif name[0] != tok.value[0]:
+                        raise ParseError(f"Alias {tok.value!r} is {name!r}", tok)
+                    tok.value = name
+                symbols.use(tok.value)
+            return _new_parser(tokens, limits).parse()
+        except (LexerError, ParseError):
+            symbols.reset()
+            raise
 
-            raise LexerError(f"Unexpected character: {ch!r}", line, col)
 
-        self._emit(TokenType.EOF, "", self.line, self.col)
-        return self.tokens
+# ── AST Nodes ────────────────────────────────────────────────────────
+#
+# Nodes are slotted: no per-instance __dict__, so a parsed message costs
+# a fraction of the memory. Fields and equality are plain dataclass ones.
+#
+# Every node built by the parser also records its source span: `offset`
+# of its first character (the int object of its first token) and its
+# `length`, which for all but the largest nodes is one of CPython's
+# cached small ints, so a span costs two slots and one int. `end_offset`
+# and `span` are derived. A parenthesised expression's span includes the
+# parentheses. Nodes built in code have offset -1 and length 0. Spans
+# are keyword only and take no part in equality or repr.
+
+@dataclass(slots=True)
+class ASTNode:
+    offset: int = field(default=-1, kw_only=True, compare=False, repr=False)
+    length: int = field(default=0, kw_only=True, compare=False, repr=False)
 
+    @property
+    def end_offset(self) -> int:
+        return self.offset + self.length
 
-# ── AST Nodes ────────────────────────────────────────────────────────
+    @end_offset.setter
+    def end_offset(self, end: int):
+        self.length = end - self.offset
 
-@dataclass
-class ASTNode:
-    pass
+    @property
+    def span(self) -> tuple[int, int]:
+        """(offset, end_offset): source[slice(*node.span)] is its text."""
+        return self.offset, self.offset + self.length
 
-@dataclass
+@dataclass(slots=True)
 class StringLiteral(ASTNode):
     value: str
 
-@dataclass
+@dataclass(slots=True)
 class NumberLiteral(ASTNode):
     value: float
     unit: str | None = None
 
-@dataclass
+@dataclass(slots=True)
 class BooleanLiteral(ASTNode):
     value: bool
 
-@dataclass
+@dataclass(slots=True)
 class NullLiteral(ASTNode):
     pass
 
-@dataclass
+@dataclass(slots=True)
 class Reference(ASTNode):
     name: str
 
-@dataclass
+@dataclass(slots=True)
 class Tag(ASTNode):
     name: str
     body: ASTNode | None = None
 
-@dataclass
+@dataclass(slots=True)
 class Variable(ASTNode):
     name: str
 
-@dataclass
+@dataclass(slots=True)
 class Identifier(ASTNode):
     name: str
 
-@dataclass
+@dataclass(slots=True)
 class ListExpr(ASTNode):
     elements: list[ASTNode]
 
-@dataclass
+@dataclass(slots=True)
 class RecordExpr(ASTNode):
     fields: dict[str, ASTNode]
 
-@dataclass
+@dataclass(slots=True)
 class RangeExpr(ASTNode):
     start: ASTNode
     end: ASTNode
 
-@dataclass
+@dataclass(slots=True)
 class CallExpr(ASTNode):
     func: str
     args: list[ASTNode]
 
-@dataclass
+@dataclass(slots=True)
 class NamedArg(ASTNode):
     name: str
     value: ASTNode
 
-@dataclass
+@dataclass(slots=True)
 class BinaryExpr(ASTNode):
     op: str
     left: ASTNode
     right: ASTNode
 
-@dataclass
+@dataclass(slots=True)
 class PathExpr(ASTNode):
     parts: list[str]
 
-@dataclass
+@dataclass(slots=True)
 class Routing(ASTNode):
     sender: str | list[str]
     receiver: str | list[str]
 
-@dataclass
+@dataclass(slots=True)
 class MetaBlock(ASTNode):
     fields: dict[str, ASTNode]
 
-@dataclass
+@dataclass(slots=True)
 class Message(ASTNode):
     performative: str
     routing: Routing
@@ -463,31 +1254,209 @@ class Message(ASTNode):
     meta: MetaBlock | None = None
 
 
+# ── Lazy literals ────────────────────────────────────────────────────
+#
+# With parse(lazy_literals=True) string and number literals keep a view
+# of their source text; unescaping and numeric conversion happen on the
+# first read of `value`. Literals a router never reads cost no copy.
+
+def _number_value(text: str) -> int | float:
+    return float(text) if "." in text else int(text)
+
+
+def _string_at(source: str | bytes, offset: int) -> str:
+    """The value of the string literal whose opening quote is at `offset`."""
+    start = offset + 1
+    if not isinstance(source, str):
+        end = _BYTE_STRING_BODY_RE.match(source, start).end()
+        return _unescape(source[start:end].decode("utf-8"))
+    end = _STRING_BODY_RE.match(source, start).end()
+    return _unescape(source[start:end])
+
+
+def _span_state(node: ASTNode) -> tuple:
+    """Pickle state restoring the span of a node reduced to its base class."""
+    return None, {"offset": node.offset, "length": node.length}
+
+
+_STRING_VALUE = StringLiteral.__dict__["value"]
+_NUMBER_VALUE = NumberLiteral.__dict__["value"]
+
+
+class LazyString(StringLiteral):
+    """A StringLiteral that reads its value from the source on first access.
+
+    Only the source and the offset of the opening quote are kept, apart
+    from the span, which a grouping `(...)` widens; an escape-free body
+    becomes the value in one slice. Compares equal to the eager
+    StringLiteral, and pickles as one.
+    """
+
+    __slots__ = ("_source", "_quote")
+
+    def __init__(self, source: str, offset: int, end_offset: int = -1):
+        self._source = source
+        self._quote = offset
+        self.offset = offset
+        self.end_offset = end_offset
+
+    @property
+    def value(self) -> str:
+        try:
+            return _STRING_VALUE.__get__(self)
+        except AttributeError:
+            pass
+        value = _string_at(self._source, self._quote)
+        _STRING_VALUE.__set__(self, value)
+        return value
+
+    @value.setter
+    def value(self, value: str):
+        _STRING_VALUE.__set__(self, value)
+
+    def __eq__(self, other):
+        if not isinstance(other, StringLiteral):
+            return NotImplemented
+        return self.value == other.value
+
+    def __reduce__(self):
+        return (StringLiteral, (self.value,), _span_state(self))
+
+
+class LazyNumber(NumberLiteral):
+    """A NumberLiteral converted from its token text on first access.
+
+    Compares equal to the eager NumberLiteral, and pickles as one.
+    """
+
+    __slots__ = ("_text",)
+
+    def __init__(self, text: str, unit: str | None = None,
+                 offset: int = -1, end_offset: int = -1):
+        self._text = text
+        self.unit = unit
+        self.offset = offset
+        self.end_offset = end_offset
+
+    @property
+    def value(self) -> int | float:
+        try:
+            return _NUMBER_VALUE.__get__(self)
+        except AttributeError:
+            pass
+        value = _number_value(self._text)
+        _NUMBER_VALUE.__set__(self, value)
+        return value
+
+    @value.setter
+    def value(self, value: int | float):
+        _NUMBER_VALUE.__set__(self, value)
+
+    def __eq__(self, other):
+        if not isinstance(other, NumberLiteral):
+            return NotImplemented
+        return self.value == other.value and self.unit == other.unit
+
+    def __reduce__(self):
+        return (NumberLiteral, (self.value, self.unit), _span_state(self))
+
+
 # ── Parser ───────────────────────────────────────────────────────────
 
 class ParseError(Exception):
     def __init__(self, msg: str, token: Token):
-        super().__init__(f"Parse error at {token.line}:{token.col}: {msg} (got {token.type.value}: {token.value!r})")
+        value = token.value
+        if value is None and token.type is TokenType.STRING and token.lines is not None:
+            value = _string_at(token.lines.source, token.offset)  # a lazy string
+        super().__init__(f"Parse error at {token.line}:{token.col}: {msg} (got {token.type.value}: {value!r})")
+        self.msg = msg
         self.token = token
 
+    def __reduce__(self):
+        return (type(self), (self.msg, self.token))
+
+
+class LimitExceeded(ParseError):
+    """A ParseLimits bound was hit; `limit` names the field."""
+
+    def __init__(self, limit: str, bound: int, token: Token):
+        super().__init__(f"Input exceeds {limit}={bound}", token)
+        self.limit = limit
+        self.bound = bound
+
+    def __reduce__(self):
+        return (type(self), (self.limit, self.bound, self.token))
+
+
+@dataclass(frozen=True)
+class ParseLimits:
+    """Resource bounds for parsing untrusted input; None disables a bound.
+
+    max_depth counts frames on StackParser's explicit stack: an operand
+    of a binary or prefix operator takes one, a bracket or nested
+    message two. Token, size and string bounds apply per top-level
+    message; sizes are in characters of source text (bytes for ASCII).
+    """
+
+    max_depth: int | None = 512
+    max_tokens: int | None = 1_000_000
+    max_message_bytes: int | None = 16 * 1024 * 1024
+    max_string_length: int | None = 1024 * 1024
+
 
 class Parser:
-    def __init__(self, tokens: list[Token]):
-        self.tokens = [t for t in tokens if t.type not in (TokenType.NEWLINE,)]
-        self.pos = 0
+    """Recursive descent parser pulling tokens from any token iterable.
+
+    Tokens are consumed through a small lookahead buffer, so a lazy
+    stream such as RegexLexer.iter_tokens() is never materialised: only
+    the tokens of the message being parsed (plus LOOKAHEAD) are held.
+    """
+
+    # Deepest peek: _is_performative_start looks at X . domain . act (
+    LOOKAHEAD = 6
+
+    # Source text the tokens were read from, when literals are lazy (see
+    # parse(lazy_literals=True)); None builds plain literal nodes.
+    _literals: str | None = None
+
+    def __init__(self, tokens: Iterable[Token]):
+        self._tokens = iter(tokens)
+        self._buffer: deque[Token] = deque()
+        self._last: Token | None = None
+        self._fill(1)
+
+    def _fill(self, count: int):
+        """Pull from the token source until `count` tokens are buffered.
+
+        NEWLINE tokens are dropped here. Past the end of the source the
+        final token (EOF) is repeated, as with a list-backed parser.
+        """
+        buffer = self._buffer
+        newline = TokenType.NEWLINE
+        while len(buffer) < count:
+            for tok in self._tokens:
+                if tok.type is not newline:
+                    break
+            else:
+                if self._last is None:
+                    raise ValueError("Parser requires a non-empty token stream")
+                buffer.append(self._last)
+                continue
+            self._last = tok
+            buffer.append(tok)
 
     def _peek(self) -> Token:
-        return self.tokens[self.pos]
+        return self._buffer[0]
 
     def _peek_at(self, offset: int) -> Token:
-        idx = self.pos + offset
-        if idx < len(self.tokens):
-            return self.tokens[idx]
-        return self.tokens[-1]
+        if offset >= len(self._buffer):
+            self._fill(offset + 1)
+        return self._buffer[offset]
 
     def _advance(self) -> Token:
-        tok = self.tokens[self.pos]
-        self.pos += 1
+        tok = self._buffer.popleft()
+        if not self._buffer:
+            self._fill(1)
         return tok
 
     def _expect(self, ttype: TokenType) -> Token:
@@ -504,10 +1473,12 @@ class Parser:
     # ── Top-level ────────────────────────────────────────────────────
 
     def parse(self) -> list[Message]:
-        messages = []
+        return list(self.iter_messages())
+
+    def iter_messages(self) -> Iterator[Message]:
+        """Yield each top-level message as soon as it has been parsed."""
         while self._peek().type != TokenType.EOF:
-            messages.append(self._parse_message())
-        return messages
+            yield self._parse_message()
 
     def _is_performative_start(self) -> bool:
         if self._peek().type == TokenType.PERFORMATIVE:
@@ -554,24 +1525,31 @@ class Parser:
         domain = self._expect(TokenType.IDENT)
         self._expect(TokenType.DOT)
         act = self._expect(TokenType.IDENT)
-        return f"X.{domain.value}.{act.value}"
+        return NAMES(f"X.{domain.value}.{act.value}")
 
     def _parse_message(self) -> Message:
+        start = self._peek().offset
         meta = None
         if self._peek().type == TokenType.LBRACKET:
             meta = self._parse_meta()
+        perf, routing = self._parse_header()
+        content = self._parse_expression()
+        return Message(performative=perf, routing=routing, content=content, meta=meta,
+                       offset=start, length=content.end_offset - start)
+
+    def _parse_header(self) -> tuple[str, Routing]:
+        """Parse `PERF(routing):`, everything of a message but content."""
         perf = self._parse_performative()
         self._expect(TokenType.LPAREN)
         routing = self._parse_routing()
         self._expect(TokenType.RPAREN)
         self._expect(TokenType.COLON)
-        content = self._parse_expression()
-        return Message(performative=perf, routing=routing, content=content, meta=meta)
+        return perf, routing
 
     # ── Metadata ─────────────────────────────────────────────────────
 
     def _parse_meta(self) -> MetaBlock:
-        self._expect(TokenType.LBRACKET)
+        start = self._expect(TokenType.LBRACKET).offset
         fields = {}
         while self._peek().type != TokenType.RBRACKET:
             if fields:
@@ -588,18 +1566,20 @@ class Parser:
             self._expect(TokenType.COLON)
             val = self._parse_expression()
             fields[key] = val
-        self._expect(TokenType.RBRACKET)
-        return MetaBlock(fields=fields)
+        end = self._expect(TokenType.RBRACKET).end
+        return MetaBlock(fields=fields, offset=start, length=end - start)
 
     # ── Routing ──────────────────────────────────────────────────────
 
     def _parse_routing(self) -> Routing:
-        sender = self._parse_endpoint()
+        start = self._peek().offset
+        sender, _ = self._parse_endpoint()
         self._expect(TokenType.GT)
-        receiver = self._parse_endpoint()
-        return Routing(sender=sender, receiver=receiver)
+        receiver, end = self._parse_endpoint()
+        return Routing(sender=sender, receiver=receiver, offset=start, length=end - start)
 
-    def _parse_endpoint(self) -> str | list[str]:
+    def _parse_endpoint(self) -> tuple[str | list[str], int]:
+        """An endpoint and the offset just past it."""
         if self._peek().type == TokenType.LBRACKET:
             self._advance()
             agents = []
@@ -608,17 +1588,15 @@ class Parser:
                     self._expect(TokenType.COMMA)
                 ref = self._expect(TokenType.REF)
                 agents.append(ref.value)
-            self._advance()
-            return agents
+            return agents, self._advance().end
         elif self._peek().type == TokenType.STAR:
-            self._advance()
-            return "*"
+            return "*", self._advance().end
         ref = self._expect(TokenType.REF)
-        return ref.value
+        return ref.value, ref.end
 
-    # ── Expressions (precedence-based) ───────────────────────────────
+    # ── Expressions (precedence climbing) ────────────────────────────
     #
-    # Precedence (lowest to highest):
+    # Binary operators are driven by BINARY_OPERATORS (spec §5):
     #   1: <-  (right-associative, causation)
     #   2: ->  (left-associative, sequence)
     #   3: &   (left-associative, parallel)
@@ -628,78 +1606,50 @@ class Parser:
     #   7: * /  (left-associative, multiplicative)
     #   8: ..  (non-associative, range)
     #   9: ~ ! - (prefix), primaries
+    #
+    # A primary followed by no operator costs one table lookup. After an
+    # operator at some level only operators at a lower level (or the same
+    # level, if left-associative) may continue the operand; "a < b < c"
+    # stops before the second "<", exactly like a level-per-method parser.
 
-    def _parse_expression(self) -> ASTNode:
-        return self._parse_causal()
-
-    def _parse_causal(self) -> ASTNode:
-        parts = [self._parse_sequence()]
-        while self._peek().type == TokenType.BACKARROW:
-            self._advance()
-            parts.append(self._parse_sequence())
-        # Right-associate: a <- b <- c = a <- (b <- c)
-        result = parts[-1]
-        for i in range(len(parts) - 2, -1, -1):
-            result = BinaryExpr(op="<-", left=parts[i], right=result)
-        return result
-
-    def _parse_sequence(self) -> ASTNode:
-        left = self._parse_parallel()
-        while self._peek().type == TokenType.ARROW:
-            self._advance()
-            right = self._parse_parallel()
-            left = BinaryExpr(op="->", left=left, right=right)
-        return left
-
-    def _parse_parallel(self) -> ASTNode:
-        left = self._parse_disjunction()
-        while self._peek().type == TokenType.AMP:
-            self._advance()
-            right = self._parse_disjunction()
-            left = BinaryExpr(op="&", left=left, right=right)
-        return left
-
-    def _parse_disjunction(self) -> ASTNode:
-        left = self._parse_comparison()
-        while self._peek().type == TokenType.PIPE:
-            self._advance()
-            right = self._parse_comparison()
-            left = BinaryExpr(op="|", left=left, right=right)
-        return left
-
-    def _parse_comparison(self) -> ASTNode:
-        left = self._parse_additive()
-        comp_ops = {TokenType.LT, TokenType.GT, TokenType.LTE,
-                    TokenType.GTE, TokenType.NEQ, TokenType.EQ}
-        if self._peek().type in comp_ops:
-            op = self._advance()
-            right = self._parse_additive()
-            return BinaryExpr(op=op.value, left=left, right=right)
-        return left
-
-    def _parse_additive(self) -> ASTNode:
-        left = self._parse_multiplicative()
-        while self._peek().type in (TokenType.PLUS, TokenType.MINUS):
-            op = self._advance()
-            right = self._parse_multiplicative()
-            left = BinaryExpr(op=op.value, left=left, right=right)
-        return left
-
-    def _parse_multiplicative(self) -> ASTNode:
-        left = self._parse_range()
-        while self._peek().type in (TokenType.STAR, TokenType.SLASH):
-            op = self._advance()
-            right = self._parse_range()
-            left = BinaryExpr(op=op.value, left=left, right=right)
-        return left
-
-    def _parse_range(self) -> ASTNode:
+    def _parse_expression(self, min_level: int = 1) -> ASTNode:
         left = self._parse_primary()
-        if self._peek().type == TokenType.DOTDOT:
+        ceiling = _MAX_LEVEL
+        while True:
+            tok = self._buffer[0]
+            entry = BINARY_OPERATORS.get(tok.type)
+            if entry is None:
+                return left
+            level, assoc = entry
+            if level < min_level or level >= ceiling:
+                return left
             self._advance()
-            right = self._parse_primary()
-            return RangeExpr(start=left, end=right)
-        return left
+            if assoc == "right":
+                # A run of right-associative operators is read in a loop
+                # and folded from the right, so a long chain costs no
+                # stack depth
+                ops, operands = [tok], [self._parse_expression(level + 1)]
+                while BINARY_OPERATORS.get(self._buffer[0].type) == entry:
+                    ops.append(self._advance())
+                    operands.append(self._parse_expression(level + 1))
+                right = operands.pop()
+                while len(ops) > 1:
+                    op, operand = ops.pop(), operands.pop()
+                    right = BinaryExpr(op=op.value, left=operand, right=right,
+                                       offset=operand.offset,
+                                       length=right.end_offset - operand.offset)
+            else:
+                right = self._parse_expression(level + 1)
+            if tok.type is TokenType.DOTDOT:
+                left = RangeExpr(start=left, end=right,
+                                 offset=left.offset, length=right.end_offset - left.offset)
+            else:
+                left = BinaryExpr(op=tok.value, left=left, right=right,
+                                  offset=left.offset, length=right.end_offset - left.offset)
+            # The right operand took every operator above `level` it
+            # could; any left over was refused by a non-associative
+            # operator and must not be taken here either.
+            ceiling = level + 1 if assoc == "left" else level
 
     # ── Primary expressions ──────────────────────────────────────────
 
@@ -710,22 +1660,26 @@ class Parser:
         if tok.type == TokenType.TILDE:
             self._advance()
             inner = self._parse_primary()
-            return CallExpr(func="~", args=[inner])
+            return CallExpr(func="~", args=[inner],
+                            offset=tok.offset, length=inner.end_offset - tok.offset)
 
         # Prefix ! (negation)
         if tok.type == TokenType.BANG:
             self._advance()
             inner = self._parse_primary()
-            return CallExpr(func="!", args=[inner])
+            return CallExpr(func="!", args=[inner],
+                            offset=tok.offset, length=inner.end_offset - tok.offset)
 
         # Prefix - (unary minus)
         if tok.type == TokenType.MINUS:
             self._advance()
             inner = self._parse_primary()
-            return CallExpr(func="neg", args=[inner])
+            return CallExpr(func="neg", args=[inner],
+                            offset=tok.offset, length=inner.end_offset - tok.offset)
 
         # Nested message
-        if self._is_performative_start():
+        if ((tok.type is TokenType.PERFORMATIVE or tok.type is TokenType.IDENT)
+                and self._is_performative_start()):
             return self._parse_nested_message()
 
         # Performative keyword used as function name in content (e.g., ACC("ok"))
@@ -736,7 +1690,7 @@ class Parser:
         if tok.type == TokenType.LPAREN:
             self._advance()
             expr = self._parse_expression()
-            self._expect(TokenType.RPAREN)
+            expr.offset, expr.end_offset = tok.offset, self._expect(TokenType.RPAREN).end
             return expr
 
         if tok.type == TokenType.LBRACE:
@@ -754,47 +1708,52 @@ class Parser:
         return self._parse_atom()
 
     def _parse_nested_message(self) -> Message:
-        perf = self._parse_performative()
-        self._expect(TokenType.LPAREN)
-        routing = self._parse_routing()
-        self._expect(TokenType.RPAREN)
-        self._expect(TokenType.COLON)
+        start = self._peek().offset
+        perf, routing = self._parse_header()
         content = self._parse_expression()
-        return Message(performative=perf, routing=routing, content=content)
+        return Message(performative=perf, routing=routing, content=content,
+                       offset=start, length=content.end_offset - start)
 
     def _parse_atom(self) -> ASTNode:
         tok = self._peek()
 
         if tok.type == TokenType.STRING:
             self._advance()
-            return StringLiteral(value=tok.value)
+            if self._literals is not None:
+                return LazyString(self._literals, tok.offset, tok.end)
+            return StringLiteral(value=tok.value, offset=tok.offset, length=tok.end - tok.offset)
 
         if tok.type == TokenType.NUMBER:
             self._advance()
-            val = float(tok.value) if "." in tok.value else int(tok.value)
             unit = None
+            end = tok.end
             if self._peek().type == TokenType.UNIT:
-                unit = self._advance().value
-            return NumberLiteral(value=val, unit=unit)
+                unit_tok = self._advance()
+                unit, end = unit_tok.value, unit_tok.end
+            if self._literals is not None:
+                return LazyNumber(tok.value, unit, tok.offset, end)
+            val = float(tok.value) if "." in tok.value else int(tok.value)
+            return NumberLiteral(value=val, unit=unit, offset=tok.offset, length=end - tok.offset)
 
         if tok.type == TokenType.BOOLEAN:
             self._advance()
-            return BooleanLiteral(value=tok.value == "T")
+            return BooleanLiteral(value=tok.value == "T",
+                                  offset=tok.offset, length=tok.end - tok.offset)
 
         if tok.type == TokenType.UNDERSCORE:
             self._advance()
-            return NullLiteral()
+            return NullLiteral(offset=tok.offset, length=tok.end - tok.offset)
 
         if tok.type == TokenType.REF:
             self._advance()
-            return Reference(name=tok.value)
+            return Reference(name=tok.value, offset=tok.offset, length=tok.end - tok.offset)
 
         if tok.type == TokenType.TAG:
             return self._parse_tag()
 
         if tok.type == TokenType.VAR:
             self._advance()
-            return Variable(name=tok.value)
+            return Variable(name=tok.value, offset=tok.offset, length=tok.end - tok.offset)
 
         if tok.type == TokenType.IDENT:
             return self._parse_ident_or_call()
@@ -803,40 +1762,45 @@ class Parser:
 
     def _parse_tag(self) -> Tag:
         tok = self._advance()
-        body = None
         if self._peek().type == TokenType.LBRACE:
             body = self._parse_record()
-        return Tag(name=tok.value, body=body)
+            return Tag(name=tok.value, body=body,
+                       offset=tok.offset, length=body.end_offset - tok.offset)
+        return Tag(name=tok.value, body=None, offset=tok.offset, length=tok.end - tok.offset)
 
     def _parse_ident_or_call(self) -> ASTNode:
-        tok = self._advance()
-        if self._peek().type == TokenType.DOT:
-            parts = [tok.value]
-            while self._peek().type == TokenType.DOT:
-                self._advance()
-                next_tok = self._peek()
-                if next_tok.type in (TokenType.IDENT, TokenType.PERFORMATIVE):
-                    parts.append(self._advance().value)
-                else:
-                    raise ParseError("Expected identifier after '.'", next_tok)
-            if self._peek().type == TokenType.LPAREN:
-                return self._parse_call_args(".".join(parts))
-            return PathExpr(parts=parts)
-
+        start = self._peek().offset
+        parts, end = self._parse_name_parts()
         if self._peek().type == TokenType.LPAREN:
-            return self._parse_call_args(tok.value)
-
-        return Identifier(name=tok.value)
+            return self._parse_call_args(
+                parts[0] if len(parts) == 1 else NAMES(".".join(parts)), start)
+        if len(parts) > 1:
+            return PathExpr(parts=parts, offset=start, length=end - start)
+        return Identifier(name=parts[0], offset=start, length=end - start)
+
+    def _parse_name_parts(self) -> tuple[list[str], int]:
+        """Parse a name and any `.part` suffixes (a path or call target);
+        returns the parts and the offset just past the last one."""
+        tok = self._advance()
+        parts = [tok.value]
+        while self._peek().type == TokenType.DOT:
+            self._advance()
+            tok = self._peek()
+            if tok.type in (TokenType.IDENT, TokenType.PERFORMATIVE):
+                parts.append(self._advance().value)
+            else:
+                raise ParseError("Expected identifier after '.'", tok)
+        return parts, tok.end
 
-    def _parse_call_args(self, func_name: str) -> CallExpr:
+    def _parse_call_args(self, func_name: str, start: int) -> CallExpr:
         self._expect(TokenType.LPAREN)
         args = []
         while self._peek().type != TokenType.RPAREN:
             if args:
                 self._expect(TokenType.COMMA)
             args.append(self._parse_argument())
-        self._expect(TokenType.RPAREN)
-        return CallExpr(func=func_name, args=args)
+        end = self._expect(TokenType.RPAREN).end
+        return CallExpr(func=func_name, args=args, offset=start, length=end - start)
 
     def _parse_argument(self) -> ASTNode:
         """Parse a function argument: named (ident:expr / $var:expr) or positional."""
@@ -845,21 +1809,22 @@ class Parser:
             name = self._advance()
             self._advance()  # consume colon
             value = self._parse_expression()
-            return NamedArg(name=name.value, value=value)
+            return NamedArg(name=name.value, value=value,
+                            offset=name.offset, length=value.end_offset - name.offset)
         return self._parse_expression()
 
     def _parse_list(self) -> ListExpr:
-        self._expect(TokenType.LBRACKET)
+        start = self._expect(TokenType.LBRACKET).offset
         elements = []
         while self._peek().type != TokenType.RBRACKET:
             if elements:
                 self._expect(TokenType.COMMA)
             elements.append(self._parse_expression())
-        self._expect(TokenType.RBRACKET)
-        return ListExpr(elements=elements)
+        end = self._expect(TokenType.RBRACKET).end
+        return ListExpr(elements=elements, offset=start, length=end - start)
 
     def _parse_record(self) -> RecordExpr:
-        self._expect(TokenType.LBRACE)
+        start = self._expect(TokenType.LBRACE).offset
         fields = {}
         while self._peek().type != TokenType.RBRACE:
             if fields:
@@ -868,18 +1833,794 @@ class Parser:
             self._expect(TokenType.COLON)
             val = self._parse_expression()
             fields[key.value] = val
-        self._expect(TokenType.RBRACE)
-        return RecordExpr(fields=fields)
+        end = self._expect(TokenType.RBRACE).end
+        return RecordExpr(fields=fields, offset=start, length=end - start)
+
+
+# ── Explicit-stack parsing ───────────────────────────────────────────
+
+# Frame kinds on StackParser's stack. Frames are lists, mutated in place:
+#   [_EXPR, min_level, ceiling, left, op]   operator loop of _parse_expression
+#   [_PREFIX, func, start]                  ~ ! - awaiting their operand
+#   [_GROUP, start]                         ( expr )
+#   [_TAG, name, start]                     #tag{...}
+#   [_NESTED, performative, routing, start] nested message content
+#   [_LIST, elements, start]
+#   [_RECORD, fields, key, start]
+#   [_CALL, func, args, arg_name, start, arg_start]
+# where start is the offset the node's span begins at.
+_EXPR, _PREFIX, _GROUP, _TAG, _NESTED, _LIST, _RECORD, _CALL = range(8)
+
+_PREFIX_FUNCS = {TokenType.TILDE: "~", TokenType.BANG: "!", TokenType.MINUS: "neg"}
+
+
+class StackParser(Parser):
+    """Parser that keeps its own stack instead of recursing, under limits.
+
+    Expressions are parsed by a loop over an explicit frame stack, so
+    nesting depth is bounded by `limits.max_depth` rather than by the
+    interpreter's recursion limit; with max_depth=None any depth
+    parses. The resulting ASTs and errors are exactly those of Parser.
+    Every bound is checked as the token that crosses it is consumed,
+    raising LimitExceeded in O(1).
+    """
+
+    def __init__(self, tokens: Iterable[Token], limits: ParseLimits | None = None):
+        super().__init__(tokens)
+        self.limits = limits if limits is not None else ParseLimits()
+        self._count = 0
+        self._msg_start = 0
+
+    def _advance(self) -> Token:
+        tok = self._buffer.popleft()
+        if not self._buffer:
+            self._fill(1)
+        limits = self.limits
+        self._count += 1
+        if limits.max_tokens is not None and self._count > limits.max_tokens:
+            raise LimitExceeded("max_tokens", limits.max_tokens, tok)
+        if (limits.max_message_bytes is not None
+                and tok.offset - self._msg_start > limits.max_message_bytes):
+            raise LimitExceeded("max_message_bytes", limits.max_message_bytes, tok)
+        if tok.type is TokenType.STRING and limits.max_string_length is not None:
+            if tok.value is not None:
+                length = len(tok.value)
+            else:
+                # A body never decodes to more characters than it spans
+                # between its quotes, so only a long one is decoded
+                length = tok.end - tok.offset - 2
+                if length > limits.max_string_length:
+                    length = len(_string_at(self._literals, tok.offset))
+            if length > limits.max_string_length:
+                raise LimitExceeded("max_string_length", limits.max_string_length, tok)
+        return tok
+
+    def _parse_message(self) -> Message:
+        self._begin_message(self._buffer[0].offset)
+        return super()._parse_message()
+
+    def _begin_message(self, offset: int):
+        """Reset the per-message bounds for a message starting at `offset`."""
+        self._count = 0
+        self._msg_start = offset
+
+    def _parse_expression(self, min_level: int = 1) -> ASTNode:
+        max_depth = self.limits.max_depth
+        buffer = self._buffer
+        stack = [[_EXPR, min_level, _MAX_LEVEL, None, None]]
+        while True:
+            # Descend until a complete primary is in hand.
+            value = None
+            while value is None:
+                if max_depth is not None and len(stack) > max_depth:
+                    raise LimitExceeded("max_depth", max_depth, buffer[0])
+                value = self._open_primary(stack)
+
+            # Hand it upwards until some frame needs more input.
+            while True:
+                frame = stack[-1]
+                kind = frame[0]
+                if kind is _EXPR:
+                    op = frame[4]
+                    if op is not None:
+                        level, assoc = BINARY_OPERATORS[op.type]
+                        left = frame[3]
+                        if op.type is TokenType.DOTDOT:
+                            value = RangeExpr(start=left, end=value, offset=left.offset,
+                                              length=value.end_offset - left.offset)
+                        else:
+                            value = BinaryExpr(op=op.value, left=left, right=value,
+                                               offset=left.offset,
+                                               length=value.end_offset - left.offset)
+                        frame[2] = level + 1 if assoc == "left" else level
+                    tok = buffer[0]
+                    entry = BINARY_OPERATORS.get(tok.type)
+                    if entry is not None and frame[1] <= entry[0] < frame[2]:
+                        self._advance()
+                        level, assoc = entry
+                        frame[3], frame[4] = value, tok
+                        stack.append([_EXPR, level if assoc == "right" else level + 1,
+                                      _MAX_LEVEL, None, None])
+                        break
+                    stack.pop()
+                    if not stack:
+                        return value
+                    continue
+                if kind is _PREFIX:
+                    value = CallExpr(func=frame[1], args=[value],
+                                     offset=frame[2], length=value.end_offset - frame[2])
+                elif kind is _GROUP:
+                    value.offset = frame[1]
+                    value.end_offset = self._expect(TokenType.RPAREN).end
+                elif kind is _TAG:
+                    value = Tag(name=frame[1], body=value,
+                                offset=frame[2], length=value.end_offset - frame[2])
+                elif kind is _NESTED:
+                    value = Message(performative=frame[1], routing=frame[2], content=value,
+                                    offset=frame[3], length=value.end_offset - frame[3])
+                else:
+                    if kind is _LIST:
+                        frame[1].append(value)
+                    elif kind is _RECORD:
+                        frame[1][frame[2]] = value
+                    elif frame[3] is not None:
+                        frame[2].append(NamedArg(name=frame[3], value=value, offset=frame[5],
+                                                 length=value.end_offset - frame[5]))
+                    else:
+                        frame[2].append(value)
+                    value = self._next_item(stack, frame)
+                    if value is None:
+                        break
+                stack.pop()
+
+    def _open_primary(self, stack: list) -> ASTNode | None:
+        """Start the primary at the current token, as _parse_primary does.
+
+        Returns the node if it is complete; otherwise pushes the frames
+        that will build it and returns None.
+        """
+        tok = self._buffer[0]
+        ttype = tok.type
+        start = tok.offset
+        if ttype in _PREFIX_FUNCS:
+            self._advance()
+            stack.append([_PREFIX, _PREFIX_FUNCS[ttype], start])
+            return None
+        if ttype is TokenType.PERFORMATIVE or ttype is TokenType.IDENT:
+            if self._is_performative_start():
+                perf, routing = self._parse_header()
+                stack.append([_NESTED, perf, routing, start])
+                stack.append([_EXPR, 1, _MAX_LEVEL, None, None])
+                return None
+            parts, end = self._parse_name_parts()
+            if self._peek().type == TokenType.LPAREN:
+                self._advance()
+                func = parts[0] if len(parts) == 1 else NAMES(".".join(parts))
+                return self._open_items(stack, [_CALL, func, [], None, start, -1])
+            if len(parts) > 1:
+                return PathExpr(parts=parts, offset=start, length=end - start)
+            return Identifier(name=parts[0], offset=start, length=end - start)
+        if ttype is TokenType.LPAREN:
+            self._advance()
+            stack.append([_GROUP, start])
+            stack.append([_EXPR, 1, _MAX_LEVEL, None, None])
+            return None
+        if ttype is TokenType.LBRACE:
+            self._advance()
+            return self._open_items(stack, [_RECORD, {}, None, start])
+        if ttype is TokenType.LBRACKET:
+            self._advance()
+            return self._open_items(stack, [_LIST, [], start])
+        if ttype is TokenType.TAG:
+            self._advance()
+            if self._peek().type == TokenType.LBRACE:
+                stack.append([_TAG, tok.value, start])
+                brace = self._advance()
+                return self._open_items(stack, [_RECORD, {}, None, brace.offset])
+            return Tag(name=tok.value, body=None, offset=start, length=tok.end - start)
+        return self._parse_atom()
+
+    def _open_items(self, stack: list, frame: list) -> ASTNode | None:
+        stack.append(frame)
+        value = self._next_item(stack, frame)
+        if value is not None:
+            stack.pop()
+        return value
+
+    def _next_item(self, stack: list, frame: list) -> ASTNode | None:
+        """Close a list/record/call frame, or set up its next item.
+
+        Mirrors the loops of _parse_list, _parse_record and
+        _parse_call_args: returns the finished node, or pushes an
+        expression frame for the next item and returns None.
+        """
+        kind = frame[0]
+        peek = self._buffer[0].type
+        if kind is _LIST:
+            if peek is TokenType.RBRACKET:
+                return ListExpr(elements=frame[1], offset=frame[2],
+                                length=self._advance().end - frame[2])
+            if frame[1]:
+                self._expect(TokenType.COMMA)
+        elif kind is _RECORD:
+            if peek is TokenType.RBRACE:
+                return RecordExpr(fields=frame[1], offset=frame[3],
+                                  length=self._advance().end - frame[3])
+            if frame[1]:
+                self._expect(TokenType.COMMA)
+            frame[2] = self._expect(TokenType.IDENT).value
+            self._expect(TokenType.COLON)
+        else:
+            if peek is TokenType.RPAREN:
+                return CallExpr(func=frame[1], args=frame[2], offset=frame[4],
+                                length=self._advance().end - frame[4])
+            if frame[2]:
+                self._expect(TokenType.COMMA)
+            frame[3] = None
+            if (self._peek().type in (TokenType.IDENT, TokenType.VAR)
+                    and self._peek_at(1).type == TokenType.COLON):
+                name = self._advance()
+                frame[3], frame[5] = name.value, name.offset
+                self._advance()  # consume colon
+        stack.append([_EXPR, 1, _MAX_LEVEL, None, None])
+        return None
+
+
+# ── Incremental parsing ──────────────────────────────────────────────
+
+# Tokens that can end an operand. A top-level message can only end after
+# one of these (a bare performative would start a nested message).
+_OPERAND_END = {
+    TokenType.RPAREN, TokenType.RBRACKET, TokenType.RBRACE,
+    TokenType.STRING, TokenType.NUMBER, TokenType.UNIT, TokenType.BOOLEAN,
+    TokenType.UNDERSCORE, TokenType.REF, TokenType.TAG, TokenType.VAR,
+    TokenType.IDENT,
+}
+
+_OPENERS = {TokenType.LPAREN, TokenType.LBRACKET, TokenType.LBRACE}
+_CLOSERS = {TokenType.RPAREN, TokenType.RBRACKET, TokenType.RBRACE}
+
+
+class IncrementalParser:
+    """Push-style parser for AXON arriving in arbitrary chunks.
+
+    feed() accepts str or bytes (UTF-8, decoded incrementally) and
+    returns the messages completed so far; close() returns the rest.
+    Text is lexed once by a ChunkLexer. Tokens are framed as they
+    arrive: a message can only end at bracket depth 0, inside its
+    content, where an operand is followed by "[", a performative or
+    "X". At such a point the buffered tokens are handed to Parser once,
+    with that following token as lookahead, so boundaries and errors
+    are exactly those of parsing the whole document. The last message
+    is returned once the next one starts, or by close().
+
+    With `limits`, messages are parsed by StackParser, and the token
+    count and size of the message being buffered are checked as text
+    arrives, so an oversized message fails before it is complete.
+    """
+
+    def __init__(self, limits: ParseLimits | None = None):
+        self.limits = limits
+        self._lexer = ChunkLexer()
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._tokens: list[Token] = []
+        self._depth = 0
+        self._in_content = False
+        self._prev: TokenType | None = None
+        self._closed = False
+
+    def feed(self, data: str | bytes) -> list[Message]:
+        if self._closed:
+            raise ValueError("feed() called after close()")
+        if not isinstance(data, str):
+            data = self._decoder.decode(data)
+        messages = self._frame(self._lexer.feed(data))
+        if self.limits is not None:
+            self._check_buffered()
+        self._forget_lines()
+        return messages
+
+    def close(self) -> list[Message]:
+        if self._closed:
+            return []
+        self._closed = True
+        tail = self._decoder.decode(b"", final=True)
+        tokens = self._lexer.feed(tail) + self._lexer.close()
+        messages = self._frame(tokens[:-1])
+        self._tokens.append(tokens[-1])
+        messages.extend(self._parser(self._tokens).parse())
+        self._tokens = []
+        return messages
+
+    def _parser(self, tokens: list[Token]) -> Parser:
+        if self.limits is None:
+            return Parser(tokens)
+        return StackParser(tokens, self.limits)
+
+    def _forget_lines(self):
+        """Drop the line starts before the message being buffered."""
+        lexer = self._lexer
+        keep = self._tokens[0].offset if self._tokens else lexer.unlexed_offset
+        lexer.lines.discard(min(keep, lexer.unlexed_offset))
+
+    def _check_buffered(self):
+        """Bound the pending message, including a lexeme still being read."""
+        limits = self.limits
+        lexer = self._lexer
+        tokens = self._tokens
+        if limits.max_tokens is not None and len(tokens) > limits.max_tokens:
+            raise LimitExceeded("max_tokens", limits.max_tokens, tokens[-1])
+        if limits.max_message_bytes is None:
+            return
+        start = tokens[0].offset if tokens else lexer.unlexed_offset
+        if lexer._base + len(lexer.source) - start > limits.max_message_bytes:
+            tok = tokens[0] if tokens else Token(TokenType.EOF, "", start, start, lexer.lines)
+            raise LimitExceeded("max_message_bytes", limits.max_message_bytes, tok)
+
+    def _frame(self, tokens: list[Token]) -> list[Message]:
+        messages = []
+        for tok in tokens:
+            ttype = tok.type
+            if ttype is TokenType.NEWLINE:
+                continue
+            if (self._in_content and self._depth == 0
+                    and self._prev in _OPERAND_END
+                    and (ttype is TokenType.LBRACKET
+                         or ttype is TokenType.PERFORMATIVE
+                         or (ttype is TokenType.IDENT and tok.value == "X"))
+                    and self._try_cut(tok, messages)):
+                self._in_content = False
+            elif ttype is TokenType.COLON and self._depth == 0:
+                self._in_content = True
+            if ttype in _OPENERS:
+                self._depth += 1
+            elif ttype in _CLOSERS:
+                self._depth -= 1
+            self._tokens.append(tok)
+            self._prev = ttype
+        return messages
+
+    def _try_cut(self, lookahead: Token, messages: list[Message]) -> bool:
+        """Parse the buffered tokens if they end just before `lookahead`.
+
+        Returns False, keeping the buffer, when the parser would consume
+        `lookahead` (it then reaches the sentinel EOF behind it).
+        """
+        sentinel = Token(TokenType.EOF, "", lookahead.offset, lookahead.offset, lookahead.lines)
+        parser = self._parser(self._tokens + [lookahead, sentinel])
+        parsed = []
+        try:
+            while parser._peek() is not lookahead:
+                parsed.append(parser._parse_message())
+        except ParseError as e:
+            if e.token is sentinel and not isinstance(e, LimitExceeded):
+                return False
+            raise
+        messages.extend(parsed)
+        self._tokens = []
+        return True
+
+
+# ── Lazy content ─────────────────────────────────────────────────────
+
+# The rest of a name once a non-ASCII character has been seen in it
+_NAME_TAIL_RE = re.compile(r"(?:\w|-(?!>)|\.(?=[^\W\d_]))*")
+# Inside brackets only brackets, strings and comments matter
+_INNER_RE = re.compile(r'[^()\[\]{}"]*')
+
+# Binary operator text -> (level, associativity), as in BINARY_OPERATORS
+_BINARY_TEXT = {
+    text: BINARY_OPERATORS[ttype]
+    for text, ttype in {**SIMPLE_TOKENS, **OPERATORS}.items()
+    if ttype in BINARY_OPERATORS
+}
+# What a complete operand ended with, as far as content skipping cares
+_OPERAND_KIND = {"STRING": "operand", "NUMBER": "operand", "REF": "operand",
+                 "VAR": "operand", "UNDERSCORE": "operand", "TAG": "tag"}
+_CLOSER_KIND = {")": "rparen", "]": "operand", "}": "operand"}
+# Lexemes that extend an operand ending in the given kind
+_EXTENDS = {"ident": ("(", "."), "tag": ("{",), "rparen": (":",), "operand": ()}
+
+
+def _skip_content(src: str, pos: int) -> tuple[int, int]:
+    """Find the end of the content expression starting at `pos`.
+
+    Lexemes at bracket depth 0 are classified with the master pattern,
+    but no tokens are built; inside brackets only brackets, strings and
+    comments are looked at. Content ends at the first lexeme at depth 0
+    that follows a complete operand and is neither a binary operator
+    nor a call, path, tag body or nested-message colon continuing it,
+    or that is a binary operator the parser's precedence climbing
+    refuses (one chaining a non-associative operator); the parser stops
+    at the same place. Returns (content end, offset of that lexeme or
+    len(src)).
+    """
+    match = _MASTER_RE.match
+    n = len(src)
+    prev = None  # kind of the operand just completed, if any
+    end = pos
+    # The open _parse_expression() calls: [min_level, ceiling]
+    frames = [[1, _MAX_LEVEL]]
+    while True:
+        m = match(src, pos)
+        kind = m.lastgroup
+        if kind == "END":
+            return end, n
+        start = m.start(kind)
+        pos = m.end()
+        if kind == "NEWLINE":
+            continue
+        if kind == "COMMENT":
+            pos, open_depth = _scan_comment(src, pos, 1)
+            if open_depth:
+                return n, n
+            continue
+        text = m.group(kind) if kind in ("OP1", "OP2") else None
+        if prev is not None and text not in _BINARY_TEXT and text not in _EXTENDS[prev]:
+            if kind != "OTHER" or src[start] < "\x80" or start != end:
+                return end, start
+            # A non-ASCII character continuing the name before it
+            pos = end = _NAME_TAIL_RE.match(src, pos).end()
+            continue
+        if text is None:
+            if kind == "WORD":
+                word = m.group(kind)
+                prev = None if word in PERFORMATIVES else "operand" if word in ("T", "F") else "ident"
+            elif kind == "OTHER":
+                prev = None
+                if src[start] >= "\x80":
+                    pos = _NAME_TAIL_RE.match(src, pos).end()
+                    prev = "ident"
+            else:
+                prev = _OPERAND_KIND[kind]
+            end = pos
+            continue
+        if text in _CLOSER_KIND:
+            return end, start
+        if prev is not None and text in _BINARY_TEXT:
+            level, assoc = _BINARY_TEXT[text]
+            while frames and not frames[-1][0] <= level < frames[-1][1]:
+                frames.pop()
+            if not frames:
+                return end, start
+            frames[-1][1] = level + 1 if assoc == "left" else level
+            frames.append([level if assoc == "right" else level + 1, _MAX_LEVEL])
+        elif text == ":":
+            # A nested message's content is an expression of its own
+            frames.append([1, _MAX_LEVEL])
+        prev = None
+        end = pos
+        if text not in "([{":
+            continue
+        pos = _skip_group(src, pos)
+        if pos < 0:
+            return n, n
+        prev = _CLOSER_KIND[src[pos - 1]]
+        end = pos
+
+
+def _skip_group(src: str, pos: int) -> int:
+    """Skip to just past the bracket closing the one opened before `pos`.
+
+    Only brackets, strings and comments are looked at. Returns -1 when
+    the source ends first.
+    """
+    inner = _INNER_RE.match
+    n = len(src)
+    depth = 1
+    while depth:
+        pos = inner(src, pos).end()
+        if pos >= n:
+            return -1
+        ch = src[pos]
+        pos += 1
+        if ch == '"':
+            pos = _STRING_BODY_RE.match(src, pos).end()
+            if pos >= n or src[pos] != '"':
+                return -1
+            pos += 1
+        elif ch == "(":
+            if pos < n and src[pos] == "*" and not src.startswith(">", pos + 1):
+                pos, open_depth = _scan_comment(src, pos + 1, 1)
+                if open_depth:
+                    return -1
+            else:
+                depth += 1
+        elif ch in "[{":
+            depth += 1
+        else:
+            depth -= 1
+    return pos
+
+
+_CONTENT_SLOT = Message.__dict__["content"]
+
+
+class LazyMessage(Message):
+    """A Message whose content is parsed on first access.
+
+    Built by parse(source, lazy=True): meta, performative and routing
+    are parsed eagerly, the content is kept as a span of the source.
+    Reading `content` parses the span exactly as the eager parser
+    would, with the same positions in any error; `content_source`
+    gives its text without parsing it. Compares equal to the eager
+    Message.
+    """
+
+    __slots__ = ("_source", "_first", "_end", "_next", "_limits", "_lazy_literals")
+
+    def __init__(self, performative: str, routing: Routing, meta: MetaBlock | None,
+                 source: str, first: Token, end: int, next_start: int,
+                 limits: ParseLimits | None = None, lazy_literals: bool = False,
+                 offset: int = -1):
+        self.performative = performative
+        self.routing = routing
+        self.meta = meta
+        self.offset = offset
+        self.end_offset = end
+        self._source = source
+        self._first = first
+        self._end = end
+        self._next = next_start
+        self._limits = limits
+        self._lazy_literals = lazy_literals
+
+    @property
+    def content(self) -> ASTNode:
+        try:
+            return _CONTENT_SLOT.__get__(self)
+        except AttributeError:
+            pass
+        content = self._parse_content()
+        _CONTENT_SLOT.__set__(self, content)
+        return content
+
+    @content.setter
+    def content(self, value: ASTNode):
+        _CONTENT_SLOT.__set__(self, value)
+
+    @property
+    def content_span(self) -> tuple[int, int]:
+        return self._first.offset, self._end
+
+    @property
+    def content_source(self) -> str:
+        return self._source[self._first.offset:self._end]
+
+    @property
+    def is_parsed(self) -> bool:
+        try:
+            _CONTENT_SLOT.__get__(self)
+        except AttributeError:
+            return False
+        return True
+
+    def _parse_content(self) -> ASTNode:
+        first = self._first
+        lexer = RegexLexer(self._source, self._lazy_literals)
+        lexer.pos, lexer.lines = first.offset, first.lines
+        parser = _new_parser(lexer.iter_tokens(), self._limits,
+                             self._source if self._lazy_literals else None)
+        if self._limits is not None:
+            parser._begin_message(first.offset)
+        content = parser._parse_expression()
+        after = parser._peek()
+        if after.offset != self._next:
+            raise ParseError("Unexpected token after message content", after)
+        return content
+
+    def __eq__(self, other):
+        if not isinstance(other, Message):
+            return NotImplemented
+        return ((self.performative, self.routing, self.content, self.meta)
+                == (other.performative, other.routing, other.content, other.meta))
+
+
+def _new_parser(tokens: Iterable[Token], limits: ParseLimits | None,
+                literals: str | None = None) -> Parser:
+    """Parser or, with `limits`, StackParser; `literals` is the source
+    to build lazy literals from."""
+    parser = Parser(tokens) if limits is None else StackParser(tokens, limits)
+    if literals is not None:
+        parser._literals = literals
+    return parser
+
+
+def _iter_lazy(source: str, limits: ParseLimits | None,
+               lazy_literals: bool = False) -> Iterator[LazyMessage]:
+    pos = 0
+    lines = LineTable(source)
+    literals = source if lazy_literals else None
+    while True:
+        lexer = RegexLexer(source, lazy_literals)
+        lexer.pos, lexer.lines = pos, lines
+        parser = _new_parser(lexer.iter_tokens(), limits, literals)
+        tok = parser._peek()
+        if tok.type is TokenType.EOF:
+            return
+        if limits is not None:
+            parser._begin_message(tok.offset)
+        meta = parser._parse_meta() if tok.type is TokenType.LBRACKET else None
+        perf, routing = parser._parse_header()
+        first = parser._peek()
+        if first.type is TokenType.EOF:
+            parser._parse_expression()  # raises the eager parser's error
+        end, next_start = _skip_content(source, first.offset)
+        if (limits is not None and limits.max_message_bytes is not None
+                and end - tok.offset > limits.max_message_bytes):
+            raise LimitExceeded("max_message_bytes", limits.max_message_bytes, first)
+        yield LazyMessage(perf, routing, meta, source, first, end, next_start, limits,
+                          lazy_literals, tok.offset)
+        pos = next_start
+
+
+# ── Message boundaries ───────────────────────────────────────────────
+
+def _next_lexeme(src: str, pos: int) -> re.Match | None:
+    """Match the first lexeme at or after `pos` that is not a newline or
+    a complete comment; None at the end of the source. An unterminated
+    comment is returned as a lexeme: it is not part of the document's
+    whitespace."""
+    match = _MASTER_RE.match
+    while True:
+        m = match(src, pos)
+        kind = m.lastgroup
+        if kind == "NEWLINE":
+            pos = m.end()
+        elif kind == "COMMENT":
+            pos, open_depth = _scan_comment(src, m.end(), 1)
+            if open_depth:
+                return m
+        elif kind == "END":
+            return None
+        else:
+            return m
+
+
+def _is_op(m: re.Match | None, text: str) -> bool:
+    return m is not None and m.lastgroup == "OP1" and m.group("OP1") == text
+
+
+def _is_name(m: re.Match | None) -> bool:
+    return (m is not None and m.lastgroup == "WORD"
+            and m.group("WORD") not in PERFORMATIVES and m.group("WORD") not in ("T", "F"))
+
+
+def _scan_boundaries(src: str) -> Iterator[int]:
+    """Yield the offset of the first lexeme of each top-level message.
+
+    Mirrors what Parser._parse_message consumes: an optional [meta]
+    group, the performative (one word, or any one token followed by
+    .domain.act), the (routing) group, ":" and the content, skipped
+    with _skip_content. Whatever follows content starts the next
+    message, as in the parser. Scanning stops at anything the parser
+    would reject, so the last offset then starts all that is left.
+    """
+    m = _next_lexeme(src, 0)
+    while m is not None:
+        yield m.start(m.lastgroup)
+        if _is_op(m, "["):
+            pos = _skip_group(src, m.end())
+            if pos < 0:
+                return
+            m = _next_lexeme(src, pos)
+            if m is None:
+                return
+        if m.lastgroup == "WORD" and m.group("WORD") in PERFORMATIVES:
+            m = _next_lexeme(src, m.end())
+        else:
+            # X.domain.act, where the parser takes any one token as the X
+            if m.lastgroup == "COMMENT" or (m.lastgroup == "NUMBER" and m.group("UNIT")):
+                return
+            for name in (False, True, False, True):
+                m = _next_lexeme(src, m.end())
+                if not (_is_name(m) if name else _is_op(m, ".")):
+                    return
+            m = _next_lexeme(src, m.end())
+        if not _is_op(m, "("):
+            return
+        pos = _skip_group(src, m.end())
+        if pos < 0:
+            return
+        m = _next_lexeme(src, pos)
+        if not _is_op(m, ":"):
+            return
+        _, pos = _skip_content(src, m.end())
+        m = _next_lexeme(src, pos)
 
 
 # ── Public API ───────────────────────────────────────────────────────
 
-def parse(source: str) -> list[Message]:
-    """Parse AXON source text into a list of Message AST nodes."""
-    lexer = Lexer(source)
-    tokens = lexer.tokenize()
-    parser = Parser(tokens)
-    return parser.parse()
+def parse(source: str, limits: ParseLimits | None = None,
+          lazy: bool = False, lazy_literals: bool = False) -> list[Message]:
+    """Parse AXON source text into a list of Message AST nodes.
+
+    With `limits`, StackParser is used: nesting depth no longer hits
+    the recursion limit, and oversized input raises LimitExceeded.
+    With `lazy`, LazyMessage instances are returned, whose content is
+    skipped now and parsed on first access (errors in it surface then).
+    With `lazy_literals`, strings and numbers are LazyString and
+    LazyNumber nodes, unescaped or converted when their value is read.
+    """
+    if lazy:
+        return list(_iter_lazy(source, limits, lazy_literals))
+    if lazy_literals:
+        tokens = RegexLexer(source, lazy_strings=True).iter_tokens()
+        return _new_parser(tokens, limits, source).parse()
+    tokens = RegexLexer(source).iter_tokens()
+    if limits is not None:
+        return StackParser(tokens, limits).parse()
+    return Parser(tokens).parse()
+
+
+def parse_bytes(source: bytes, limits: ParseLimits | None = None,
+                lazy_literals: bool = False) -> list[Message]:
+    """Parse UTF-8 AXON from bytes, a bytearray or an mmap, without
+    decoding it first (see ByteLexer). Spans and error positions count
+    bytes. `limits` and `lazy_literals` are as for parse(); lazy string
+    values are decoded from `source` when read, so it must stay open.
+    """
+    tokens = ByteLexer(source, lazy_strings=lazy_literals).iter_tokens()
+    return _new_parser(tokens, limits, source if lazy_literals else None).parse()
+
+
+def message_boundaries(source: str) -> list[int]:
+    """Offsets (into `source`) where top-level messages start.
+
+    Found by a scan that only tracks strings, nested comments and
+    brackets, without building tokens. Cutting `source` at these
+    offsets gives pieces that can be parsed independently: for valid
+    source, the pieces parse to exactly the messages of parse(source).
+    When the scan meets something that cannot continue a document it
+    stops, and the last piece holds the rest (parsing it then raises).
+    """
+    return list(_scan_boundaries(source))
+
+
+def parse_iter(stream, chunk_size: int = 65536,
+               limits: ParseLimits | None = None) -> Iterator[Message]:
+    """Parse AXON from a file object or an iterable of chunks, lazily.
+
+    `stream` is a text or binary file object, or any iterable of str or
+    bytes chunks (e.g. a generator following a growing log); bytes are
+    decoded as UTF-8 incrementally. Each top-level message is yielded
+    once the first token after it has arrived, since only that token
+    shows the message cannot continue. Error positions are absolute.
+    `limits` selects StackParser, as for parse(); its max_message_bytes
+    also bounds the text held for a lexeme still being read, such as an
+    unterminated string or comment.
+    """
+    lexer = ChunkLexer()
+    bound = limits.max_message_bytes if limits is not None else None
+
+    def tokens():
+        for chunk in _iter_text_chunks(stream, chunk_size):
+            yield from lexer.feed(chunk)
+            if bound is not None:
+                start = lexer.unlexed_offset
+                if lexer._base + len(lexer.source) - start > bound:
+                    raise LimitExceeded("max_message_bytes", bound,
+                                        Token(TokenType.EOF, "", start, start, lexer.lines))
+        yield from lexer.close()
+
+    if limits is not None:
+        return StackParser(tokens(), limits).iter_messages()
+    return Parser(tokens()).iter_messages()
+
+
+def _iter_text_chunks(stream, chunk_size: int) -> Iterator[str]:
+    read = getattr(stream, "read", None)
+    if read is not None:
+        stream = iter(lambda: read(chunk_size) or None, None)
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    for chunk in stream:
+        if isinstance(chunk, str):
+            yield chunk
+        else:
+            yield decoder.decode(chunk)
+    tail = decoder.decode(b"", final=True)
+    if tail:
+        yield tail
 
 
 def validate(source: str) -> tuple[bool, str]:
@@ -892,68 +2633,89 @@ def validate(source: str) -> tuple[bool, str]:
 
 
 def format_ast(node: ASTNode, indent: int = 0) -> str:
-    """Pretty-print an AST node for debugging."""
+    """Pretty-print an AST node for debugging.
+
+    Children are formatted from an explicit stack, so arbitrarily deep
+    trees (e.g. from StackParser) do not hit the recursion limit.
+    """
+    results: list[str] = []
+    stack: list[tuple] = [(node, indent)]
+    while stack:
+        item = stack.pop()
+        if item[0] is None:
+            _, combine, n = item
+            parts = results[len(results) - n:]
+            del results[len(results) - n:]
+            results.append(combine(parts))
+            continue
+        children, combine = _format_parts(*item)
+        if children:
+            stack.append((None, combine, len(children)))
+            stack.extend(reversed(children))
+        else:
+            results.append(combine(()))
+    return results[0]
+
+
+def _format_parts(node: ASTNode, indent: int):
+    """Return the (child, indent) pairs of `node` and a function that
+    joins their formatted text into the text of `node`."""
     prefix = "  " * indent
     if isinstance(node, Message):
-        lines = [f"{prefix}Message({node.performative})"]
+        children = [(node.routing, indent + 1), (node.content, indent + 2)]
         if node.meta:
-            lines.append(format_ast(node.meta, indent + 1))
-        lines.append(format_ast(node.routing, indent + 1))
-        lines.append(f"{prefix}  content:")
-        lines.append(format_ast(node.content, indent + 2))
-        return "\n".join(lines)
+            children.insert(0, (node.meta, indent + 1))
+        return children, lambda p: "\n".join(
+            [f"{prefix}Message({node.performative})", *p[:-1], f"{prefix}  content:", p[-1]])
     elif isinstance(node, MetaBlock):
-        lines = [f"{prefix}Meta:"]
-        for k, v in node.fields.items():
-            lines.append(f"{prefix}  {k}: {format_ast(v, 0).strip()}")
-        return "\n".join(lines)
+        return [(v, 0) for v in node.fields.values()], lambda p: "\n".join(
+            [f"{prefix}Meta:"]
+            + [f"{prefix}  {k}: {v.strip()}" for k, v in zip(node.fields, p)])
     elif isinstance(node, Routing):
-        return f"{prefix}Routing({node.sender} > {node.receiver})"
+        return (), lambda p: f"{prefix}Routing({node.sender} > {node.receiver})"
     elif isinstance(node, StringLiteral):
-        return f'{prefix}String("{node.value}")'
+        return (), lambda p: f'{prefix}String("{node.value}")'
     elif isinstance(node, NumberLiteral):
         unit = node.unit or ""
-        return f"{prefix}Number({node.value}{unit})"
+        return (), lambda p: f"{prefix}Number({node.value}{unit})"
     elif isinstance(node, BooleanLiteral):
-        return f"{prefix}Bool({node.value})"
+        return (), lambda p: f"{prefix}Bool({node.value})"
     elif isinstance(node, NullLiteral):
-        return f"{prefix}Null"
+        return (), lambda p: f"{prefix}Null"
     elif isinstance(node, Reference):
-        return f"{prefix}Ref({node.name})"
+        return (), lambda p: f"{prefix}Ref({node.name})"
     elif isinstance(node, Tag):
         if node.body:
-            return f"{prefix}Tag({node.name})\n{format_ast(node.body, indent + 1)}"
-        return f"{prefix}Tag({node.name})"
+            return [(node.body, indent + 1)], lambda p: f"{prefix}Tag({node.name})\n{p[0]}"
+        return (), lambda p: f"{prefix}Tag({node.name})"
     elif isinstance(node, Variable):
-        return f"{prefix}Var({node.name})"
+        return (), lambda p: f"{prefix}Var({node.name})"
     elif isinstance(node, ListExpr):
         if not node.elements:
-            return f"{prefix}List([])"
-        lines = [f"{prefix}List(["]
-        for el in node.elements:
-            lines.append(format_ast(el, indent + 1))
-        lines.append(f"{prefix}])")
-        return "\n".join(lines)
+            return (), lambda p: f"{prefix}List([])"
+        return [(el, indent + 1) for el in node.elements], lambda p: "\n".join(
+            [f"{prefix}List([", *p, f"{prefix}])"])
     elif isinstance(node, RecordExpr):
-        lines = [f"{prefix}Record({{"]
-        for k, v in node.fields.items():
-            lines.append(f"{prefix}  {k}: {format_ast(v, 0).strip()}")
-        lines.append(f"{prefix}}})")
-        return "\n".join(lines)
+        return [(v, 0) for v in node.fields.values()], lambda p: "\n".join(
+            [f"{prefix}Record({{"]
+            + [f"{prefix}  {k}: {v.strip()}" for k, v in zip(node.fields, p)]
+            + [f"{prefix}}})"])
     elif isinstance(node, RangeExpr):
-        return f"{prefix}Range({format_ast(node.start, 0).strip()}..{format_ast(node.end, 0).strip()})"
+        return [(node.start, 0), (node.end, 0)], lambda p: (
+            f"{prefix}Range({p[0].strip()}..{p[1].strip()})")
     elif isinstance(node, CallExpr):
-        args = ", ".join(format_ast(a, 0).strip() for a in node.args)
-        return f"{prefix}Call({node.func}({args}))"
+        return [(a, 0) for a in node.args], lambda p: (
+            f"{prefix}Call({node.func}({', '.join(a.strip() for a in p)}))")
     elif isinstance(node, NamedArg):
-        return f"{prefix}{node.name}: {format_ast(node.value, 0).strip()}"
+        return [(node.value, 0)], lambda p: f"{prefix}{node.name}: {p[0].strip()}"
     elif isinstance(node, BinaryExpr):
-        return f"{prefix}BinOp({format_ast(node.left, 0).strip()} {node.op} {format_ast(node.right, 0).strip()})"
+        return [(node.left, 0), (node.right, 0)], lambda p: (
+            f"{prefix}BinOp({p[0].strip()} {node.op} {p[1].strip()})")
     elif isinstance(node, PathExpr):
-        return f"{prefix}Path({'.'.join(node.parts)})"
+        return (), lambda p: f"{prefix}Path({'.'.join(node.parts)})"
     elif isinstance(node, Identifier):
-        return f"{prefix}Ident({node.name})"
-    return f"{prefix}Unknown({type(node).__name__})"
+        return (), lambda p: f"{prefix}Ident({node.name})"
+    return (), lambda p: f"{prefix}Unknown({type(node).__name__})"
 
 
 # ── CLI ──────────────────────────────────────────────────────────────
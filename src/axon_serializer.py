@@ -0,0 +1,380 @@
+"""
+AXON Serializer — AST back to AXON text
+
+dumps() turns messages (or any expression node) into canonical AXON
+text; dump() writes the same text to a file object. The output uses the
+fewest parentheses the precedence table allows and one fixed spacing,
+so it is a canonical form: parse(dumps(m)) == [m], and dumping the
+re-parsed message gives the same text again.
+
+Canonical spacing follows the spec's examples:
+
+    [id:"m-001", ^:3] RPL(@b>[@a, @c]): {status:#ok, load:a + b * 2, span:1..5}
+
+A Style varies the spelling without changing the meaning: separator
+spacing, compact operators, `=` or `==`, explicit grouping and record
+key order (the canonicalizer in axon_canonical picks the cheapest).
+
+Writing is driven by an explicit work stack, not recursion, so nesting
+depth is unbounded; text goes out as a list of small pieces joined (or
+written) once per message.
+
+Usage:
+    text = dumps(message)
+    dump(messages, sys.stdout)
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from decimal import Decimal
+from functools import lru_cache
+from typing import IO, Iterable, Mapping
+
+from axon_parser import (
+    BINARY_OPERATORS,
+    OPERATORS,
+    PERFORMATIVES,
+    SIMPLE_TOKENS,
+    ASTNode,
+    Message,
+    StringLiteral,
+    NumberLiteral,
+    BooleanLiteral,
+    NullLiteral,
+    Reference,
+    Tag,
+    Variable,
+    Identifier,
+    ListExpr,
+    RecordExpr,
+    RangeExpr,
+    CallExpr,
+    NamedArg,
+    BinaryExpr,
+    PathExpr,
+)
+
+# Operator text -> (precedence level, associativity), from the parser's table
+_BINARY = {
+    text: BINARY_OPERATORS[ttype]
+    for text, ttype in {**SIMPLE_TOKENS, **OPERATORS}.items()
+    if ttype in BINARY_OPERATORS
+}
+_RANGE_LEVEL = _BINARY[".."][0]
+# Levels of nodes that are not binary operators
+_PRIMARY_LEVEL = 9
+_MESSAGE_LEVEL = 0  # a nested message's content swallows every operator after it
+
+_PREFIX = {"~": "~", "!": "!", "neg": "-"}
+
+_ESCAPES = str.maketrans({"\\": "\\\\", '"': '\\"', "\n": "\\n", "\t": "\\t"})
+
+
+_CLASSES = {cls: cls for cls in (
+    Message, StringLiteral, NumberLiteral, BooleanLiteral, NullLiteral,
+    Reference, Tag, Variable, Identifier, ListExpr, RecordExpr, RangeExpr,
+    CallExpr, NamedArg, BinaryExpr, PathExpr,
+)}
+
+
+def _node_class(node: ASTNode) -> type:
+    """The parser class `node` is an instance of (LazyMessage, frozen twins...)."""
+    cls = type(node)
+    base = _CLASSES.get(cls)
+    if base is None:
+        base = next((c for c in cls.__mro__ if c in _CLASSES), None)
+        if base is None:
+            raise TypeError(f"cannot serialize {cls.__name__}")
+        _CLASSES[cls] = base
+    return base
+
+
+def _level(node: ASTNode) -> int:
+    cls = _node_class(node)
+    if cls is BinaryExpr:
+        return _BINARY[node.op][0]
+    if cls is RangeExpr:
+        return _RANGE_LEVEL
+    if cls is Message:
+        return _MESSAGE_LEVEL
+    return _PRIMARY_LEVEL
+
+
+def _number(node: NumberLiteral) -> str:
+    value = node.value
+    text = repr(value)
+    if text[0] == "-" or text in ("inf", "nan"):
+        raise ValueError(f"{text} has no AXON literal (negation is CallExpr('neg', ...))")
+    if type(value) is float and ("e" in text):
+        text = format(Decimal(text), "f")
+        if "." not in text:
+            text += ".0"
+    return text if node.unit is None else text + node.unit
+
+
+# ── Style ────────────────────────────────────────────────────────────
+
+@dataclass(frozen=True, slots=True)
+class Style:
+    """How to spell a message; every style parses to the same AST, up to
+    the spelling of equality (`eq`) and the order of record keys."""
+    comma: str = ", "          # between elements, arguments and fields
+    colon: str = ":"           # between a key or argument name and its value
+    spaced: bool = True        # spaces around binary operators (".." never)
+    header: str = ": "         # after `PERF(routing)`
+    meta_end: str = " "        # after the meta block
+    eq: str | None = None      # write every equality as "=" or "=="; None keeps it
+    grouped: bool = False      # parenthesize every operator operand that is an operator
+    # Record/meta key order: tuple(fields) -> keys in the order to write them
+    key_order: Mapping[tuple, tuple] | None = field(default=None, compare=False)
+
+
+CANONICAL = Style()
+
+# Compact operators that would lex differently next to their operands
+# ("x-y" is a name, "a<-b" a causation, "x->b" an arrow) keep their spaces.
+_SPACED_ALWAYS = frozenset({"-", "<", ">", ">="})
+
+
+@lru_cache(maxsize=None)
+def _operator_texts(spaced: bool, eq: str | None) -> dict[str, str]:
+    texts = {}
+    for op in _BINARY:
+        spelling = eq if eq is not None and op in ("=", "==") else op
+        if op == "..":
+            texts[op] = ".."
+        elif spaced or op in _SPACED_ALWAYS:
+            texts[op] = " " + spelling + " "
+        else:
+            texts[op] = spelling
+    return texts
+
+
+def _endpoint(endpoint: str | list[str]) -> str:
+    if isinstance(endpoint, str):
+        return endpoint
+    return "[" + ", ".join(endpoint) + "]"
+
+
+def _header(message: Message, sep: str = ": ") -> str:
+    routing = message.routing
+    return f"{message.performative}({_endpoint(routing.sender)}>{_endpoint(routing.receiver)})" + sep
+
+
+def _wraps_left(child: ASTNode, level: int, assoc: str) -> bool:
+    """Does `child`, as left operand of an operator at `level`, need parens?"""
+    child_level = _level(child)
+    return child_level < level or (child_level == level and assoc != "left")
+
+
+def _looks_like_routing(arg: ASTNode) -> bool:
+    """Would `PERF(arg` be read as the header of a nested message?
+
+    After `PERF(` the parser takes `[`, or a reference followed by `>`,
+    as the start of routing, so such a first argument needs parens.
+    """
+    while True:
+        cls = _node_class(arg)
+        if cls is ListExpr:
+            return True
+        if cls is BinaryExpr:
+            left = arg.left
+            if _wraps_left(left, *_BINARY[arg.op]):
+                return False
+            if _node_class(left) is Reference:
+                return arg.op == ">"
+            arg = left
+        elif cls is RangeExpr:
+            if _wraps_left(arg.start, _RANGE_LEVEL, "none"):
+                return False
+            arg = arg.start
+        else:
+            return False
+
+
+def _push_items(items: list, close: str, push, comma: str):
+    """Queue `a, b, c` then `close` (pushed in reverse, so popped in order)."""
+    push(close)
+    for n in range(len(items) - 1, -1, -1):
+        push((items[n], True))
+        if n:
+            push(comma)
+
+
+def _push_fields(fields: dict, close: str, push, style: Style):
+    """Queue `k:v, k:v` then `close`."""
+    push(close)
+    keys = tuple(fields)
+    if style.key_order is not None:
+        keys = style.key_order.get(keys, keys)
+    comma, colon = style.comma, style.colon
+    for n in range(len(keys) - 1, -1, -1):
+        key = keys[n]
+        push((fields[key], True))
+        push(key + colon)
+        if n:
+            push(comma)
+
+
+def _write(node: ASTNode, out: list[str], style: Style = CANONICAL):
+    """Append the text of `node` to `out`, piece by piece."""
+    emit = out.append
+    comma, colon, grouped = style.comma, style.colon, style.grouped
+    op_texts = _operator_texts(style.spaced, style.eq)
+    # Items are a str to emit, or (node, tail): `tail` is True when
+    # nothing of the enclosing slot (message content, element, argument,
+    # group) follows the node, so a nested message there needs no parens.
+    stack: list = []
+    push = stack.append
+    if isinstance(node, Message) and node.meta is not None:
+        push((node.content, True))
+        push(_header(node, style.header))
+        _push_fields(node.meta.fields, "]" + style.meta_end, push, style)
+        emit("[")
+    else:
+        push((node, True))
+
+    while stack:
+        item = stack.pop()
+        if type(item) is str:
+            emit(item)
+            continue
+        node, tail = item
+        cls = _CLASSES.get(type(node)) or _node_class(node)
+
+        if cls is BinaryExpr or cls is RangeExpr:
+            if cls is BinaryExpr:
+                level, assoc = _BINARY[node.op]
+                left, right = node.left, node.right
+                op = op_texts[node.op]
+            else:
+                level, assoc = _RANGE_LEVEL, "none"
+                left, right = node.start, node.end
+                op = ".."
+            right_level = _level(right)
+            if right_level == _MESSAGE_LEVEL:
+                wrap = not tail
+            else:
+                wrap = (right_level < level or (right_level == level and assoc != "right")
+                        or (grouped and right_level != _PRIMARY_LEVEL))
+            if wrap:
+                push(")")
+                push((right, True))
+                push("(")
+            else:
+                push((right, tail))
+            push(op)
+            left_level = _level(left)
+            if (left_level < level or (left_level == level and assoc != "left")
+                    or (grouped and left_level != _PRIMARY_LEVEL)):
+                push(")")
+                push((left, True))
+                push("(")
+            else:
+                push((left, False))
+        elif cls is StringLiteral:
+            emit('"' + node.value.translate(_ESCAPES) + '"')
+        elif cls is NumberLiteral:
+            emit(_number(node))
+        elif cls is Reference or cls is Identifier or cls is Variable:
+            emit(node.name)
+        elif cls is RecordExpr:
+            emit("{")
+            _push_fields(node.fields, "}", push, style)
+        elif cls is ListExpr:
+            emit("[")
+            _push_items(node.elements, "]", push, comma)
+        elif cls is Tag:
+            emit(node.name)
+            if node.body is not None:
+                push((node.body, True))
+        elif cls is BooleanLiteral:
+            emit("T" if node.value else "F")
+        elif cls is NullLiteral:
+            emit("_")
+        elif cls is CallExpr:
+            func, args = node.func, node.args
+            if func in _PREFIX and len(args) == 1 and _node_class(args[0]) is not NamedArg:
+                emit(_PREFIX[func])
+                operand = args[0]
+                operand_level = _level(operand)
+                if operand_level == _PRIMARY_LEVEL or (operand_level == _MESSAGE_LEVEL and tail):
+                    push((operand, tail))
+                else:
+                    push(")")
+                    push((operand, True))
+                    push("(")
+            elif args and func in PERFORMATIVES and _looks_like_routing(args[0]):
+                emit(func)
+                emit("((")
+                push(")")
+                for n in range(len(args) - 1, 0, -1):
+                    push((args[n], True))
+                    push(comma)
+                push(")")
+                push((args[0], True))
+            else:
+                emit(func)
+                emit("(")
+                _push_items(args, ")", push, comma)
+        elif cls is NamedArg:
+            emit(node.name)
+            emit(colon)
+            push((node.value, True))
+        elif cls is PathExpr:
+            emit(".".join(node.parts))
+        elif cls is Message:
+            if node.meta is not None:
+                raise ValueError("a nested message cannot have meta")
+            emit(_header(node, style.header))
+            push((node.content, True))
+
+
+# ── Public API ───────────────────────────────────────────────────────
+
+def _nodes(obj: ASTNode | Iterable[ASTNode]) -> Iterable[ASTNode]:
+    return (obj,) if isinstance(obj, ASTNode) else obj
+
+
+def dumps(obj: ASTNode | Iterable[Message], style: Style = CANONICAL) -> str:
+    """AXON text of a message, an expression node, or a sequence of
+    messages (one per line)."""
+    out: list[str] = []
+    for n, node in enumerate(_nodes(obj)):
+        if n:
+            out.append("\n")
+        _write(node, out, style)
+    return "".join(out)
+
+
+def dump(obj: ASTNode | Iterable[Message], fp: IO[str], style: Style = CANONICAL):
+    """Write `obj` to the text file `fp`, each message followed by a newline.
+
+    Messages are written one at a time, so an iterator of messages is
+    streamed without materializing the whole text.
+    """
+    write = fp.write
+    out: list[str] = []
+    for node in _nodes(obj):
+        _write(node, out, style)
+        out.append("\n")
+        write("".join(out))
+        out.clear()
+
+
+def main():
+    import sys
+
+    from axon_parser import parse
+
+    if len(sys.argv) < 2:
+        print("AXON Serializer")
+        print("Usage: python3 axon_serializer.py <file.axon>   (print in canonical form)")
+        sys.exit(0)
+    with open(sys.argv[1]) as f:
+        dump(parse(f.read()), sys.stdout)
+
+
+if __name__ == "__main__":
+    main()
@@ -18,6 +18,7 @@ from typing import Optional
 from axon_parser import (
     parse,
     LexerError,
+    LineTable,
     ParseError,
     Message,
     MetaBlock,
@@ -61,11 +62,15 @@ class Diagnostic:
     level: int  # validation level that produced this (1, 2, or 3)
     kind: CheckKind = CheckKind.DETERMINISTIC
     message_index: Optional[int] = None
+    offset: Optional[int] = None  # source offset of the node at fault
+    line: Optional[int] = None  # of offset, or of the message start
+    col: Optional[int] = None
 
     def __str__(self):
         prefix = f"L{self.level}"
         msg_ref = f" [msg {self.message_index}]" if self.message_index is not None else ""
-        return f"[{prefix}:{self.severity.value}]{msg_ref} {self.message}"
+        at = f" at {self.line}:{self.col}" if self.line is not None else ""
+        return f"[{prefix}:{self.severity.value}]{msg_ref}{at} {self.message}"
 
 
 @dataclass
@@ -164,6 +169,7 @@ class Validator:
 
         # Level 3: semantic diagnostics (non-gating)
         self._check_level3()
+        self._locate()
 
         has_errors = any(d.severity == Severity.ERROR for d in self.diagnostics)
         return ValidationResult(
@@ -179,13 +185,27 @@ class Validator:
             self.messages = parse(self.source)
             return True
         except (LexerError, ParseError) as e:
+            line, col = (e.line, e.col) if isinstance(e, LexerError) else e.token.position
             self.diagnostics.append(Diagnostic(
                 severity=Severity.ERROR,
                 message=f"Parse error: {e}",
                 level=1,
+                line=line,
+                col=col,
             ))
             return False
 
+    def _locate(self):
+        """Give diagnostics the line:col of their node, or of their message."""
+        located = [d for d in self.diagnostics if d.message_index is not None]
+        if not located:
+            return
+        lines = LineTable(self.source)
+        for d in located:
+            if d.offset is None:
+                d.offset = self.messages[d.message_index].offset
+            d.line, d.col = lines.position(d.offset)
+
     # ── Level 2: Tier compliance ─────────────────────────────────────
 
     def _check_level2(self):
@@ -219,6 +239,7 @@ class Validator:
                     message=f"Missing required field '{fld}' for Tier {self.tier}",
                     level=2,
                     message_index=idx,
+                    offset=meta.offset,
                 ))
 
         # Field type validation
@@ -231,6 +252,7 @@ class Validator:
                         message=f"Field '{key}' must be {type_name}, got {type(node).__name__}",
                         level=2,
                         message_index=idx,
+                        offset=node.offset,
                     ))
 
         # Priority range check
@@ -243,6 +265,7 @@ class Validator:
                         message=f"Priority '^' must be integer 0-5, got {node.value}",
                         level=2,
                         message_index=idx,
+                        offset=node.offset,
                     ))
             else:
                 self.diagnostics.append(Diagnostic(
@@ -250,6 +273,7 @@ class Validator:
                     message=f"Priority '^' must be a number, got {type(node).__name__}",
                     level=2,
                     message_index=idx,
+                    offset=node.offset,
                 ))
 
         # Protocol version check
@@ -262,6 +286,7 @@ class Validator:
                         message=f"Unsupported protocol version: {int(node.value)} (supported: {sorted(SUPPORTED_VERSIONS)})",
                         level=2,
                         message_index=idx,
+                        offset=node.offset,
                     ))
 
     # ── Level 3: Semantic diagnostics (non-gating) ───────────────────
@@ -317,6 +342,7 @@ class Validator:
                             level=3,
                             kind=CheckKind.DETERMINISTIC,
                             message_index=idx,
+                            offset=node.offset,
                         ))
             self._check_unit_compatibility(node.left, idx)
             self._check_unit_compatibility(node.right, idx)
@@ -358,6 +384,7 @@ class Validator:
                 level=3,
                 kind=CheckKind.CONTEXT_REQUIRED,
                 message_index=idx,
+                offset=re_node.offset,
             ))
 
 
@@ -0,0 +1,189 @@
+"""
+Tests for the archive sidecar index and mmap-backed reader.
+"""
+
+import sys
+import os
+import json
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import axon_archive
+from axon_archive import ArchiveReader, IndexEntry, update_index
+from axon_parser import parse
+
+ROOT = os.path.join(os.path.dirname(__file__), "..")
+
+
+def _example(name):
+    with open(os.path.join(ROOT, "examples", name)) as f:
+        return f.read()
+
+
+@pytest.fixture
+def archive(tmp_path):
+    path = str(tmp_path / "conversation.axon")
+
+    def write(text, mode="w"):
+        with open(path, mode, encoding="utf-8") as f:
+            f.write(text)
+        return path
+
+    return write
+
+
+# ── Index ────────────────────────────────────────────────────────────
+
+class TestIndex:
+    def test_examples(self, archive):
+        source = _example("real_world_scenarios.axon") + _example("basic.axon")
+        path = archive(source)
+        with ArchiveReader(path) as reader:
+            assert len(reader) == len(parse(source))
+            assert list(reader) == parse(source)
+        assert os.path.exists(path + ".idx")
+
+    def test_meta_fields(self, archive):
+        path = archive('[id:"m1", ts:1700000000, ctx:"c-7"] INF(@a>@b): 1\n'
+                       '[id:"m2", re:"m1", ^:3] RPL(@b>@a): {ok: T}\n'
+                       "ACK(@a>@b): _\n")
+        entries = update_index(path).entries
+        assert [(e.id, e.re, e.ctx, e.ts) for e in entries] == [
+            ("m1", None, "c-7", 1700000000), ("m2", "m1", None, None), (None, None, None, None),
+        ]
+
+    def test_byte_offsets_with_non_ascii(self, archive):
+        path = archive('[id:"é"] INF(@a>@b): "naïve ☃"\n(* ünïcode *) [id:"x"] ACK(@b>@a): café\n')
+        with open(path, "rb") as f:
+            data = f.read()
+        with ArchiveReader(path) as reader:
+            entry = reader.entries[1]
+            assert data[entry.offset:entry.offset + entry.length].decode() == \
+                '[id:"x"] ACK(@b>@a): café'
+            assert reader.by_id("x") == parse('[id:"x"] ACK(@b>@a): café')[0]
+
+    def test_by_id(self, archive):
+        path = archive('[id:"m1"] INF(@a>@b): 1\n[id:"m42"] INF(@a>@b): 42\n')
+        with ArchiveReader(path) as reader:
+            assert reader.by_id("m42").content.value == 42
+            with pytest.raises(KeyError):
+                reader.by_id("m0")
+
+    @pytest.mark.parametrize("window", [16, 100, 1024])
+    def test_scan_in_windows(self, archive, monkeypatch, window):
+        source = (_example("real_world_scenarios.axon") + '[id:"é"] INF(@a>@b): "naïve ☃"\n'
+                  + _example("basic.axon"))
+        expected = update_index(archive(source)).entries
+        monkeypatch.setattr(axon_archive, "_WINDOW_BYTES", window)
+        path = archive(source)
+        os.remove(path + ".idx")
+        assert update_index(path).entries == expected
+        # Never the whole archive in one piece
+        windows = []
+        boundaries = axon_archive.message_boundaries
+        monkeypatch.setattr(axon_archive, "message_boundaries",
+                            lambda text: windows.append(len(text)) or boundaries(text))
+        os.remove(path + ".idx")
+        with ArchiveReader(path) as reader:
+            assert list(reader) == parse(source)
+        assert len(windows) > 1 and max(windows) < len(source)
+
+    def test_empty_archive(self, archive):
+        path = archive("")
+        with ArchiveReader(path) as reader:
+            assert len(reader) == 0
+
+    def test_sidecar_format(self, archive):
+        path = archive('[id:"m1"] INF(@a>@b): 1\n')
+        update_index(path)
+        with open(path + ".idx") as f:
+            data = json.load(f)
+        assert data["version"] == axon_archive.INDEX_VERSION
+        assert data["entries"] == [[0, 23, "m1", None, None, None]]
+
+
+# ── Incremental updates ──────────────────────────────────────────────
+
+class TestIncremental:
+    def _spy(self, monkeypatch):
+        starts = []
+        scan = axon_archive._scan
+
+        def spy(data, start, end):
+            starts.append(start)
+            return scan(data, start, end)
+
+        monkeypatch.setattr(axon_archive, "_scan", spy)
+        return starts
+
+    def test_append_scans_from_last_message(self, archive, monkeypatch):
+        source = _example("real_world_scenarios.axon")
+        path = archive(source)
+        first = update_index(path)
+        last_offset = first.entries[-1].offset
+        starts = self._spy(monkeypatch)
+        archive('\n[id:"new"] INF(@a>@b): 1\n', "a")
+        index = update_index(path)
+        assert starts == [last_offset]
+        assert len(index.entries) == len(first.entries) + 1
+        with ArchiveReader(path) as reader:
+            assert list(reader) == parse(source + '\n[id:"new"] INF(@a>@b): 1\n')
+
+    def test_unchanged_archive_is_not_scanned(self, archive, monkeypatch):
+        path = archive(_example("basic.axon"))
+        update_index(path)
+        starts = self._spy(monkeypatch)
+        update_index(path)
+        assert starts == []
+
+    def test_append_continues_last_message(self, archive):
+        path = archive("INF(@a>@b): 1")
+        assert update_index(path).entries[0].length == len("INF(@a>@b): 1")
+        archive(" + 2\nACK(@b>@a): _", "a")
+        with ArchiveReader(path) as reader:
+            assert list(reader) == parse("INF(@a>@b): 1 + 2\nACK(@b>@a): _")
+
+    def test_unfinished_message_and_split_utf8(self, archive):
+        path = archive('INF(@a>@b): 1\n[id:"m2"] RPL(@b')
+        assert len(update_index(path).entries) == 1
+        with open(path, "ab") as f:
+            f.write('>@a): "é'.encode()[:-1])  # half of a two-byte character
+        assert len(update_index(path).entries) == 1
+        with open(path, "ab") as f:
+            f.write('é"'.encode()[1:])
+        with ArchiveReader(path) as reader:
+            assert reader.by_id("m2").content.value == "é"
+
+    def test_rewritten_archive_is_rebuilt(self, archive):
+        path = archive('[id:"a"] INF(@a>@b): 1\n')
+        update_index(path)
+        archive('[id:"b"] INF(@a>@b): 2\n')
+        assert [e.id for e in update_index(path).entries] == ["b"]
+        archive('[id:"c"] INF(@a>@b): 3\n[id:"d"] INF(@a>@b): 4\n')
+        assert [e.id for e in update_index(path).entries] == ["c", "d"]
+
+    @pytest.mark.parametrize("at", [0.0, 0.3, 0.99])
+    def test_same_size_edit_is_rebuilt(self, archive, at):
+        source = "".join(f'[id:"m{i}"] INF(@a>@b): {i % 10}\n' for i in range(1000))
+        path = archive(source)
+        update_index(path)
+        k = source.index('"m', int(len(source) * at)) + 1
+        edited = source[:k] + "x" + source[k + 1:]  # same size, one id renamed
+        archive(edited + '[id:"new"] INF(@a>@b): 1\n')
+        assert [e.id for e in update_index(path).entries] == \
+            [m.meta.fields["id"].value for m in parse(edited)] + ["new"]
+
+    def test_corrupt_sidecar_is_rebuilt(self, archive):
+        path = archive('[id:"a"] INF(@a>@b): 1\n')
+        with open(path + ".idx", "w") as f:
+            f.write("{not json")
+        assert update_index(path).entries == [IndexEntry(0, 22, "a")]
+
+    def test_reader_refresh(self, archive):
+        path = archive("INF(@a>@b): 1\n")
+        with ArchiveReader(path) as reader:
+            archive("INF(@a>@b): 2\n", "a")
+            assert len(reader) == 1
+            reader.refresh()
+            assert reader[1].content.value == 2
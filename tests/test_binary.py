@@ -0,0 +1,153 @@
+"""
+Tests for the binary AST encoding.
+"""
+
+import dataclasses
+import sys
+import os
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from axon_parser import (
+    parse, ParseLimits, RegexLexer, StackParser,
+    Message, Routing, NumberLiteral, Identifier, ListExpr,
+)
+from axon_binary import BinaryFormatError, decode, encode
+from axon_serializer import dumps
+from axon_cache import freeze
+
+ROOT = os.path.join(os.path.dirname(__file__), "..")
+CORPUS = [
+    os.path.join(ROOT, "examples", name)
+    for name in ("basic.axon", "advanced.axon", "real_world_scenarios.axon")
+] + [
+    os.path.join(ROOT, "tests", "conformance", name)
+    for name in sorted(os.listdir(os.path.join(ROOT, "tests", "conformance")))
+    if name.startswith("valid_")
+]
+
+
+def _message(content) -> Message:
+    return Message("INF", Routing("@a", "@b"), content)
+
+
+def _spans(value) -> list:
+    """Every node's span, routings included, in walk order."""
+    if isinstance(value, list):
+        return [s for v in value for s in _spans(v)]
+    if isinstance(value, dict):
+        return _spans(list(value.values()))
+    if dataclasses.is_dataclass(value):
+        return [(type(value).__name__, value.span)] + [
+            s for f in dataclasses.fields(value) for s in _spans(getattr(value, f.name))]
+    return []
+
+
+# ── Round trip ───────────────────────────────────────────────────────
+
+class TestRoundTrip:
+    @pytest.mark.parametrize("path", CORPUS, ids=os.path.basename)
+    def test_corpus(self, path):
+        with open(path) as f:
+            messages = parse(f.read())
+        back = decode(encode(messages))
+        assert back == messages
+        assert repr(back) == repr(messages)  # int/float kept apart
+        assert dumps(back) == dumps(messages)
+
+    def test_single_message_and_empty(self):
+        msg = parse('[id:"m1", ^:3] QRY(@a>[@b, @c]): f(x, n:1)')[0]
+        assert decode(encode(msg)) == [msg]
+        assert decode(encode([])) == []
+
+    def test_frozen_and_lazy_messages(self):
+        with open(CORPUS[1]) as f:
+            source = f.read()
+        payload = encode(parse(source))
+        assert encode(freeze(parse(source))) == payload
+        assert encode(parse(source, lazy=True)) == payload
+
+    @pytest.mark.parametrize("path", CORPUS[:3], ids=os.path.basename)
+    def test_spans(self, path):
+        with open(path) as f:
+            source = f.read()
+        messages = parse(source)
+        payload = encode(messages, spans=True)
+        assert decode(payload) == messages
+        assert _spans(decode(payload)) == _spans(messages)
+        assert _spans(decode(encode(parse(source, lazy=True), spans=True))) == _spans(messages)
+        assert {span for _, span in _spans(decode(encode(messages)))} == {(-1, -1)}
+        assert len(payload) > len(encode(messages))
+
+    def test_routing_lists(self):
+        msg = parse("REQ(@a>[]): 1\nREQ([@a, @b]>*): 2")
+        assert decode(encode(msg)) == msg
+
+    def test_deep_nesting(self):
+        source = "INF(@a>@b): " + "[" * 5000 + "]" * 5000
+        tokens = RegexLexer(source).iter_tokens()
+        messages = StackParser(tokens, ParseLimits(max_depth=10**6)).parse()
+        assert dumps(decode(encode(messages))) == source
+
+    def test_smaller_than_text(self):
+        with open(CORPUS[2]) as f:
+            messages = parse(f.read())
+        assert len(encode(messages)) < len(dumps(messages).encode())
+
+
+# ── Numbers ──────────────────────────────────────────────────────────
+
+class TestNumbers:
+    @pytest.mark.parametrize("value", [
+        0, 127, 128, 2**64 + 1, 0.0, 1.5, 0.1, 123.456, 2.0, 1e16, 1e-7,
+        9007199254740993.0, 0.30000000000000004, float("inf"),
+    ])
+    def test_exact(self, value):
+        (back,) = decode(encode(_message(NumberLiteral(value))))
+        assert type(back.content.value) is type(value)
+        assert back.content.value == value
+
+    @pytest.mark.parametrize("unit", ["ms", "%", "KB", "GB"])
+    def test_units(self, unit):
+        msg = _message(ListExpr([NumberLiteral(5, unit), NumberLiteral(2.5, unit)]))
+        assert decode(encode(msg)) == [msg]
+
+    def test_unencodable(self):
+        with pytest.raises(ValueError):
+            encode(_message(NumberLiteral(-1)))
+        with pytest.raises(ValueError):
+            encode(_message(NumberLiteral(1, "parsecs")))
+        with pytest.raises(ValueError):
+            encode(_message(Identifier("a\0b")))
+
+
+# ── Malformed payloads ───────────────────────────────────────────────
+
+class TestMalformed:
+    def _payload(self) -> bytes:
+        return encode(parse('[id:"m1"] REQ(@a>@b): {x:[1, 2.5, "s"], y:f(n:T)}'))
+
+    @pytest.mark.parametrize("payload", [b"", b"AX", b"JSON", b"AXB", b"AXB\x09"])
+    def test_header(self, payload):
+        with pytest.raises(BinaryFormatError):
+            decode(payload)
+
+    def test_truncated(self):
+        payload = self._payload()
+        decoded = []
+        for cut in range(4, len(payload)):
+            try:
+                decoded.append(decode(payload[:cut]))
+            except BinaryFormatError:
+                pass
+        assert decoded == [[]]  # only the bare symbol table, with no messages
+
+    def test_not_a_message(self):
+        payload = encode(_message(Identifier("x")))
+        with pytest.raises(BinaryFormatError):
+            decode(payload[:-4])  # the bare identifier, without its message
+
+    def test_trailing_garbage(self):
+        with pytest.raises(BinaryFormatError):
+            decode(self._payload() + b"\x01")
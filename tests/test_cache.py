@@ -0,0 +1,248 @@
+"""
+Tests for the parse/validate result cache and frozen ASTs.
+"""
+
+import sys
+import os
+import dataclasses
+import random
+import re
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from axon_parser import Message, ListExpr, LexerError, ParseError, parse, format_ast
+from axon_validator import validate
+from axon_cache import FrozenDict, FrozenList, ParseCache, ShapeCache, freeze, thaw
+
+ROOT = os.path.join(os.path.dirname(__file__), "..")
+
+
+def _example(name):
+    with open(os.path.join(ROOT, "examples", name)) as f:
+        return f.read()
+
+
+# ── Frozen ASTs ──────────────────────────────────────────────────────
+
+class TestFreeze:
+    def test_equal_to_parse_result(self):
+        source = _example("advanced.axon")
+        frozen = freeze(parse(source))
+        assert frozen == parse(source)
+        assert parse(source) == frozen
+        assert [format_ast(m) for m in frozen] == [format_ast(m) for m in parse(source)]
+
+    def test_isinstance_and_hashable(self):
+        msg = freeze(parse('QRY(@a>@b): [1, "x", {k: T}]')[0])
+        assert isinstance(msg, Message)
+        assert isinstance(msg.content, ListExpr)
+        assert hash(msg) == hash(freeze(parse('QRY(@a>@b): [1, "x", {k: T}]')[0]))
+
+    def test_cannot_be_modified(self):
+        msg = freeze(parse('[ts: 1] QRY(@a>@b): {k: [1, 2]}')[0])
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            msg.performative = "INF"
+        with pytest.raises(TypeError):
+            msg.content.fields["k"] = None
+        with pytest.raises(TypeError):
+            msg.meta.fields.pop("ts")
+        with pytest.raises(AttributeError):
+            msg.content.fields["k"].elements.append(3)
+        assert isinstance(msg.content.fields["k"].elements, FrozenList)
+
+    def test_freeze_is_idempotent(self):
+        frozen = freeze(parse("INF(@a>@b): 1")[0])
+        assert freeze(frozen) is frozen
+
+    def test_keeps_spans(self):
+        msg = parse('QRY(@a>@b): [1, "x"]')[0]
+        frozen = freeze(msg)
+        assert frozen.span == msg.span
+        assert [e.span for e in frozen.content.elements] == [(13, 14), (16, 19)]
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            frozen.offset = 0
+
+    def test_frozen_constructor(self):
+        msg = freeze(parse("INF(@a>@b): 1")[0])
+        copy = dataclasses.replace(msg, performative="ACK")
+        assert copy.performative == "ACK"
+        assert copy.content == msg.content
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            copy.performative = "INF"
+
+    @pytest.mark.parametrize("cache", [ParseCache, ShapeCache])
+    def test_pickle_and_deepcopy(self, cache):
+        import copy
+        import pickle
+        source = _example("advanced.axon")
+        cached = cache().parse(source)
+        for result in (pickle.loads(pickle.dumps(cached)), copy.deepcopy(cached)):
+            assert type(result) is FrozenList and result == parse(source)
+            assert [m.span for m in result] == [m.span for m in cached]
+            assert type(result[0]) is type(cached[0])
+            with pytest.raises(dataclasses.FrozenInstanceError):
+                result[0].performative = "INF"
+        fields = ParseCache().parse("INF(@a>@b): {k: 1}")[0].content.fields
+        assert type(pickle.loads(pickle.dumps(fields))) is FrozenDict
+
+    def test_thaw(self):
+        source = '[ts: 1] QRY(@a>@b): {k: [1, "x"], n: INF(@b>@c): #t{v: 2ms}}'
+        cache = ParseCache()
+        messages = thaw(cache.parse(source))
+        assert type(messages) is list and messages == parse(source)
+        assert type(messages[0]) is Message and type(messages[0].content.fields) is dict
+        assert messages[0].content.fields["k"].elements[1].span == (28, 31)
+        messages[0].performative = "INF"
+        messages[0].content.fields["k"].elements.append(3)
+        assert cache.parse(source) == parse(source)
+        assert thaw(messages) is messages
+
+
+# ── ParseCache ───────────────────────────────────────────────────────
+
+class TestParseCache:
+    def test_hit_returns_same_object(self):
+        cache = ParseCache()
+        source = _example("basic.axon")
+        first = cache.parse(source)
+        assert cache.parse(source) is first
+        assert first == parse(source)
+        info = cache.info()
+        assert (info.hits, info.misses, info.evictions, info.size) == (1, 1, 0, 1)
+        assert info.hit_rate == 0.5
+
+    def test_lru_eviction(self):
+        cache = ParseCache(maxsize=2)
+        a, b, c = "INF(@a>@b): 1", "INF(@a>@b): 2", "INF(@a>@b): 3"
+        cache.parse(a)
+        cache.parse(b)
+        cache.parse(a)          # a becomes most recent
+        cache.parse(c)          # evicts b
+        assert cache.info().evictions == 1
+        cache.parse(a)
+        assert cache.info().hits == 2
+        cache.parse(b)
+        assert cache.info().misses == 4
+
+    def test_errors_not_cached(self):
+        cache = ParseCache()
+        for _ in range(2):
+            with pytest.raises(ParseError):
+                cache.parse("INF(@a>@b): [1,")
+        assert cache.info().size == 0
+
+    def test_validate_keyed_by_tier(self):
+        cache = ParseCache()
+        source = _example("advanced.axon")
+        for tier in (1, 2, 3, 1, 2, 3):
+            result = cache.validate(source, tier)
+            expected = validate(source, tier)
+            assert result.valid == expected.valid
+            assert result.diagnostics == expected.diagnostics
+        assert cache.info().misses == 3
+        assert cache.info().hits == 3
+
+    def test_validate_result_is_private_copy(self):
+        cache = ParseCache()
+        source = "INF(@a>@b): $undefined"
+        cache.validate(source, 2).diagnostics.clear()
+        assert cache.validate(source, 2).diagnostics == validate(source, 2).diagnostics
+
+    def test_clear(self):
+        cache = ParseCache()
+        cache.parse("INF(@a>@b): 1")
+        cache.clear()
+        assert cache.info() == (0, 0, 0, 0, 1024)
+
+    def test_maxsize_must_be_positive(self):
+        with pytest.raises(ValueError):
+            ParseCache(maxsize=0)
+
+
+# ── ShapeCache ───────────────────────────────────────────────────────
+
+def _exact(messages):
+    """repr without the Frozen prefix: distinguishes 1 from 1.0."""
+    return repr(list(messages)).replace("Frozen", "")
+
+
+def _outcome(parse_fn, source):
+    try:
+        return _exact(parse_fn(source))
+    except (LexerError, ParseError) as e:
+        return ("error", str(e))
+
+
+class TestShapeCache:
+    def test_literals_share_a_template(self):
+        cache = ShapeCache()
+        sources = [
+            "PUB(@monitor>@dashboard): {cpu:72%, mem:4.2GB, reqs:1250}",
+            "PUB(@monitor>@dashboard): {cpu:5%, mem:4GB, reqs:1.5}",
+            'PUB(@monitor>@dashboard): {cpu:0.5%, mem:16.0GB, reqs:7}',
+        ]
+        for source in sources:
+            assert _exact(cache.parse(source)) == _exact(parse(source))
+        info = cache.info()
+        assert (info.hits, info.misses, info.size) == (2, 1, 1)
+
+    def test_literal_kind_is_part_of_shape(self):
+        cache = ShapeCache()
+        for source in ['INF(@a>@b): 1', 'INF(@a>@b): "1"', "INF(@a>@b): T",
+                       "INF(@a>@b): 1ms", "INF(@a>@b): F"]:
+            assert _exact(cache.parse(source)) == _exact(parse(source))
+        assert cache.info().hits == 1
+
+    def test_names_are_part_of_shape(self):
+        cache = ShapeCache()
+        a = cache.parse("INF(@a>@b): {x: 1}")
+        b = cache.parse("INF(@a>@c): {y: 1}")
+        assert b == parse("INF(@a>@c): {y: 1}")
+        assert a != b
+        assert cache.info().hits == 0
+
+    def test_layout_does_not_change_shape(self):
+        cache = ShapeCache()
+        cache.parse("[id:1] INF(@a>@b): [1, 2]")
+        result = cache.parse("[id:2]\n(* c *) INF(@a>@b):\n  [3,\n   4]")
+        assert result == parse("[id:2] INF(@a>@b): [3, 4]")
+        assert cache.info().hits == 1
+
+    def test_errors_match_parse(self):
+        cache = ShapeCache()
+        for source in ["INF(@a>@b): [1,", '"open', "[id:1, id:2] INF(@a>@b): 1"]:
+            with pytest.raises((LexerError, ParseError)) as cached:
+                cache.parse(source)
+            with pytest.raises((LexerError, ParseError)) as full:
+                parse(source)
+            assert str(cached.value) == str(full.value)
+        assert cache.info().size == 0
+
+    def test_results_are_frozen(self):
+        cache = ShapeCache()
+        cache.parse("INF(@a>@b): {k: [1, #t]}")
+        msg = cache.parse("INF(@a>@b): {k: [2, #t]}")[0]
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            msg.content.fields["k"].elements[1].name = "u"
+        assert cache.parse("INF(@a>@b): {k: [3, #t]}") == parse("INF(@a>@b): {k: [3, #t]}")
+
+    def test_templates_carry_no_spans(self):
+        cache = ShapeCache()
+        cache.parse('INF(@a>@b): {k: "a"}')
+        msg = cache.parse('INF(@a>@b): {k: "longer"}')[0]
+        assert msg.span == msg.content.fields["k"].span == (-1, -1)
+
+    def test_examples_with_varied_literals(self):
+        rnd = random.Random(0)
+        cache = ShapeCache()
+
+        def vary(source):
+            return re.sub(r"(?<![\w.])\d+(\.\d+)?(?![\w.])",
+                          lambda m: rnd.choice(["0", "7", "2.5", "1234567890123"]), source)
+
+        for name in ("basic.axon", "advanced.axon", "real_world_scenarios.axon"):
+            for message in _example(name).split("\n\n"):
+                for source in [message] + [vary(message) for _ in range(5)]:
+                    assert _outcome(cache.parse, source) == _outcome(parse, source)
+        assert cache.info().hits > 0
@@ -0,0 +1,109 @@
+"""
+Tests for the token-cost canonicalizer.
+"""
+
+import sys
+import os
+import re
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from axon_parser import parse
+from axon_serializer import dumps
+from axon_canonical import Canonicalizer
+
+ROOT = os.path.join(os.path.dirname(__file__), "..")
+
+_PIECES = re.compile(r"[A-Za-z]+|\d+|\s+|[^\w\s]")
+
+
+def pieces(text: str) -> int:
+    """A tokenizer stand-in: words, digit runs, spaces and symbols."""
+    return len(_PIECES.findall(text))
+
+
+def _same_meaning(text: str, source: str) -> bool:
+    # Record equality ignores key order
+    return parse(text) == parse(source)
+
+
+class TestCanonicalizer:
+    def test_example_files_keep_meaning(self):
+        canon = Canonicalizer(counter=pieces)
+        for name in ("basic.axon", "advanced.axon", "real_world_scenarios.axon"):
+            with open(os.path.join(ROOT, "examples", name)) as f:
+                source = f.read()
+            results = canon.canonicalize(source)
+            assert len(results) == len(parse(source))
+            for result in results:
+                assert _same_meaning(result.text, dumps(result.message))
+                assert result.tokens == pieces(result.text)
+                assert result.saved >= 0
+            assert sum(r.saved for r in results) > 0
+
+    def test_drops_costly_spaces(self):
+        source = '[id: "m1"] RPL(@a > @b) : {a: 1, b: x == y, c: [1, 2]}'
+        (result,) = Canonicalizer(counter=pieces).canonicalize(source)
+        assert result.text == '[id:"m1"]RPL(@a>@b):{a:1,b:x==y,c:[1,2]}'
+        assert result.original_tokens == pieces(source)
+        assert result.saved == pieces(source) - pieces(result.text)
+
+    @pytest.mark.parametrize("source", ["INF(@a>@b): x = y", "INF(@a>@b): x == y"])
+    def test_keeps_equality_spelling(self, source):
+        # `==` costs a token more here, but is a different AST
+        canon = Canonicalizer(counter=lambda text: len(text) + text.count("=="))
+        (result,) = canon.canonicalize(source)
+        assert parse(result.text) == parse(source)
+        assert repr(parse(result.text)) == repr(parse(source))
+
+    def test_comments_are_not_savings(self):
+        source = "(* note *) INF(@a>@b): (* a\n (* nested *) *) {x: 1, (* why *) y: 2}  (* end *)"
+        (result,) = Canonicalizer(counter=pieces).canonicalize(source)
+        stripped = "INF(@a>@b): {x: 1, y: 2}"
+        assert result.original_tokens == pieces(stripped)
+        assert result.saved == pieces(stripped) - pieces(result.text)
+
+    def test_key_order(self):
+        # A counter that charges for `{b`: the record should not start with b
+        canon = Canonicalizer(counter=lambda text: len(text) + 10 * text.count("{b"))
+        (result,) = canon.canonicalize("INF(@a>@b): {b:1, a:2}")
+        assert result.text == "INF(@a>@b):{a:2,b:1}"
+        assert result.saved == 10 + 2
+
+    def test_keeps_cheaper_original(self):
+        source = "INF(@a>@b): {x: 1}"
+        canon = Canonicalizer(counter=lambda text: 0 if text == source else len(text))
+        (result,) = canon.canonicalize(source)
+        assert result.text == source
+        assert result.saved == 0
+
+    def test_shape_decision_is_memoized(self):
+        calls = []
+
+        def counter(text):
+            calls.append(text)
+            return pieces(text)
+
+        canon = Canonicalizer(counter=counter)
+        canon.canonicalize('PUB(@s>@hub): {temp:21.5, load:40%, note:"a"}')
+        searched = len(calls)
+        calls.clear()
+        (result,) = canon.canonicalize('PUB(@t>@hub): {temp:19.0, load:7%, note:"bb"}')
+        assert searched > 2
+        assert len(calls) == 2  # the result and the original, nothing searched
+        assert result.text == 'PUB(@t>@hub):{temp:19.0,load:7%,note:"bb"}'
+
+    def test_maxsize_must_be_positive(self):
+        with pytest.raises(ValueError):
+            Canonicalizer(counter=pieces, maxsize=0)
+
+    @pytest.mark.parametrize("encoding", ["cl100k_base", "o200k_base"])
+    def test_token_counter(self, encoding):
+        pytest.importorskip("tiktoken")
+        with open(os.path.join(ROOT, "examples", "advanced.axon")) as f:
+            source = f.read()
+        canon = Canonicalizer(encoding)
+        for result in canon.canonicalize(source):
+            assert _same_meaning(result.text, dumps(result.message))
+            assert result.saved >= 0
@@ -0,0 +1,145 @@
+"""
+Tests for the columnar AST: lossless conversion, views and offsets.
+"""
+
+import dataclasses
+import sys
+import os
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from axon_parser import parse, ASTNode, ParseLimits, NumberLiteral, Reference
+from axon_columnar import (
+    ColumnarAST,
+    NodeKind,
+    MessageView,
+    RecordView,
+    parse_columnar,
+    view,
+)
+
+ROOT = os.path.join(os.path.dirname(__file__), "..")
+
+CORPUS_FILES = [
+    os.path.join("examples", "basic.axon"),
+    os.path.join("examples", "advanced.axon"),
+    os.path.join("examples", "real_world_scenarios.axon"),
+    os.path.join("tests", "conformance", "valid_tier3.axon"),
+    os.path.join("tests", "conformance", "valid_operators.axon"),
+]
+
+
+def _spans(messages):
+    """Every node span under `messages`, in walk order."""
+    spans = []
+    stack = list(messages)
+    while stack:
+        value = stack.pop()
+        if isinstance(value, list):
+            stack.extend(reversed(value))
+        elif isinstance(value, dict):
+            stack.extend(reversed(list(value.values())))
+        elif isinstance(value, ASTNode):
+            spans.append(value.span)
+            stack.extend(reversed([getattr(value, f.name) for f in dataclasses.fields(value)
+                                   if f.compare]))
+    return spans
+
+
+def _read(relpath):
+    with open(os.path.join(ROOT, relpath)) as f:
+        return f.read()
+
+
+class TestRoundTrip:
+    @pytest.mark.parametrize("relpath", CORPUS_FILES)
+    def test_parse_target_is_lossless(self, relpath):
+        source = _read(relpath)
+        assert parse_columnar(source).to_messages() == parse(source)
+
+    @pytest.mark.parametrize("relpath", CORPUS_FILES)
+    def test_from_messages_is_lossless(self, relpath):
+        messages = parse(_read(relpath))
+        arena = ColumnarAST.from_messages(messages)
+        assert arena.to_messages() == messages
+        assert list(arena.kind) == list(parse_columnar(_read(relpath)).kind)
+
+    def test_value_types_survive(self):
+        source = ('INF(@a>[@b, @c]): f(n: 1, 2.5, 123456789012345678901234567890, 5ms, T, F, _, $v, x.y.z, '
+                  '"s", #t{k: [1..2]}, a <- b)')
+        message = parse_columnar(source).to_messages()[0]
+        assert message == parse(source)[0]
+        args = message.content.args
+        assert type(args[0].value.value) is int and type(args[1].value) is float
+
+    def test_deep_tree(self):
+        source = "INF(@a>@b): " + "[" * 5000 + "]" * 5000
+        messages = parse(source, ParseLimits(max_depth=None))
+        arena = ColumnarAST.from_messages(messages)
+        assert arena.kind.count(NodeKind.LIST) == 5000
+        node = arena.to_ast(arena.roots[0]).content
+        for _ in range(4999):
+            node = node.elements[0]
+        assert node.elements == []
+
+
+class TestViews:
+    SOURCE = ('[id:"m1"] PUB(@s>@hub): {temp: 21.5, load: 40%, tags: [#a, #b], '
+              'src: @s, f: g(n: 1) -> h}\n'
+              "ACK(@hub>*): _")
+
+    def test_message_accessors(self):
+        arena = parse_columnar(self.SOURCE)
+        first, second = arena
+        assert isinstance(first, MessageView) and len(arena) == 2
+        assert first.performative == "PUB"
+        assert first.routing.sender == "@s" and second.routing.receiver == "*"
+        assert first.meta.fields["id"].value == "m1"
+        assert second.meta is None
+
+    def test_content_accessors(self):
+        content = parse_columnar(self.SOURCE)[0].content
+        assert isinstance(content, RecordView)
+        fields = content.fields
+        assert fields["temp"].value == 21.5
+        assert (fields["load"].value, fields["load"].unit) == (40, "%")
+        assert [t.name for t in fields["tags"].elements] == ["#a", "#b"]
+        assert fields["src"].name == "@s"
+        flow = fields["f"]
+        assert flow.op == "->" and flow.right.name == "h"
+        assert flow.left.func == "g" and flow.left.args[0].name == "n"
+
+    def test_view_equals_node(self):
+        arena = parse_columnar(self.SOURCE)
+        assert arena[0].content.fields["temp"] == NumberLiteral(value=21.5)
+        assert arena[0] == parse(self.SOURCE)[0]
+
+
+class TestBulkScan:
+    def test_strings_are_interned(self):
+        source = "INF(@a>@b): @monitor\n" * 100
+        arena = parse_columnar(source)
+        assert arena.strings.count("@monitor") == 1
+        assert arena.kind.count(NodeKind.REF) == 100
+
+    def test_find(self):
+        arena = parse_columnar(TestViews.SOURCE)
+        refs = [arena.to_ast(i) for i in arena.find(NodeKind.REF)]
+        assert refs == [Reference(name="@s")]
+        assert list(arena.find(NodeKind.TAG, "#b")) == [
+            i for i in range(len(arena.kind)) if arena.kind[i] == NodeKind.TAG
+        ][1:]
+        assert list(arena.find(NodeKind.TAG, "#missing")) == []
+
+    @pytest.mark.parametrize("source", [TestViews.SOURCE, "INF(@a>[@b, @c]): (1 + 2) * x..y"])
+    def test_spans_match_parse(self, source):
+        messages = parse(source)
+        expected = _spans(messages)
+        for arena in (parse_columnar(source), ColumnarAST.from_messages(messages)):
+            nodes = [i for i in range(len(arena.kind)) if arena.offset[i] >= 0]
+            assert sorted(view(arena, i).span for i in nodes) == sorted(expected)
+            assert _spans(arena.to_messages()) == expected
+        arena = parse_columnar("INF(@a>@b): (1 + 2) * x")
+        spans = [view(arena, i).span for i in arena.find(NodeKind.BINARY)]
+        assert spans == [(12, 23), (12, 19)]
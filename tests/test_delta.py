@@ -0,0 +1,126 @@
+"""
+Tests for delta-coded PUB subscription streams.
+"""
+
+import sys
+import os
+import random
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from axon_parser import parse
+from axon_delta import DeltaDecoder, DeltaEncoder, DeltaError
+from axon_serializer import dumps
+
+
+def _send(encoder, source):
+    return [dumps(encoder.encode(m)) for m in parse(source)]
+
+
+def _receive(decoder, lines):
+    return [decoder.decode(m) for m in parse("\n".join(lines))]
+
+
+class TestDeltaCodec:
+    def test_sends_changed_fields(self):
+        source = ('PUB(@monitor>@dashboard): {host:"web-01", cpu:72%, mem:4.2GB, reqs:1250}\n'
+                  'PUB(@monitor>@dashboard): {host:"web-01", cpu:68%, mem:4.2GB, reqs:1180}\n'
+                  '[id:"m3"] PUB(@monitor>@dashboard): {host:"web-01", cpu:68%, reqs:1180, disk:3}\n')
+        wire = _send(DeltaEncoder(), source)
+        assert wire == [
+            '[seq:0] PUB(@monitor>@dashboard): {host:"web-01", cpu:72%, mem:4.2GB, reqs:1250}',
+            "[seq:1, delta:T] PUB(@monitor>@dashboard): {cpu:68%, reqs:1180}",
+            '[id:"m3", seq:2, delta:T, drop:[mem]] PUB(@monitor>@dashboard): {disk:3}',
+        ]
+        assert _receive(DeltaDecoder(), wire) == parse(source)
+
+    def test_keyframes(self):
+        lines = [f'PUB(@m>@d): {{a:"sensor-alpha", b:{n}}}' for n in range(8)]
+        lines.insert(4, 'PUB(@m>@d): {b:9, a:"sensor-alpha"}')  # reordered keys, then back
+        lines.append('PUB(@m>@d): {a:"sensor-beta", b:9}')     # everything changed
+        wire = _send(DeltaEncoder(keyframe_interval=3), "\n".join(lines))
+        keyframes = [n for n, text in enumerate(wire) if "delta" not in text]
+        assert keyframes == [0, 3, 4, 5, 8, 9]
+        assert _receive(DeltaDecoder(), wire) == parse("\n".join(lines))
+
+    def test_keyframe_when_shorter(self):
+        # The delta's meta costs more than the one unchanged field saves
+        source = "PUB(@m>@d): {a:1, b:1}\nPUB(@m>@d): {a:1, b:2}\nPUB(@m>@d): {a:1, b:3}\n"
+        wire = _send(DeltaEncoder(), source)
+        assert wire == ["[seq:0] PUB(@m>@d): {a:1, b:1}", "[seq:1] PUB(@m>@d): {a:1, b:2}",
+                        "[seq:2] PUB(@m>@d): {a:1, b:3}"]
+        assert _receive(DeltaDecoder(), wire) == parse(source)
+
+    def test_subscriptions_are_separate(self):
+        source = ("PUB(@a>@d): {x:1, y:1}\nPUB(@b>@d): {x:1, y:1}\n"
+                  "PUB(@a>[@d, @e]): {x:1, y:1}\nPUB(@a>@d): {x:2, y:1}\n")
+        wire = _send(DeltaEncoder(), source)
+        assert [text.startswith("[seq:0]") for text in wire] == [True, True, True, False]
+        assert _receive(DeltaDecoder(), wire) == parse(source)
+
+    def test_other_messages_pass_through(self):
+        source = "QRY(@a>@b): status\nPUB(@a>@b): 42\nPUB(@a>@b): #metrics{cpu:1}\n"
+        wire = _send(DeltaEncoder(), source)
+        assert wire == [dumps(m) for m in parse(source)]
+        assert _receive(DeltaDecoder(), wire) == parse(source)
+
+    def test_int_and_float_differ(self):
+        source = ("PUB(@m>@d): {cpu:72%, n:1, l:[2]}\nPUB(@m>@d): {cpu:72.0%, n:1.0, l:[2.0]}\n"
+                  "PUB(@m>@d): {cpu:72.0%, n:1, l:[2.0]}\n")
+        wire = _send(DeltaEncoder(), source)
+        assert wire[1:] == ["[seq:1] PUB(@m>@d): {cpu:72.0%, n:1.0, l:[2.0]}",
+                            "[seq:2, delta:T] PUB(@m>@d): {n:1}"]
+        received = _receive(DeltaDecoder(), wire)
+        assert [dumps(m) for m in received] == [dumps(m) for m in parse(source)]
+
+    def test_reserved_meta_key(self):
+        with pytest.raises(ValueError):
+            DeltaEncoder().encode(parse("[seq:1] PUB(@a>@b): {x:1}")[0])
+
+    def test_random_streams(self):
+        rnd = random.Random(20)
+        keys = ["a", "b", "c", "d"]
+        encoder, decoder = DeltaEncoder(keyframe_interval=5), DeltaDecoder()
+        for n in range(500):
+            present = [k for k in keys if rnd.random() < 0.8]
+            if rnd.random() < 0.1:
+                rnd.shuffle(present)
+            values = ["0", "1", "1.0", "2ms", '"a longer reading"']
+            body = ", ".join(f"{k}:{rnd.choice(values)}" for k in present)
+            message = parse(f"PUB(@s{rnd.randrange(3)}>@hub): {{{body}}}")[0]
+            wire = parse(dumps(encoder.encode(message)))[0]
+            assert dumps(decoder.decode(wire)) == dumps(message)
+
+
+class TestResync:
+    def test_gap_is_recovered_by_nak(self):
+        encoder, decoder = DeltaEncoder(), DeltaDecoder()
+        messages = parse("\n".join(f'PUB(@m>@d): {{a:"sensor-alpha", b:{n}}}'
+                                    for n in range(6)))
+        decoder.decode(encoder.encode(messages[0]))
+        encoder.encode(messages[1])  # lost in transit
+        wire = encoder.encode(messages[2])
+        with pytest.raises(DeltaError):
+            decoder.decode(wire)
+        nak = decoder.nak(wire)
+        assert dumps(nak) == "NAK(@d>@m): {reason:#resync, seq:2}"
+        # Deltas still in flight are rejected until the keyframe
+        with pytest.raises(DeltaError):
+            decoder.decode(encoder.encode(messages[3]))
+        encoder.receive(nak)
+        keyframe = encoder.encode(messages[4])
+        assert "delta" not in dumps(keyframe)
+        assert decoder.decode(keyframe) == messages[4]
+        assert decoder.decode(encoder.encode(messages[5])) == messages[5]
+
+    def test_delta_without_keyframe(self):
+        with pytest.raises(DeltaError):
+            DeltaDecoder().decode(parse("[seq:3, delta:T] PUB(@m>@d): {a:1}")[0])
+
+    def test_unsubscribe_forgets_stream(self):
+        encoder = DeltaEncoder()
+        message = parse("PUB(@m>@d): {a:1}")[0]
+        encoder.encode(message)
+        encoder.receive(parse("UNS(@d>@m): #metrics{src:@m}")[0])
+        assert dumps(encoder.encode(message)).startswith("[seq:0]")
@@ -0,0 +1,176 @@
+"""
+Tests for incremental re-lexing and re-parsing after edits.
+
+After every edit, IncrementalDocument must hold exactly what parse()
+and RegexLexer give for the whole new text (messages, spans, tokens and
+their positions), or raise exactly their error.
+"""
+
+import dataclasses
+import sys
+import os
+import random
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from axon_parser import (
+    ASTNode,
+    LexerError,
+    ParseError,
+    ParseLimits,
+    RegexLexer,
+    parse,
+)
+from axon_incremental import IncrementalDocument
+
+EXAMPLE_DIR = os.path.join(os.path.dirname(__file__), "..", "examples")
+
+
+def _read_example(name):
+    with open(os.path.join(EXAMPLE_DIR, name)) as f:
+        return f.read()
+
+
+def _spans(messages):
+    spans = []
+    stack = list(messages)
+    while stack:
+        value = stack.pop()
+        if isinstance(value, list):
+            stack.extend(value)
+        elif isinstance(value, dict):
+            stack.extend(value.values())
+        elif isinstance(value, ASTNode):
+            spans.append(value.span)
+            stack.extend(getattr(value, f.name) for f in dataclasses.fields(value) if f.compare)
+    return spans
+
+
+def _tokens(tokens):
+    return [(t.type, t.value, t.offset, t.end, t.line, t.col) for t in tokens]
+
+
+def _parse(source):
+    try:
+        return parse(source)
+    except (LexerError, ParseError) as e:
+        return str(e)
+
+
+def _check(doc, start, end, text, messages):
+    """Apply one edit; `messages` is the caller's copy of the list,
+    kept up to date from the returned Change."""
+    expected = _parse(doc.source[:start] + text + doc.source[end:])
+    try:
+        change = doc.edit(start, end, text)
+    except (LexerError, ParseError) as e:
+        assert str(e) == expected
+        return False
+    assert doc.messages == expected
+    assert _spans(doc.messages) == _spans(expected)
+    assert _tokens(doc.tokens) == _tokens(RegexLexer(doc.source).tokenize())
+    messages[change.index:change.index + change.removed] = change.messages
+    assert len(messages) == len(doc.messages)
+    assert all(a is b for a, b in zip(messages, doc.messages))
+    return True
+
+
+class TestEdits:
+    def test_keystrokes(self):
+        doc = IncrementalDocument('INF(@a>@b): {x:1}\nQRY(@a>@b): "hi"\n')
+        at = doc.source.index("1}")
+        change = doc.edit(at, at + 1, "12ms")
+        assert (change.index, change.removed) == (0, 1)
+        assert doc.messages[0].content.fields["x"].unit == "ms"
+        assert doc.messages[1].span == (21, 37) and doc.tokens[-1].offset == 38
+        # Inside a string: the string is re-lexed, its message re-parsed
+        at = doc.source.index('hi"') + 2
+        change = doc.edit(at, at, " there")
+        assert (change.index, change.removed) == (1, 1)
+        assert doc.messages[1].content.value == "hi there"
+        messages = list(doc.messages)
+        for start, end, text in [(0, 0, "\n(* c *)\n"), (53, 53, "\nACK(@b>@a): _"), (3, 3, "")]:
+            assert _check(doc, start, end, text, messages)
+
+    def test_messages_merge_and_split(self):
+        doc = IncrementalDocument("INF(@a>@b): a\nINF(@a>@b): b\nINF(@a>@b): c\n")
+        messages = list(doc.messages)
+        # "a" followed by "-> b": the first message now takes the second line
+        assert _check(doc, 14, 25, "->", messages)
+        assert doc.source.startswith("INF(@a>@b): a\n-> b\n")
+        assert len(doc.messages) == 2 and doc.messages[0].span == (0, 18)
+        assert _check(doc, 14, 16, "INF(@a>@b):", messages)
+        assert len(doc.messages) == 3
+
+    def test_failed_edits_keep_the_last_parse(self):
+        source = 'INF(@a>@b): {note:"x"}\nINF(@a>@b): 2\n'
+        doc = IncrementalDocument(source)
+        messages = list(doc.messages)
+        # Replacing 2 with "hi" one keystroke at a time
+        at = source.index("2")
+        for start, end, text in [(at, at + 1, ""), (at, at, '"'), (at + 1, at + 1, "hi")]:
+            assert not _check(doc, start, end, text, messages)
+            assert doc.messages == parse(source)
+        assert _check(doc, at + 3, at + 3, '"', messages)
+        assert doc.messages[1].content.value == "hi"
+
+    def test_comments_and_units(self):
+        doc = IncrementalDocument("INF(@a>@b): [5ms, 7] (* (* n *) *)\nINF(@a>@b): 1\n")
+        messages = list(doc.messages)
+        for start, end, text in [(15, 16, "s"), (15, 15, "in"), (13, 15, ""), (26, 26, "*)"),
+                                 (24, 24, "("), (23, 23, "(*"), (0, 0, "(*"), (0, 2, "")]:
+            _check(doc, start, end, text, messages)
+
+    def test_limits(self):
+        doc = IncrementalDocument("INF(@a>@b): [1]\n", ParseLimits(max_depth=6))
+        with pytest.raises(ParseError):
+            doc.edit(13, 14, "[[[[1]]]]")
+        doc.edit(13, 22, "2")
+        assert doc.messages == parse("INF(@a>@b): [2]\n")
+
+    def test_bad_range(self):
+        doc = IncrementalDocument("INF(@a>@b): 1")
+        with pytest.raises(ValueError):
+            doc.edit(5, 20, "")
+        with pytest.raises(ParseError):
+            IncrementalDocument("INF(@a>@b):")
+
+
+# ── Randomised against parse() ───────────────────────────────────────
+
+PIECES = ['"', "(*", "*)", "\n", " ", "x", "5", "ms", "->", "{", "}", "[", "]", ",",
+          ":", "INF(@a>@b): ", "@q", "#t", "(", ")", "é"]
+
+
+@pytest.mark.parametrize("seed", range(4))
+@pytest.mark.parametrize("name", ["basic.axon", "advanced.axon", "real_world_scenarios.axon"])
+def test_random_edits_match_parse(name, seed):
+    rnd = random.Random(seed)
+    doc = IncrementalDocument(_read_example(name), ParseLimits() if seed % 2 else None)
+    messages = list(doc.messages)
+    undo = None
+    for _ in range(60):
+        source = doc.source
+        if undo is not None and rnd.random() < 0.6:
+            # Put the damage right again, as an editor's undo would
+            start, end, text = undo
+            undo = None
+        elif rnd.random() < 0.4:
+            # Copy a line somewhere, or delete some lines
+            starts = [0] + [n + 1 for n, ch in enumerate(source) if ch == "\n"]
+            start = rnd.choice(starts)
+            end = start if rnd.random() < 0.5 else rnd.choice([s for s in starts if s >= start])
+            line = rnd.choice(starts)
+            undo = None
+            text = source[line:source.find("\n", line) + 1] if rnd.random() < 0.7 else ""
+        else:
+            start = rnd.randrange(len(source) + 1)
+            end = min(len(source), start + rnd.choice([0, 0, 1, 2, 5, 30]))
+            if rnd.random() < 0.5:
+                text = "".join(rnd.choice(PIECES) for _ in range(rnd.randint(0, 3)))
+            else:
+                at = rnd.randrange(len(source) + 1)
+                text = source[at:at + rnd.randint(0, 40)]
+            undo = (start, start + len(text), source[start:end])
+        _check(doc, start, end, text, messages)
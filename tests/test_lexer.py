@@ -0,0 +1,201 @@
+"""
+Differential tests for the compiled lexer.
+
+RegexLexer must produce exactly the token stream (types, values and
+positions) and exactly the errors of the reference per-character Lexer.
+ByteLexer must produce the same from the UTF-8 encoded source, with
+byte offsets.
+"""
+
+import sys
+import os
+import mmap
+import random
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from axon_parser import ByteLexer, Lexer, LineTable, RegexLexer, LexerError, TokenType
+
+ROOT = os.path.join(os.path.dirname(__file__), "..")
+
+CORPUS_FILES = [
+    os.path.join("examples", "basic.axon"),
+    os.path.join("examples", "advanced.axon"),
+    os.path.join("examples", "real_world_scenarios.axon"),
+    os.path.join("tests", "conformance", "valid_tier1.axon"),
+    os.path.join("tests", "conformance", "valid_tier2.axon"),
+    os.path.join("tests", "conformance", "valid_tier3.axon"),
+    os.path.join("tests", "conformance", "valid_performatives.axon"),
+    os.path.join("tests", "conformance", "valid_operators.axon"),
+]
+
+
+def _lex(cls, source):
+    try:
+        return [(t.type, t.value, t.line, t.col, t.offset, t.end) for t in cls(source).tokenize()]
+    except LexerError as e:
+        return ("error", str(e), e.line, e.col)
+
+
+def _lex_bytes(source):
+    """ByteLexer's tokens or error, with positions turned back into
+    character offsets and columns."""
+    data = source.encode()
+    chars = lambda offset: len(data[:offset].decode())
+    try:
+        tokens = ByteLexer(data).tokenize()
+    except LexerError as e:
+        line = data.split(b"\n")[e.line - 1]
+        return ("error", e.msg, e.line, len(line[:e.col - 1].decode()) + 1)
+    return [(t.type, t.value, chars(t.offset), chars(t.end)) for t in tokens]
+
+
+def _assert_same(source):
+    expected = _lex(Lexer, source)
+    assert _lex(RegexLexer, source) == expected, repr(source)
+    if expected[0] == "error":
+        expected = ("error", expected[1].split(": ", 1)[1]) + expected[2:]
+    else:
+        expected = [(t[0], t[1], t[4], t[5]) for t in expected]
+    assert _lex_bytes(source) == expected, repr(source)
+
+
+# ── Corpus ───────────────────────────────────────────────────────────
+
+@pytest.mark.parametrize("relpath", CORPUS_FILES)
+def test_corpus_matches_reference(relpath):
+    with open(os.path.join(ROOT, relpath)) as f:
+        _assert_same(f.read())
+
+
+# ── Edge cases ───────────────────────────────────────────────────────
+
+EDGE_CASES = [
+    # "-" inside identifiers unless it starts "->"
+    "a-b->c", "x-->y", "@agent-1>@agent-2", "task-", "#q-user-lookup",
+    # "%" unit vs "%%" meta key
+    "99.7%", "5%%", "[%%:1]", "5%%%", "3%x", "10%_",
+    # units: longest match, word-boundary check
+    "5min", "5mins", "5ms", "5msx", "5s", "2.50usd", "5tok", "5tokens", "4.2GB", "3KB_",
+    # numbers next to ranges and dots
+    "1..100", "1.5..2.5", "5.", "5.x", "0..", "3.14.15",
+    # nested and unterminated comments
+    "(* a (* b *) c *) INF", "(*)", "(**)", "(*> x", "(* open", "(* a (* b *)",
+    "(*\n(*\n*)\n*)\nx",
+    # strings and escapes
+    '"a\\"b"', '"tab\\tnl\\n"', '"\\q"', '"multi\nline" x', '"open', '"ends in \\',
+    '"\\\\"', '"\\\n"', '"a\nb', '"a\n\\', 'x "a\\\nb\n" y',
+    # \u{XXXX}: code points only, anything else drops the backslash
+    '"\\u{41}\\u{1F600}\\u{e9}"', '"\\u{D800}\\u{110000}\\u{}\\u{1234567}\\u41"',
+    '"\\\\u{41}"', '"é\\u{2603}" "日本"',
+    # sigils
+    "@*", "@a.b.c", "#ont.industrial.temp", "$x.y", "@a..b", "@1", "#", "$",
+    # two-character operators
+    "<- <= >= != == -> ..", "<<-", "!==", "=>",
+    # keywords
+    "INF T F TF X.a.b", "_x", "__",
+    # non-ASCII identifier and digit characters take the fallback path
+    "café", "@café.menu", "#naïve", "5é", "5.²", "x y", "٣", "5٣", "a.é",
+    "naïve-x->y", "é%%", "5msé", "@a.b.日本", "😀", "x 😀",
+    # unexpected characters
+    "`", "INF(@a>@b): `x",
+    "",
+]
+
+
+@pytest.mark.parametrize("source", EDGE_CASES)
+def test_edge_case_matches_reference(source):
+    _assert_same(source)
+
+
+def test_lazy_strings_keep_positions_only():
+    source = 'INF(@a>@b): {a:"x\\"y", b:"z\nw"} 1'
+    eager = RegexLexer(source).tokenize()
+    lazy = RegexLexer(source, lazy_strings=True).tokenize()
+    assert [t.value for t in lazy if t.type is TokenType.STRING] == [None, None]
+    assert ([(t.type, t.line, t.col, t.offset) for t in lazy]
+            == [(t.type, t.line, t.col, t.offset) for t in eager])
+
+
+def test_positions_across_lines():
+    source = '(* c\n *)\nINF(@a>@b): "x\ny" 5ms\n  z'
+    tokens = RegexLexer(source).tokenize()
+    assert [(t.value, t.line, t.col) for t in tokens if t.type != TokenType.NEWLINE] == [
+        ("INF", 3, 1), ("(", 3, 4), ("@a", 3, 5), (">", 3, 7), ("@b", 3, 8),
+        (")", 3, 10), (":", 3, 11), ("x\ny", 3, 13), ("5", 4, 4), ("ms", 4, 5),
+        ("z", 5, 3), ("", 5, 4),
+    ]
+
+
+def test_line_table():
+    lines = LineTable("ab\n\ncd\n")
+    assert [lines.position(i) for i in range(8)] == [
+        (1, 1), (1, 2), (1, 3), (2, 1), (3, 1), (3, 2), (3, 3), (4, 1)]
+    # A piece of a larger document: offset 10 is line 4, column 6
+    piece = LineTable("x\ny", base=10, line=4, col=6)
+    assert [piece.position(i) for i in (10, 11, 12)] == [(4, 6), (4, 7), (5, 1)]
+    piece.discard(12)
+    assert piece.position(12) == (5, 1) and piece.position(10) == (0, 0)
+
+
+def test_unicode_escapes():
+    tokens = RegexLexer(r'"\u{48}i \u{1f44b}" "\u{dfff}"').tokenize()
+    assert [t.value for t in tokens[:2]] == ["Hi \U0001f44b", "u{dfff}"]
+
+
+def test_errors_locate_offsets():
+    with pytest.raises(LexerError) as e:
+        RegexLexer('INF(@a>@b): {\n  a: "x\n').tokenize()
+    assert (e.value.line, e.value.col) == (3, 1)
+    with pytest.raises(LexerError) as e:
+        Lexer("INF(@a>@b):\n  `").tokenize()
+    assert (e.value.line, e.value.col) == (2, 3)
+
+
+# ── Randomised differential ──────────────────────────────────────────
+
+FRAGMENTS = [
+    "(*", "*)", "(*>", '"', "\\", "\n", " ", "\t", "\r", "-", ">", "<", "=", "!",
+    ".", "%", "@", "#", "$", "_", "a", "Z", "INF", "T", "X", "0", "7", "3.5",
+    "ms", "min", "KB", "s", "tok", "é", "²", "日", "😀", "*", "(", ")", "[", "]", "{", "}",
+    ":", ",", "&", "|", "~", "^", "+", "/", "`", "x-", "a.b", "..",
+]
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_random_fragments_match_reference(seed):
+    rnd = random.Random(seed)
+    for _ in range(400):
+        source = "".join(rnd.choice(FRAGMENTS) for _ in range(rnd.randint(0, 24)))
+        _assert_same(source)
+
+
+# ── Byte input ───────────────────────────────────────────────────────
+
+def test_byte_sources(tmp_path):
+    source = 'INF(@a>@b): {note:"naïve \\u{2603}", t:5ms, who:@café}\n'
+    expected = [(t.type, t.value, t.offset) for t in ByteLexer(source.encode()).tokenize()]
+    assert ("naïve \u2603", len(source.encode())) == (expected[10][1], expected[-1][2])
+    path = tmp_path / "x.axon"
+    path.write_text(source, encoding="utf-8")
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        assert [(t.type, t.value, t.offset) for t in ByteLexer(data).tokenize()] == expected
+    data = bytearray(source.encode())
+    assert [(t.type, t.value, t.offset) for t in ByteLexer(data).tokenize()] == expected
+
+
+def test_byte_positions_count_bytes():
+    tokens = ByteLexer('"é" x\n  @ü y'.encode()).tokenize()
+    assert [(t.value, t.line, t.col, t.offset) for t in tokens if t.type != TokenType.NEWLINE] == [
+        ("é", 1, 1, 0), ("x", 1, 6, 5), ("@ü", 2, 3, 9), ("y", 2, 7, 13), ("", 2, 8, 14)]
+
+
+def test_invalid_utf8():
+    for data, line, col in [(b'INF(@a>@b): "x\xffy"', 1, 15), (b"INF(@a>@b): caf\xe9", 1, 16),
+                            (b'x\n"\xe9"', 2, 2)]:
+        with pytest.raises(LexerError) as e:
+            ByteLexer(data).tokenize()
+        assert (e.value.msg, e.value.line, e.value.col) == ("Invalid UTF-8", line, col)
+    # Lazy string bodies are not decoded until read
+    assert ByteLexer(b'"\xff"', lazy_strings=True).tokenize()[0].value is None
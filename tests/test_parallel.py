@@ -0,0 +1,218 @@
+"""
+Tests for multi-core batch parsing and the payloads its workers send.
+"""
+
+import dataclasses
+import sys
+import os
+import pickle
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from axon_binary import decode, encode
+from axon_cache import freeze
+from axon_parser import LexerError, LimitExceeded, ParseError, ParseLimits, parse
+from axon_parallel import ParseResult, parse_document, parse_many
+
+ROOT = os.path.join(os.path.dirname(__file__), "..")
+
+CORPUS_FILES = [
+    os.path.join("examples", "basic.axon"),
+    os.path.join("examples", "advanced.axon"),
+    os.path.join("examples", "real_world_scenarios.axon"),
+    os.path.join("tests", "conformance", "valid_tier1.axon"),
+    os.path.join("tests", "conformance", "valid_tier2.axon"),
+    os.path.join("tests", "conformance", "valid_tier3.axon"),
+    os.path.join("tests", "conformance", "valid_performatives.axon"),
+    os.path.join("tests", "conformance", "valid_operators.axon"),
+]
+
+
+def _read(relpath):
+    with open(os.path.join(ROOT, relpath)) as f:
+        return f.read()
+
+
+def _exact(messages):
+    """repr distinguishes 1 from 1.0 and list from tuple."""
+    return repr(messages)
+
+
+# ── Worker payloads ──────────────────────────────────────────────────
+
+@pytest.mark.parametrize("relpath", CORPUS_FILES)
+def test_payload_round_trip(relpath):
+    messages = parse(_read(relpath))
+    payload = pickle.loads(pickle.dumps(encode(messages, spans=True)))
+    assert _exact(decode(payload)) == _exact(messages)
+
+
+def test_payload_smaller_than_pickle():
+    messages = parse(_read(os.path.join("examples", "real_world_scenarios.axon")))
+    assert len(pickle.dumps(encode(messages, spans=True))) < len(pickle.dumps(messages)) / 2
+
+
+def test_empty_containers_and_meta():
+    source = ('[id:"x", ^:T] INF(@a>[@b, @c]): [f(), [], {}, #t{}, g(n: -1..2, p.q.r)]\n'
+              "[] ACK(@a>@b): _")
+    messages = parse(source)
+    assert _exact(decode(encode(messages, spans=True))) == _exact(messages)
+
+
+def test_spans_round_trip():
+    messages = parse(_read(os.path.join("examples", "advanced.axon")))
+    spans = [n.span for n in _walk(messages)]
+    assert [n.span for n in _walk(decode(encode(messages, spans=True)))] == spans
+    assert -1 not in (offset for span in spans for offset in span)
+
+
+@pytest.mark.parametrize("make", [
+    lambda source: parse(source, lazy=True),
+    lambda source: parse(source, lazy_literals=True),
+    lambda source: freeze(parse(source)),
+], ids=["lazy", "lazy_literals", "frozen"])
+def test_payload_accepts_node_subclasses(make):
+    source = _read(os.path.join("examples", "advanced.axon"))
+    messages = parse(source)
+    back = decode(encode(make(source), spans=True))
+    assert _exact(back) == _exact(messages)
+    assert [n.span for n in _walk(back)] == [n.span for n in _walk(messages)]
+
+
+def _walk(value):
+    if isinstance(value, list):
+        for v in value:
+            yield from _walk(v)
+    elif isinstance(value, dict):
+        yield from _walk(list(value.values()))
+    elif dataclasses.is_dataclass(value):
+        yield value
+        for f in dataclasses.fields(value):
+            yield from _walk(getattr(value, f.name))
+
+
+# ── Errors cross process boundaries ──────────────────────────────────
+
+@pytest.mark.parametrize("source,error", [
+    ('"open', LexerError),
+    ("INF(@a>@b): [1,", ParseError),
+])
+def test_errors_pickle(source, error):
+    with pytest.raises(error) as info:
+        parse(source)
+    copy = pickle.loads(pickle.dumps(info.value))
+    assert type(copy) is error
+    assert str(copy) == str(info.value)
+
+
+@pytest.mark.parametrize("lazy_literals", [False, True])
+def test_parse_error_pickles_without_source(lazy_literals):
+    source = "INF(@a>@b): 1\n" * 1000 + '  INF(@a>@b) "s"'
+    with pytest.raises(ParseError) as info:
+        parse(source, lazy_literals=lazy_literals)
+    data = pickle.dumps(info.value)
+    assert len(data) < 500
+    copy = pickle.loads(data)
+    assert str(copy) == str(info.value)
+    assert (copy.token.line, copy.token.col, copy.token.value) == (1001, 14, "s")
+
+
+def test_limit_exceeded_pickles():
+    with pytest.raises(LimitExceeded) as info:
+        parse("INF(@a>@b): [[[[1]]]]", ParseLimits(max_depth=2))
+    copy = pickle.loads(pickle.dumps(info.value))
+    assert (str(copy), copy.limit, copy.bound) == (str(info.value), "max_depth", 2)
+
+
+# ── parse_many ───────────────────────────────────────────────────────
+
+SOURCES = [_read(p) for p in CORPUS_FILES] + [
+    "INF(@a>@b): [1,",
+    "",
+    '"open',
+    "INF(@a>@b): 1\nINF(@a>@b): 2.0",
+]
+
+
+def _expected(source):
+    try:
+        return ("ok", _exact(parse(source)))
+    except (LexerError, ParseError) as e:
+        return (type(e), str(e))
+
+
+def _observed(result):
+    assert isinstance(result, ParseResult)
+    if result.ok:
+        return ("ok", _exact(result.messages))
+    return (type(result.error), str(result.error))
+
+
+@pytest.mark.parametrize("workers,chunksize", [(1, None), (2, 1), (3, 4), (2, None)])
+def test_parse_many_matches_parse(workers, chunksize):
+    results = parse_many(SOURCES, workers=workers, chunksize=chunksize)
+    assert [_observed(r) for r in results] == [_expected(s) for s in SOURCES]
+
+
+def test_parse_many_limits():
+    results = parse_many(["INF(@a>@b): [[[1]]]", "INF(@a>@b): 1"] * 2, workers=2,
+                         chunksize=1, limits=ParseLimits(max_depth=2))
+    assert [type(r.error) for r in results] == [LimitExceeded, type(None)] * 2
+
+
+def test_parse_many_empty():
+    assert parse_many([], workers=4) == []
+
+
+@pytest.mark.parametrize("kwargs", [{"workers": 0}, {"workers": 2, "chunksize": 0}])
+def test_parse_many_rejects_bad_arguments(kwargs):
+    with pytest.raises(ValueError):
+        parse_many(["INF(@a>@b): 1"] * 3, **kwargs)
+
+
+# ── parse_document ───────────────────────────────────────────────────
+
+def _document_outcome(fn, source):
+    try:
+        return ("ok", _exact(fn(source)))
+    except (LexerError, ParseError) as e:
+        return (type(e), str(e))
+
+
+DOCUMENT = "\n".join(_read(p) for p in CORPUS_FILES[:3]) * 3
+
+
+@pytest.mark.parametrize("workers", [1, 2, 3])
+def test_parse_document_matches_parse(workers):
+    assert (_document_outcome(lambda s: parse_document(s, workers=workers), DOCUMENT)
+            == _document_outcome(parse, DOCUMENT))
+
+
+@pytest.mark.parametrize("at", [0.1, 0.5, 0.9, 1.0])
+def test_parse_document_error_matches_parse(at):
+    k = int(len(DOCUMENT) * at)
+    for inserted in (" ] ", ' "', " (* ", " , "):
+        source = DOCUMENT[:k] + inserted + DOCUMENT[k:]
+        observed = _document_outcome(lambda s: parse_document(s, workers=3), source)
+        assert observed == _document_outcome(parse, source)
+
+
+def test_parse_document_positions_are_absolute():
+    source = DOCUMENT + "\nINF(@a>@b): [1,"
+    with pytest.raises(ParseError) as full:
+        parse(source)
+    with pytest.raises(ParseError) as split:
+        parse_document(source, workers=2, pieces_per_worker=8)
+    assert split.value.token == full.value.token
+
+
+def test_parse_document_spans_are_absolute():
+    expected = [n.span for n in _walk(parse(DOCUMENT))]
+    assert [n.span for n in _walk(parse_document(DOCUMENT, workers=2))] == expected
+
+
+def test_parse_document_limits():
+    source = DOCUMENT + "\nINF(@a>@b): [[[[1]]]]"
+    with pytest.raises(LimitExceeded):
+        parse_document(source, workers=2, limits=ParseLimits(max_depth=3))
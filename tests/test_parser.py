@@ -0,0 +1,866 @@
+"""
+Tests for the AXON parser engine: pull-based token consumption and
+AST shapes.
+"""
+
+import dataclasses
+import sys
+import os
+import random
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from axon_parser import (
+    parse,
+    ASTNode,
+    Lexer,
+    RegexLexer,
+    Parser,
+    StackParser,
+    ParseLimits,
+    ParseError,
+    LimitExceeded,
+    LexerError,
+    TokenType,
+    BinaryExpr,
+    RangeExpr,
+    CallExpr,
+    Identifier,
+    ListExpr,
+    Message,
+    NumberLiteral,
+    format_ast,
+    InternTable,
+    LazyMessage,
+    LazyString,
+    LazyNumber,
+    StringLiteral,
+    message_boundaries,
+    parse_bytes,
+    SymbolDictionary,
+    SymbolEncoder,
+    SymbolDecoder,
+)
+
+EXAMPLE_DIR = os.path.join(os.path.dirname(__file__), "..", "examples")
+
+
+def _read_example(name):
+    with open(os.path.join(EXAMPLE_DIR, name)) as f:
+        return f.read()
+
+
+class _CountingTokens:
+    """Token iterator that records how many tokens have been pulled."""
+
+    def __init__(self, tokens):
+        self._it = iter(tokens)
+        self.pulled = 0
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        tok = next(self._it)
+        self.pulled += 1
+        return tok
+
+
+# ── Pull-based parsing ───────────────────────────────────────────────
+
+class TestTokenStream:
+    @pytest.mark.parametrize("lexer_cls", [Lexer, RegexLexer])
+    def test_iter_tokens_matches_tokenize(self, lexer_cls):
+        source = _read_example("real_world_scenarios.axon")
+        lazy = [(t.type, t.value, t.line, t.col, t.offset) for t in lexer_cls(source).iter_tokens()]
+        eager = [(t.type, t.value, t.line, t.col, t.offset) for t in lexer_cls(source).tokenize()]
+        assert lazy == eager
+
+    def test_generator_and_list_parse_identically(self):
+        source = _read_example("advanced.axon")
+        from_list = Parser(Lexer(source).tokenize()).parse()
+        from_stream = Parser(RegexLexer(source).iter_tokens()).parse()
+        assert from_stream == from_list
+
+    def test_messages_yielded_before_stream_is_drained(self):
+        source = "INF(@a>@b): x\n" * 1000
+        tokens = _CountingTokens(RegexLexer(source).iter_tokens())
+        messages = Parser(tokens).iter_messages()
+        first = next(messages)
+        assert first.performative == "INF"
+        # 7 tokens + NEWLINE per message; only lookahead beyond the first
+        assert tokens.pulled <= 8 + 2 * Parser.LOOKAHEAD
+        assert sum(1 for _ in messages) == 999
+
+    def test_extension_lookahead_over_stream(self):
+        source = "INF(@a>@b): X.acme.audit(@c>@d): log(#all)"
+        msgs = Parser(RegexLexer(source).iter_tokens()).parse()
+        assert msgs[0].content.performative == "X.acme.audit"
+
+    def test_eof_repeats_past_end(self):
+        parser = Parser(RegexLexer("INF").iter_tokens())
+        assert parser._peek_at(Parser.LOOKAHEAD).type == TokenType.EOF
+
+    def test_errors_keep_positions(self):
+        source = "INF(@a>@b): x\nINF(@a>@b) y"
+        with pytest.raises(ParseError, match="at 2:12"):
+            Parser(RegexLexer(source).iter_tokens()).parse()
+
+    @pytest.mark.parametrize("limits", [None, ParseLimits()])
+    def test_earlier_parse_error_before_later_lexer_error(self, limits):
+        # The lexer is pulled as the parser goes, so the parse error at
+        # 1:7 comes out, not the lexer error at 1:26 (spec §10)
+        source = "[^:1, ^:5] INF(@a>@a): ~@-1"
+        with pytest.raises(LexerError, match="at 1:26"):
+            RegexLexer(source).tokenize()
+        with pytest.raises(ParseError, match="at 1:7: Duplicate metadata key"):
+            parse(source, limits)
+        with pytest.raises(ParseError, match="at 1:7"):
+            parse_bytes(source.encode(), limits)
+
+    def test_public_parse_unchanged(self):
+        assert len(parse(_read_example("basic.axon"))) == 8
+
+
+# ── Precedence climbing ──────────────────────────────────────────────
+
+class _CascadeParser(Parser):
+    """The one-method-per-level descent the binding table replaced."""
+
+    def _parse_expression(self):
+        return self._parse_causal()
+
+    def _parse_causal(self):
+        parts = [self._parse_sequence()]
+        while self._peek().type == TokenType.BACKARROW:
+            self._advance()
+            parts.append(self._parse_sequence())
+        result = parts[-1]
+        for i in range(len(parts) - 2, -1, -1):
+            result = BinaryExpr(op="<-", left=parts[i], right=result)
+        return result
+
+    def _left_assoc(self, operand, types):
+        left = operand()
+        while self._peek().type in types:
+            op = self._advance()
+            left = BinaryExpr(op=op.value, left=left, right=operand())
+        return left
+
+    def _parse_sequence(self):
+        return self._left_assoc(self._parse_parallel, {TokenType.ARROW})
+
+    def _parse_parallel(self):
+        return self._left_assoc(self._parse_disjunction, {TokenType.AMP})
+
+    def _parse_disjunction(self):
+        return self._left_assoc(self._parse_comparison, {TokenType.PIPE})
+
+    def _parse_comparison(self):
+        left = self._parse_additive()
+        if self._peek().type in {TokenType.LT, TokenType.GT, TokenType.LTE,
+                                 TokenType.GTE, TokenType.NEQ, TokenType.EQ}:
+            op = self._advance()
+            return BinaryExpr(op=op.value, left=left, right=self._parse_additive())
+        return left
+
+    def _parse_additive(self):
+        return self._left_assoc(self._parse_multiplicative, {TokenType.PLUS, TokenType.MINUS})
+
+    def _parse_multiplicative(self):
+        return self._left_assoc(self._parse_range, {TokenType.STAR, TokenType.SLASH})
+
+    def _parse_range(self):
+        left = self._parse_primary()
+        if self._peek().type == TokenType.DOTDOT:
+            self._advance()
+            return RangeExpr(start=left, end=self._parse_primary())
+        return left
+
+
+def _outcome(parser_cls, source):
+    try:
+        return parser_cls(RegexLexer(source).iter_tokens()).parse()
+    except (LexerError, ParseError) as e:
+        return ("error", str(e))
+
+
+def _expr(source):
+    return parse("INF(@a>@b): " + source)[0].content
+
+
+class TestPrecedenceClimbing:
+    def test_bare_primary(self):
+        assert _expr("42") == NumberLiteral(value=42)
+
+    def test_causal_is_right_associative(self):
+        node = _expr("a <- b <- c")
+        assert node.op == "<-" and node.left == Identifier(name="a")
+        assert node.right == BinaryExpr(op="<-", left=Identifier(name="b"), right=Identifier(name="c"))
+
+    def test_long_causal_chain(self):
+        # Read in a loop, as before precedence climbing: no stack frame per <-
+        source = "INF(@a>@b): " + " <- ".join(["x"] * 2000)
+        for lazy in (False, True):
+            node = parse(source, lazy=lazy)[0].content
+            depth = 0
+            while isinstance(node, BinaryExpr):
+                assert node.op == "<-" and node.left == Identifier(name="x")
+                assert source[slice(*node.span)] == " <- ".join(["x"] * (2000 - depth))
+                node, depth = node.right, depth + 1
+            assert depth == 1999 and node == Identifier(name="x")
+
+    def test_sequence_is_left_associative(self):
+        node = _expr("a -> b -> c")
+        assert node.left == BinaryExpr(op="->", left=Identifier(name="a"), right=Identifier(name="b"))
+
+    def test_levels(self):
+        node = _expr("a <- b -> c & d | e < f + g * h..i")
+        ops = []
+        while isinstance(node, BinaryExpr):
+            ops.append(node.op)
+            node = node.right
+        assert ops == ["<-", "->", "&", "|", "<", "+", "*"]
+        assert isinstance(node, RangeExpr)
+
+    def test_prefix_binds_tighter_than_range(self):
+        node = _expr("-1..5")
+        assert isinstance(node, RangeExpr)
+        assert node.start == CallExpr(func="neg", args=[NumberLiteral(value=1)])
+
+    @pytest.mark.parametrize("source", ["a < b < c", "a = b != c", "1..2..3", "a < b + c > d"])
+    def test_non_associative_operators_do_not_chain(self, source):
+        with pytest.raises(ParseError):
+            parse("INF(@a>@b): " + source)
+
+    OPERANDS = ["a", "1", "5ms", '"s"', "f(x)", "(a)", "-b", "!c", "~1", "[a, b]", "{k: a}", "#t"]
+    OPERATORS = ["<-", "->", "&", "|", "<", ">", "<=", ">=", "!=", "=", "==",
+                 "+", "-", "*", "/", ".."]
+
+    @pytest.mark.parametrize("seed", range(4))
+    def test_matches_cascade(self, seed):
+        rnd = random.Random(seed)
+        for _ in range(300):
+            parts = [rnd.choice(self.OPERANDS)]
+            for _ in range(rnd.randint(0, 6)):
+                if rnd.random() < 0.1:
+                    parts.append(rnd.choice(self.OPERANDS))
+                else:
+                    parts.append(rnd.choice(self.OPERATORS))
+                parts.append(rnd.choice(self.OPERANDS))
+            source = "INF(@a>@b): " + " ".join(parts)
+            assert _outcome(Parser, source) == _outcome(_CascadeParser, source), source
+
+    @pytest.mark.parametrize("name", ["basic.axon", "advanced.axon", "real_world_scenarios.axon"])
+    def test_examples_match_cascade(self, name):
+        source = _read_example(name)
+        assert _outcome(Parser, source) == _outcome(_CascadeParser, source)
+
+
+# ── Node layout ──────────────────────────────────────────────────────
+
+class TestSlottedNodes:
+    def test_nodes_have_no_instance_dict(self):
+        message = parse(_read_example("advanced.axon"))[0]
+        stack = [message]
+        while stack:
+            node = stack.pop()
+            assert not hasattr(node, "__dict__"), type(node).__name__
+            for name in node.__slots__:
+                value = getattr(node, name)
+                if isinstance(value, list):
+                    stack.extend(v for v in value if hasattr(v, "__slots__"))
+                elif isinstance(value, dict):
+                    stack.extend(value.values())
+                elif hasattr(value, "__slots__"):
+                    stack.append(value)
+
+    def test_equality_and_fields_unchanged(self):
+        assert NumberLiteral(5, "ms") == NumberLiteral(value=5, unit="ms")
+        assert NumberLiteral(5) != NumberLiteral(5, "ms")
+        assert BinaryExpr("+", Identifier("a"), Identifier("b")).left.name == "a"
+        assert parse(_read_example("basic.axon")) == parse(_read_example("basic.axon"))
+
+
+# ── Interning ────────────────────────────────────────────────────────
+
+class TestInterning:
+    def test_table_returns_first_object(self):
+        table = InternTable()
+        first = "".join(["@mon", "itor"])
+        second = "".join(["@moni", "tor"])
+        assert first is not second
+        assert table(first) is first and table(second) is first
+
+    def test_table_is_bounded(self):
+        table = InternTable(maxsize=10)
+        for i in range(1000):
+            table(f"name-{i}")
+        assert len(table) <= 20
+
+    def test_names_in_use_survive_a_generation(self):
+        table = InternTable(maxsize=4)
+        keep = table("".join(["@k", "eep"]))
+        for i in range(6):
+            table(f"n{i}")
+            assert table("".join(["@ke", "ep"])) is keep
+
+    @pytest.mark.parametrize("lexer_cls", [Lexer, RegexLexer])
+    def test_token_values_shared(self, lexer_cls):
+        source = "INF(@monitor>@hub): [#metrics, $v, cpu, X.a.b]\n" * 3
+        by_value = {}
+        for tok in lexer_cls(source).tokenize():
+            if tok.type in (TokenType.REF, TokenType.TAG, TokenType.VAR,
+                            TokenType.IDENT, TokenType.PERFORMATIVE):
+                assert by_value.setdefault(tok.value, tok.value) is tok.value
+
+    def test_ast_names_shared(self):
+        messages = parse("X.acme.log(@a>@b): f.g(@a, #t)\n" * 2 + "X.acme.log(@a>@b): f.g(@a, #t)")
+        first, last = messages[0], messages[-1]
+        assert first.performative is last.performative
+        assert first.content.func is last.content.func
+        assert first.content.args[0].name is last.content.args[0].name
+        assert first.routing.sender is last.content.args[0].name
+
+
+# ── Explicit-stack parsing and limits ────────────────────────────────
+
+UNLIMITED = ParseLimits(max_depth=None, max_tokens=None,
+                        max_message_bytes=None, max_string_length=None)
+
+
+def _stack_outcome(source, limits=UNLIMITED):
+    try:
+        return StackParser(RegexLexer(source).iter_tokens(), limits).parse()
+    except (LexerError, ParseError) as e:
+        return ("error", str(e))
+
+
+class TestStackParser:
+    FRAGMENTS = ["INF(@a>@b):", "REQ(@a>[@b,@c]):", "X.d.a(*>@b):", "[id:1]", "(", ")",
+                 "[", "]", "{", "}", ",", ":", "k:", "a", "f", ".", "x.y", "#t", "#t{",
+                 "$v", "$v:", "@r", "1", "5ms", '"s"', "T", "_", "-", "~", "!", "<-", "->",
+                 "&", "|", "<", "=", "+", "*", "..", "REQ", "ACC(", "X", "f(", "g(n:"]
+
+    @pytest.mark.parametrize("name", ["basic.axon", "advanced.axon", "real_world_scenarios.axon"])
+    def test_examples_match_parser(self, name):
+        source = _read_example(name)
+        assert _stack_outcome(source) == _outcome(Parser, source)
+        assert _stack_outcome(source, ParseLimits()) == _outcome(Parser, source)
+
+    @pytest.mark.parametrize("seed", range(4))
+    def test_random_input_matches_parser(self, seed):
+        rnd = random.Random(seed)
+        for _ in range(500):
+            source = " ".join(rnd.choice(self.FRAGMENTS) for _ in range(rnd.randint(1, 25)))
+            if rnd.random() < 0.5:
+                source = "INF(@a>@b): " + source
+            assert _stack_outcome(source) == _outcome(Parser, source), source
+
+    @pytest.mark.parametrize("content", [
+        "[" * 20000 + "]" * 20000,
+        " <- ".join(["a"] * 20000),
+        "-" * 20000 + "1",
+        "f(" * 20000 + ")" * 20000,
+        "DEL(@a>@b): " * 5000 + "x",
+    ])
+    def test_deep_nesting_without_recursion(self, content):
+        messages = parse("INF(@a>@b): " + content, UNLIMITED)
+        assert len(messages) == 1
+
+    def test_deep_list_shape(self):
+        node = parse("INF(@a>@b): " + "[" * 3000 + "]" * 3000, UNLIMITED)[0].content
+        depth = 0
+        while node.elements:
+            node = node.elements[0]
+            depth += 1
+        assert node == ListExpr(elements=[]) and depth == 2999
+
+    def test_recursive_parser_still_available(self):
+        with pytest.raises(RecursionError):
+            parse("INF(@a>@b): " + "[" * 20000 + "]" * 20000)
+
+
+class TestParseLimits:
+    def _limit(self, source, **bounds):
+        with pytest.raises(LimitExceeded) as info:
+            parse(source, ParseLimits(**bounds))
+        return info.value
+
+    def test_max_depth(self):
+        err = self._limit("INF(@a>@b): " + "[" * 100 + "]" * 100, max_depth=50)
+        assert err.limit == "max_depth" and isinstance(err, ParseError)
+        assert len(parse("INF(@a>@b): " + "[" * 20 + "]" * 20, ParseLimits(max_depth=50))) == 1
+
+    def test_max_depth_on_operator_chain(self):
+        assert self._limit("INF(@a>@b): " + " <- ".join(["a"] * 100), max_depth=50).limit == "max_depth"
+
+    def test_max_tokens_per_message(self):
+        source = "INF(@a>@b): [" + ", ".join(["1"] * 50) + "]"
+        assert self._limit(source, max_tokens=60).limit == "max_tokens"
+        assert len(parse(source * 3, ParseLimits(max_tokens=120))) == 3
+
+    def test_max_message_bytes(self):
+        source = "INF(@a>@b): " + " + ".join(["1"] * 100)
+        err = self._limit(source, max_message_bytes=200)
+        assert err.limit == "max_message_bytes" and err.token.offset > 200
+        assert len(parse((source + "\n") * 3, ParseLimits(max_message_bytes=500))) == 3
+
+    def test_max_string_length(self):
+        err = self._limit('INF(@a>@b): "' + "x" * 100 + '"', max_string_length=99)
+        assert err.limit == "max_string_length" and err.token.col == 13
+
+    def test_meta_counts_towards_message(self):
+        assert self._limit("[id:[1, 2, 3]] INF(@a>@b): x", max_tokens=5).limit == "max_tokens"
+
+    def test_fails_before_reading_whole_message(self):
+        tokens = _CountingTokens(RegexLexer("INF(@a>@b): " + "[" * 10000).iter_tokens())
+        with pytest.raises(LimitExceeded):
+            StackParser(tokens, ParseLimits(max_depth=100)).parse()
+        assert tokens.pulled < 100 + Parser.LOOKAHEAD
+
+
+class TestFormatAst:
+    def test_deep_tree(self):
+        node = parse("INF(@a>@b): " + " <- ".join(["a"] * 3000), UNLIMITED)[0]
+        text = format_ast(node)
+        assert text.count("BinOp(") == 2999
+
+    def test_layout(self):
+        node = parse('[id:1] INF(@a>@b): [#t{k: f(n: 1..2, "s")}, a -> b]')[0]
+        assert format_ast(node) == "\n".join([
+            "Message(INF)",
+            "  Meta:",
+            "    id: Number(1)",
+            "  Routing(@a > @b)",
+            "  content:",
+            "    List([",
+            "      Tag(#t)",
+            "        Record({",
+            "          k: Call(f(n: Range(Number(1)..Number(2)), String(\"s\")))",
+            "        })",
+            "      BinOp(Ident(a) -> Ident(b))",
+            "    ])",
+        ])
+
+
+# ── Lazy content ─────────────────────────────────────────────────────
+
+class TestLazyContent:
+    @pytest.mark.parametrize("name", ["basic.axon", "advanced.axon", "real_world_scenarios.axon"])
+    def test_examples_equal_eager(self, name):
+        source = _read_example(name)
+        lazy = parse(source, lazy=True)
+        assert all(isinstance(m, LazyMessage) and not m.is_parsed for m in lazy)
+        assert lazy == parse(source)
+        assert parse(source) == lazy
+
+    def test_header_available_without_parsing_content(self):
+        source = '[id:"m1"] PUB(@s>[@a, @b]): {deep: [[[1]]]}\nACK(@a>@s): _'
+        first, second = parse(source, lazy=True)
+        assert first.meta == parse(source)[0].meta
+        assert (first.performative, first.routing.receiver) == ("PUB", ["@a", "@b"])
+        assert first.content_source == "{deep: [[[1]]]}"
+        assert not first.is_parsed
+        assert first.content == parse(source)[0].content and first.is_parsed
+
+    BOUNDARIES = [
+        "INF(@a>@b): x\nREQ(@b>@a): y",
+        "INF(@a>@b): f(x) [id:1] REQ(@b>@a): y",
+        "INF(@a>@b): REQ(@c>@d): X.a.b(@e>@f): x INF(@a>@b): y",
+        "INF(@a>@b): x -> REQ(@c>@d): y\nX.acme.log(@a>@b): z",
+        'INF(@a>@b): "[(" (* ) ] *) x.y.z(#t{k: "}"}) X.a.b(*>@c): 1',
+        "INF(@a>@b): a\n-> b\n<- c INF(@a>@b): -1..5 & ~x | !y",
+        "INF(@a>@b): café INF(@a>@b): @naïve.x INF(@a>@b): x é",
+        "INF(@a>@b): 5ms 5 INF(@a>@b): T",
+        "INF(@a>@b): ACC(1) [^:1] ACC(@b>@a): _",
+        "INF(@a>@b): {a: 1}(* trailing *)",
+        '[ctx:"c"] PUB(@x>@a): 12| 78=="s" <= .dom.act(@a>@b): [bar.baz]',
+        "INF(@a>@b): a < b + c > .d.e(@a>@b): 1..2 .. .f.g(@a>@b): x <- y",
+        "INF(@a>@b): a -> INF(@c>@d): b = c = .d.e(@a>@b): 1",
+    ]
+
+    @pytest.mark.parametrize("source", BOUNDARIES)
+    def test_boundaries_match_eager(self, source):
+        assert _lazy_outcome(source) == _outcome(Parser, source)
+
+    def test_content_error_raised_on_access(self):
+        source = "INF(@a>@b): [1, 2\n , ]\nACK(@b>@a): _"
+        with pytest.raises(ParseError) as expected:
+            parse(source)
+        first, second = parse(source, lazy=True)
+        assert second.performative == "ACK"
+        with pytest.raises(ParseError) as actual:
+            first.content
+        assert str(actual.value) == str(expected.value)
+
+    def test_empty_content_fails_eagerly(self):
+        with pytest.raises(ParseError, match="Unexpected token in expression"):
+            parse("INF(@a>@b):", lazy=True)
+
+    def test_with_limits(self):
+        source = "INF(@a>@b): " + "[" * 100 + "]" * 100
+        message = parse(source, ParseLimits(max_depth=50), lazy=True)[0]
+        with pytest.raises(LimitExceeded):
+            message.content
+        with pytest.raises(LimitExceeded):
+            parse(source + " ACK(@b>@a): _", ParseLimits(max_message_bytes=100), lazy=True)
+
+    @pytest.mark.parametrize("seed", range(3))
+    def test_random_input_matches_eager(self, seed):
+        rnd = random.Random(seed)
+        operands = ["a", "1", "5ms", '"s)"', "T", "_", "@r", "$v", "#t", "x.y", "ACC(1)",
+                    "f()", "(* c *) b", "[a, [b]]", "{k: (c)}", "#t{k: 1}", "REQ(@a>@b): z"]
+        operators = ["<-", "->", "&", "|", "<", "<=", "=", "==", "+", "-", "*", ".."]
+        for _ in range(200):
+            messages = []
+            for i in range(rnd.randint(1, 4)):
+                parts = [rnd.choice(operands)]
+                for _ in range(rnd.randint(0, 3)):
+                    parts += [rnd.choice(operators), rnd.choice(operands)]
+                meta = rnd.choice(["", f"[id:{i}] "])
+                # An extension performative's first token may be any token
+                perf = rnd.choice(["INF", "X.d.a", "<= .d.a", "== .d.a", ".. .d.a"])
+                messages.append(f"{meta}{perf}(@a>@b): " + rnd.choice([" ", "\n"]).join(parts))
+            source = rnd.choice(["\n", " "]).join(messages)
+            expected = _outcome(Parser, source)
+            if isinstance(expected, tuple):
+                # Invalid input still fails, though possibly at a later
+                # message's header first
+                assert isinstance(_lazy_outcome(source), tuple), source
+            else:
+                assert _lazy_outcome(source) == expected, source
+
+
+def _lazy_outcome(source):
+    try:
+        messages = parse(source, lazy=True)
+        for m in messages:
+            m.content
+        return messages
+    except (LexerError, ParseError) as e:
+        return ("error", str(e))
+
+
+# ── Lazy literals ────────────────────────────────────────────────────
+
+def _is_converted(node):
+    base = StringLiteral if isinstance(node, StringLiteral) else NumberLiteral
+    try:
+        base.__dict__["value"].__get__(node)
+    except AttributeError:
+        return False
+    return True
+
+
+class TestLazyLiterals:
+    @pytest.mark.parametrize("name", ["basic.axon", "advanced.axon", "real_world_scenarios.axon"])
+    def test_same_ast(self, name):
+        source = _read_example(name)
+        eager = parse(source)
+        assert parse(source, lazy_literals=True) == eager
+        assert eager == parse(source, lazy_literals=True)
+        assert parse(source, lazy=True, lazy_literals=True) == eager
+        assert parse(source, ParseLimits(), lazy_literals=True) == eager
+
+    def test_values_read_on_demand(self):
+        source = 'INF(@a>@b): {note:"say \\"hi\\"\\n", n:42, x:1.5ms}'
+        fields = parse(source, lazy_literals=True)[0].content.fields
+        note, n, x = fields["note"], fields["n"], fields["x"]
+        assert type(note) is LazyString and type(n) is LazyNumber
+        assert not any(_is_converted(node) for node in (note, n, x))
+        assert note.value == 'say "hi"\n'
+        assert (n.value, type(n.value)) == (42, int)
+        assert (x.value, x.unit) == (1.5, "ms")
+        assert all(_is_converted(node) for node in (note, n, x))
+        assert note == StringLiteral('say "hi"\n') and x == NumberLiteral(1.5, "ms")
+        assert x != NumberLiteral(1.5)
+
+    def test_pickles_as_plain_nodes(self):
+        import pickle
+        msg = parse('INF(@a>@b): ["s", 7]', lazy_literals=True)[0]
+        back = pickle.loads(pickle.dumps(msg))
+        assert [type(e) for e in back.content.elements] == [StringLiteral, NumberLiteral]
+        assert back == msg
+
+    def test_string_limit(self):
+        source = 'INF(@a>@b): "' + "x" * 50 + '"'
+        with pytest.raises(LimitExceeded):
+            parse(source, ParseLimits(max_string_length=10), lazy_literals=True)
+
+    def test_string_limit_decodes_only_long_strings(self, monkeypatch):
+        import axon_parser
+        decoded = []
+        string_at = axon_parser._string_at
+        monkeypatch.setattr(axon_parser, "_string_at",
+                            lambda source, offset: decoded.append(offset) or string_at(source, offset))
+        # 12 characters between the quotes, 10 once the escapes are read
+        source = 'INF(@a>@b): ["short", "\\t\\tx6789012"]'
+        limits = ParseLimits(max_string_length=10)
+        for run in (lambda: parse(source, limits, lazy_literals=True),
+                    lambda: parse_bytes(source.encode(), limits, lazy_literals=True)):
+            messages = run()
+            assert decoded == [22]  # the long string only
+            assert [e.value for e in messages[0].content.elements] == ["short", "\t\tx6789012"]
+            decoded.clear()
+
+    @pytest.mark.parametrize("source", ['PUB(@a>@a) "s6\\t"', 'INF(@a>@b): {"k": 1}'])
+    def test_error_shows_the_string(self, source):
+        with pytest.raises(ParseError) as eager:
+            parse(source)
+        for lazy in (lambda: parse(source, lazy_literals=True),
+                     lambda: parse(source, ParseLimits(), lazy_literals=True),
+                     lambda: parse_bytes(source.encode(), lazy_literals=True)):
+            with pytest.raises(ParseError) as error:
+                lazy()
+            assert str(error.value) == str(eager.value)
+
+
+# ── Source spans ─────────────────────────────────────────────────────
+
+def _nodes(value):
+    """Every AST node under `value`, parents first."""
+    stack = [value]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, list):
+            stack.extend(value)
+        elif isinstance(value, dict):
+            stack.extend(value.values())
+        elif isinstance(value, ASTNode):
+            yield value
+            stack.extend(getattr(value, f.name) for f in dataclasses.fields(value))
+
+
+def _spans(messages):
+    return [n.span for n in _nodes(messages)]
+
+
+def _parse_text(text, message):
+    parser = Parser(RegexLexer(text).iter_tokens())
+    node = parser._parse_message() if message else parser._parse_expression()
+    assert parser._peek().type is TokenType.EOF
+    return node
+
+
+SPAN_SOURCE = ('[id:"m1", ^:2] QRY(@a>[@b, @c]): [(x + 1) * -y..#t{k:"v"}, '
+               'f(n: 5ms, @r), p.q, [T, _, $v], INF(@b>*): "hi"]\n'
+               'X.acme.ping(@a>@b): ~!(z)')
+
+
+class TestSpans:
+    @pytest.mark.parametrize("name", ["basic.axon", "advanced.axon", "real_world_scenarios.axon"])
+    def test_every_node_reparses_from_its_text(self, name):
+        source = _read_example(name)
+        for node in _nodes(parse(source)):
+            start, end = node.span
+            assert 0 <= start < end <= len(source), node
+            if node.__class__.__name__ not in ("Routing", "MetaBlock", "NamedArg"):
+                assert _parse_text(source[start:end], isinstance(node, Message)) == node
+
+    def test_spans(self):
+        message = parse(SPAN_SOURCE)[0]
+        assert SPAN_SOURCE[slice(*message.span)] == SPAN_SOURCE.split("\n")[0]
+        assert SPAN_SOURCE[slice(*message.meta.span)] == '[id:"m1", ^:2]'
+        assert SPAN_SOURCE[slice(*message.routing.span)] == "@a>[@b, @c]"
+        grouped = message.content.elements[0]
+        assert SPAN_SOURCE[slice(*grouped.span)] == '(x + 1) * -y..#t{k:"v"}'
+        assert SPAN_SOURCE[slice(*grouped.left.span)] == "(x + 1)"
+        call = message.content.elements[1]
+        assert [SPAN_SOURCE[slice(*a.span)] for a in call.args] == ["n: 5ms", "@r"]
+        assert StringLiteral("x", offset=3) == StringLiteral("x")
+        assert StringLiteral("x").span == (-1, -1)
+        assert "offset" not in repr(message)
+
+    def test_parsers_agree(self):
+        expected = _spans(parse(SPAN_SOURCE))
+        assert _spans(parse(SPAN_SOURCE, ParseLimits())) == expected
+        assert _spans(parse(SPAN_SOURCE, lazy=True, lazy_literals=True)) == expected
+        lazy = parse(SPAN_SOURCE, lazy=True)
+        assert [m.span for m in lazy] == [m.span for m in parse(SPAN_SOURCE)]
+
+    def test_grouped_lazy_literals(self):
+        source = 'ACK(@x>@b.c): [("hello"), f(("a\\tb"), (42ms))]'
+        expected = parse(source)
+        for messages in (parse(source, lazy_literals=True),
+                         parse(source, ParseLimits(), lazy_literals=True),
+                         parse(source, lazy=True, lazy_literals=True),
+                         parse_bytes(source.encode(), lazy_literals=True),
+                         parse_bytes(source.encode(), ParseLimits(), lazy_literals=True)):
+            assert messages == expected
+            assert _spans(messages) == _spans(expected)
+        string = parse(source, lazy_literals=True)[0].content.elements[0]
+        assert source[slice(*string.span)] == '("hello")' and string.value == "hello"
+
+    def test_pickle_keeps_spans(self):
+        import pickle
+        messages = parse(SPAN_SOURCE, lazy_literals=True)
+        assert _spans(pickle.loads(pickle.dumps(messages))) == _spans(messages)
+
+
+# ── Byte input ───────────────────────────────────────────────────────
+
+class TestParseBytes:
+    @pytest.mark.parametrize("name", ["basic.axon", "advanced.axon", "real_world_scenarios.axon"])
+    def test_same_ast(self, name):
+        source = _read_example(name)
+        data = source.encode()
+        assert parse_bytes(data) == parse(source)
+        assert parse_bytes(bytearray(data), ParseLimits(), lazy_literals=True) == parse(source)
+
+    def test_spans_count_bytes(self):
+        data = 'INF(@zoë>@b): {café:"naïve", n:["ü", 5ms]}'.encode()
+        for node in _nodes(parse_bytes(data)):
+            if node.__class__.__name__ not in ("Routing", "NamedArg"):
+                text = data[slice(*node.span)].decode()
+                assert _parse_text(text, isinstance(node, Message)) == node
+
+    def test_lazy_strings_decode_on_read(self):
+        message = parse_bytes('INF(@a>@b): ["\\u{e9}t\u00e9", 1]'.encode(), lazy_literals=True)[0]
+        text = message.content.elements[0]
+        assert type(text) is LazyString and not _is_converted(text)
+        assert text.value == "été"
+
+
+# ── Message boundaries ───────────────────────────────────────────────
+
+def _pieces(source):
+    cuts = message_boundaries(source) + [len(source)]
+    return [source[a:b] for a, b in zip(cuts, cuts[1:])]
+
+
+class TestMessageBoundaries:
+    @pytest.mark.parametrize("name", ["basic.axon", "advanced.axon", "real_world_scenarios.axon"])
+    def test_examples_split_into_messages(self, name):
+        source = _read_example(name)
+        pieces = _pieces(source)
+        parsed = [parse(piece) for piece in pieces]
+        assert all(len(messages) == 1 for messages in parsed)
+        assert [m for messages in parsed for m in messages] == parse(source)
+
+    def test_offsets(self):
+        source = ('(* head *)\n[id:"]"] INF(@a>@b): "(*" X.d.a(*>@b): f(1) ACK(@b>@a): _\n'
+                  "QRY(@a>[@b, @c]): REQ(@a>@b): {k: [1, (2)]} (* ) *)")
+        assert message_boundaries(source) == [
+            source.index("[id"), source.index("X.d"), source.index("ACK"), source.index("QRY"),
+        ]
+
+    def test_empty(self):
+        assert message_boundaries("") == []
+        assert message_boundaries(" \n(* only a comment *)\n") == []
+
+    @pytest.mark.parametrize("source", [
+        "(* open", "INF(@a>@b): 1 (* open", 'INF(@a>@b): "open', "INF(@a>@b) 1",
+        "INF(@a>@b): 1, 2 ACK(@b>@a): _", "INF(@a>@b): [1 ACK(@b>@a): _",
+        "INF(@a>@b): 1 5ms.a.b(@a>@b): 2",
+    ])
+    def test_invalid_source_fails_in_some_piece(self, source):
+        with pytest.raises((LexerError, ParseError)):
+            parse(source)
+        failures = 0
+        for piece in _pieces(source):
+            try:
+                parse(piece)
+            except (LexerError, ParseError):
+                failures += 1
+        assert failures
+
+    def test_extension_performative_takes_any_token(self):
+        # The parser reads any one token as the X of X.domain.act
+        source = "INF(@a>@b): X{.a.b(@a>@b): 1"
+        assert len(parse(source)) == 2
+        assert message_boundaries(source) == [0, source.index("{")]
+
+    @pytest.mark.parametrize("seed", range(3))
+    def test_random_documents(self, seed):
+        rnd = random.Random(seed)
+        operands = ["a", "1", "5ms", '"s)"', "T", "_", "@r", "$v", "#t", "x.y", "ACC(1)",
+                    "f()", "(* c *) b", "[a, [b]]", "{k: (c)}", "#t{k: 1}", "REQ(@a>@b): z",
+                    '"[x"', "café", "X.a.b(1)"]
+        operators = ["<-", "->", "&", "|", "<", "=", "+", "-", "*", ".."]
+        fragments = ["]", "[", "INF", "(", ")", ":", ",", "{", '"', "(*", "*)", "5ms", "."]
+        for _ in range(200):
+            messages = []
+            for i in range(rnd.randint(1, 4)):
+                parts = [rnd.choice(operands)]
+                for _ in range(rnd.randint(0, 3)):
+                    parts += [rnd.choice(operators), rnd.choice(operands)]
+                meta = rnd.choice(["", f"[id:{i}] ", '[id:"(*"]\n'])
+                header = rnd.choice(["INF(@a>@b)", "X.d.a(*>[@b, @c])"])
+                messages.append(f"{meta}{header}: " + rnd.choice([" ", "\n"]).join(parts))
+            source = rnd.choice(["\n", " ", " (* z *) "]).join(messages)
+            if rnd.random() < 0.3:
+                k = rnd.randrange(len(source) + 1)
+                source = source[:k] + rnd.choice(fragments) + source[k:]
+            expected = _outcome(Parser, source)
+            outcomes = [_outcome(Parser, piece) for piece in _pieces(source)]
+            if isinstance(expected, tuple):
+                assert any(isinstance(o, tuple) for o in outcomes), source
+            else:
+                assert all(len(o) == 1 for o in outcomes), source
+                assert [m for o in outcomes for m in o] == expected, source
+
+
+# ── Symbol dictionary ────────────────────────────────────────────────
+
+class TestSymbolDictionary:
+    def test_eviction_reuses_least_recent_index(self):
+        table = SymbolDictionary(maxsize=2)
+        assert table.use("@a") is None
+        assert table.use("@b") is None
+        assert table.use("@a") == 0
+        assert table.use("#c") is None  # evicts @b, takes its index
+        assert table.name(1) == "#c"
+        assert table.use("@b") is None  # evicts @a
+        assert table.name(0) == "@b"
+        with pytest.raises(IndexError):
+            table.name(2)
+
+    def test_aliases_after_first_use(self):
+        encoder, decoder = SymbolEncoder(), SymbolDecoder()
+        first = '[ctx:"c1"] REQ(@planner>@worker-7): #task{priority:1, deadline:30s}'
+        second = '[ctx:"c1"] RPL(@worker-7>@planner): #task{priority:2, deadline:5s}'
+        assert encoder.encode(first) == first
+        coded = encoder.encode(second)
+        assert coded == '[0:"c1"] RPL(@2>@1): #3{4:2, 5:5s}'
+        assert decoder.decode(first) == parse(first)
+        assert decoder.decode(coded) == parse(second)
+
+    @pytest.mark.parametrize("maxsize", [1, 3, 1000])
+    def test_conversation_round_trip(self, maxsize):
+        messages = [text for name in ("basic.axon", "advanced.axon", "real_world_scenarios.axon")
+                    for text in _pieces(_read_example(name))]
+        encoder, decoder = SymbolEncoder(maxsize), SymbolDecoder(maxsize)
+        plain = coded = 0
+        for n, text in enumerate(messages * 2):
+            sent = encoder.encode(text, plain=n % 5 == 0)
+            assert decoder.decode(sent) == parse(text)
+            plain += len(text)
+            coded += len(sent)
+        assert coded < plain
+        assert encoder.symbols._names == decoder.symbols._names
+
+    def test_plain_fallback(self):
+        encoder, decoder = SymbolEncoder(), SymbolDecoder()
+        text = "INF(@alpha>@beta): {status:#ok}"
+        encoder.encode(text)
+        assert encoder.encode(text, plain=True) == text
+        assert decoder.decode(text) == decoder.decode(text) == parse(text)
+        assert encoder.encode(text) == "INF(@0>@1): {2:#3}"
+        assert decoder.decode("INF(@0>@1): {2:#3}") == parse(text)
+
+    def test_bad_aliases_reset_the_decoder(self):
+        decoder = SymbolDecoder()
+        decoder.decode("INF(@alpha>@beta): {status:#ok}")
+        for coded in ("INF(@0>@1): {9:1}", "INF(@0>@1): #0", "INF(@0>@1): {0:1}"):
+            with pytest.raises(ParseError):
+                decoder.decode(coded)
+            assert len(decoder.symbols) == 0
+            decoder.decode("INF(@alpha>@beta): {status:#ok}")
+
+    def test_encoder_rejects_alias_syntax(self):
+        with pytest.raises(ParseError):
+            SymbolEncoder().encode("INF(@a>@b): {1:2}")
+        with pytest.raises(LexerError):
+            SymbolEncoder().encode("INF(@1>@b): 2")
@@ -0,0 +1,188 @@
+"""
+Tests for the AXON serializer (AST back to text).
+"""
+
+import sys
+import os
+import io
+import random
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from axon_parser import (
+    parse, ParseLimits, RegexLexer, StackParser,
+    Message, Routing, MetaBlock, StringLiteral, NumberLiteral, BinaryExpr,
+    CallExpr, ListExpr, Identifier, NamedArg, Reference,
+)
+from axon_serializer import dump, dumps
+from axon_cache import freeze
+
+ROOT = os.path.join(os.path.dirname(__file__), "..")
+CORPUS = [
+    os.path.join(ROOT, "examples", name)
+    for name in ("basic.axon", "advanced.axon", "real_world_scenarios.axon")
+] + [
+    os.path.join(ROOT, "tests", "conformance", name)
+    for name in sorted(os.listdir(os.path.join(ROOT, "tests", "conformance")))
+    if name.startswith("valid_")
+]
+
+
+def _canonical(content: str) -> str:
+    return dumps(parse(f"INF(@a>@b): {content}"))[len("INF(@a>@b): "):]
+
+
+# ── Round trip ───────────────────────────────────────────────────────
+
+class TestRoundTrip:
+    @pytest.mark.parametrize("path", CORPUS, ids=os.path.basename)
+    def test_corpus(self, path):
+        with open(path) as f:
+            messages = parse(f.read())
+        text = dumps(messages)
+        assert parse(text) == messages
+        assert dumps(parse(text)) == text
+
+    def test_single_message(self):
+        msg = parse('[id:"m1", ^:3] QRY(@a>[@b, @c]): f(x, n:1)')[0]
+        assert dumps(msg) == '[id:"m1", ^:3] QRY(@a>[@b, @c]): f(x, n:1)'
+        assert parse(dumps(msg)) == [msg]
+
+    def test_canonical_spacing(self):
+        text = dumps(parse("RPL( @b > * ) :{a :1,b:[ 1 ,2 ], c: a+b*2 ,d:1 .. 5}"))
+        assert text == "RPL(@b>*): {a:1, b:[1, 2], c:a + b * 2, d:1..5}"
+
+    def test_built_message(self):
+        msg = Message("REQ", Routing("@a", "@b"),
+                      BinaryExpr("*", BinaryExpr("+", Identifier("a"), Identifier("b")),
+                                 NumberLiteral(2, "ms")),
+                      MetaBlock({"id": StringLiteral("x")}))
+        assert dumps(msg) == '[id:"x"] REQ(@a>@b): (a + b) * 2ms'
+        assert parse(dumps(msg)) == [msg]
+
+    def test_frozen_and_lazy_messages(self):
+        with open(CORPUS[1]) as f:
+            source = f.read()
+        text = dumps(parse(source))
+        assert dumps(freeze(parse(source))) == text
+        assert dumps(parse(source, lazy=True)) == text
+
+    def test_random_expressions(self):
+        rnd = random.Random(16)
+        leaves = ["a", "1", "5ms", '"s"', "T", "_", "@r", "$v", "#t", "x.y", "f()", "ACC(1)"]
+        ops = ["<-", "->", "&", "|", "<", "=", "==", "!=", "+", "-", "*", "/", ".."]
+
+        def expr(depth):
+            if depth == 0 or rnd.random() < 0.2:
+                return rnd.choice(leaves)
+            kind = rnd.randrange(6)
+            if kind == 0:
+                return "[" + ", ".join(expr(depth - 1) for _ in range(rnd.randint(0, 2))) + "]"
+            if kind == 1:
+                return rnd.choice("-~!") + expr(depth - 1)
+            if kind == 2:
+                return f"REQ(@a>@b): {expr(depth - 1)}"
+            return f"({expr(depth - 1)} {rnd.choice(ops)} {expr(depth - 1)})"
+
+        checked = 0
+        for _ in range(2000):
+            try:
+                messages = parse(f"INF(@a>@b): {expr(5)}")
+            except Exception:
+                continue
+            text = dumps(messages)
+            assert parse(text) == messages, text
+            checked += 1
+        assert checked > 500
+
+    def test_deep_nesting(self):
+        source = "INF(@a>@b): " + "[" * 5000 + "]" * 5000
+        tokens = RegexLexer(source).iter_tokens()
+        msg = StackParser(tokens, ParseLimits(max_depth=10**6)).parse()[0]
+        assert dumps(msg) == source
+
+
+# ── Parentheses ──────────────────────────────────────────────────────
+
+class TestParentheses:
+    @pytest.mark.parametrize("source, expected", [
+        ("((a + b)) + c", "a + b + c"),
+        ("a + (b + c)", "a + (b + c)"),
+        ("(a + b) * c", "(a + b) * c"),
+        ("a + (b * c)", "a + b * c"),
+        ("a <- (b <- c)", "a <- b <- c"),
+        ("(a <- b) <- c", "(a <- b) <- c"),
+        ("(a < b) = T", "(a < b) = T"),
+        ("a & (b < c)", "a & b < c"),
+        ("(1 + 2)..(3 * 4)", "(1 + 2)..(3 * 4)"),
+        ("(a..b) + c", "a..b + c"),
+        ("-(a + b)", "-(a + b)"),
+        ("-(-a)", "--a"),
+        ("neg(5)", "-5"),
+        ("!(a..b)", "!(a..b)"),
+        ("neg(n: 1)", "neg(n:1)"),
+    ])
+    def test_minimal(self, source, expected):
+        assert _canonical(source) == expected
+
+    def test_nested_message_operand(self):
+        # Content runs to the end of its slot: grouped unless nothing follows
+        assert _canonical("a & REQ(@x>@y): b") == "a & REQ(@x>@y): b"
+        assert _canonical("(a & (REQ(@x>@y): b)) | c") == "(a & REQ(@x>@y): b) | c"
+        assert _canonical("(REQ(@x>@y): b) & c") == "(REQ(@x>@y): b) & c"
+        assert _canonical("[REQ(@x>@y): b | c, d]") == "[REQ(@x>@y): b | c, d]"
+
+    def test_performative_call_argument(self):
+        # `ACC([1])` or `ACC(@a > b)` would read as a nested message header
+        for source in ("ACC(([1]))", "ACC((@a > b), c)", "ACC((@a > b & c))"):
+            msg = parse(f"INF(@a>@b): {source}")[0]
+            assert dumps(msg) == f"INF(@a>@b): {source}"
+            assert parse(dumps(msg)) == [msg]
+        assert _canonical("ACC(@a, b)") == "ACC(@a, b)"
+
+
+# ── Literals ─────────────────────────────────────────────────────────
+
+class TestLiterals:
+    def test_string_escapes(self):
+        value = 'say "hi"\\ \n\tend\r'
+        text = dumps(StringLiteral(value))
+        assert text == '"say \\"hi\\"\\\\ \\n\\tend\r"'
+        assert parse(f"INF(@a>@b): {text}")[0].content == StringLiteral(value)
+
+    @pytest.mark.parametrize("value, text", [
+        (0, "0"), (42, "42"), (1.5, "1.5"), (2.0, "2.0"),
+        (1e16, "10000000000000000.0"), (1e-7, "0.0000001"),
+    ])
+    def test_numbers(self, value, text):
+        assert dumps(NumberLiteral(value)) == text
+        assert parse(f"INF(@a>@b): {text}")[0].content == NumberLiteral(value)
+
+    def test_unit(self):
+        assert dumps(NumberLiteral(1.5, "KB")) == "1.5KB"
+
+    @pytest.mark.parametrize("value", [-1, -0.0, float("inf"), float("nan")])
+    def test_unrepresentable_numbers(self, value):
+        with pytest.raises(ValueError):
+            dumps(NumberLiteral(value))
+
+    def test_nested_meta_rejected(self):
+        inner = Message("REQ", Routing("@a", "@b"), Identifier("x"), MetaBlock({}))
+        with pytest.raises(ValueError):
+            dumps(Message("INF", Routing("@a", "@b"), ListExpr([inner])))
+
+
+# ── Output ───────────────────────────────────────────────────────────
+
+class TestDump:
+    def test_dump_streams_messages(self):
+        messages = parse("INF(@a>@b): 1\nINF(@b>@a): 2")
+        out = io.StringIO()
+        dump(iter(messages), out)
+        assert out.getvalue() == "INF(@a>@b): 1\nINF(@b>@a): 2\n"
+        assert parse(out.getvalue()) == messages
+
+    def test_dumps_expression(self):
+        node = CallExpr("f", [Reference("@a"), NamedArg("n", NumberLiteral(1))])
+        assert dumps(node) == "f(@a, n:1)"
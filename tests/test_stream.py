@@ -0,0 +1,276 @@
+"""
+Tests for incremental AXON input: chunked lexing and parse_iter().
+"""
+
+import io
+import sys
+import os
+import random
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from axon_parser import (
+    parse,
+    parse_iter,
+    ChunkLexer,
+    IncrementalParser,
+    RegexLexer,
+    LexerError,
+    ParseError,
+    ParseLimits,
+    LimitExceeded,
+)
+
+EXAMPLE_DIR = os.path.join(os.path.dirname(__file__), "..", "examples")
+
+
+def _read_example(name):
+    with open(os.path.join(EXAMPLE_DIR, name)) as f:
+        return f.read()
+
+
+def _split(source, sizes):
+    chunks, pos = [], 0
+    for size in sizes:
+        chunks.append(source[pos:pos + size])
+        pos += size
+    chunks.append(source[pos:])
+    return chunks
+
+
+# ── ChunkLexer ───────────────────────────────────────────────────────
+
+def _chunk_tokens(chunks):
+    lexer = ChunkLexer()
+    tokens = []
+    for chunk in chunks:
+        tokens.extend(lexer.feed(chunk))
+    tokens.extend(lexer.close())
+    return [(t.type, t.value, t.line, t.col, t.offset) for t in tokens]
+
+
+class TestChunkLexer:
+    def test_one_character_chunks(self):
+        source = _read_example("real_world_scenarios.axon")
+        expected = [(t.type, t.value, t.line, t.col, t.offset) for t in RegexLexer(source).tokenize()]
+        assert _chunk_tokens(source) == expected
+
+    @pytest.mark.parametrize("source,cut", [
+        ("5min", 2),            # unit split
+        ("x -> y", 3),          # operator split
+        ("agent-x", 6),         # "-" inside identifier
+        ("(*> x", 2),           # routing wildcard vs comment
+        ('"a\\"b"', 3),         # escaped quote split after backslash
+        ("(* a (* b *) *)", 8),  # nested comment split
+        ("(* a *)x", 6),        # "*" and ")" in separate chunks
+        ("#ont.temp", 5),       # qualified id split at the dot
+    ])
+    def test_boundary_inside_lexeme(self, source, cut):
+        expected = [(t.type, t.value, t.line, t.col, t.offset) for t in RegexLexer(source).tokenize()]
+        assert _chunk_tokens([source[:cut], source[cut:]]) == expected
+
+    def test_pending_string_is_not_rescanned(self):
+        lexer = ChunkLexer()
+        assert lexer.feed('INF(@a>@b): "' + "x" * 1000) != []
+        assert lexer.pos == len(lexer.source)
+        lexer.feed("y" * 1000)
+        assert lexer.source == "y" * 1000
+        assert lexer.pos == len(lexer.source)
+        tokens = lexer.feed('"\n') + lexer.close()
+        assert tokens[0].value == "x" * 1000 + "y" * 1000
+        assert (tokens[0].line, tokens[0].col) == (1, 13)
+
+    def test_unterminated_string_position(self):
+        lexer = ChunkLexer()
+        lexer.feed('INF(@a>@b):\n "abc')
+        lexer.feed("\ndef")
+        with pytest.raises(LexerError, match="at 3:4: Unterminated string"):
+            lexer.close()
+
+    def test_unterminated_comment_position(self):
+        lexer = ChunkLexer()
+        lexer.feed("x\n  (* open")
+        with pytest.raises(LexerError, match="at 2:3: Unterminated comment"):
+            lexer.close()
+
+    @pytest.mark.parametrize("seed", range(3))
+    def test_random_splits(self, seed):
+        rnd = random.Random(seed)
+        source = _read_example("advanced.axon") + '"tail \\" (* x *)"\n(* a (* b *) c *)\n5min'
+        expected = [(t.type, t.value, t.line, t.col, t.offset) for t in RegexLexer(source).tokenize()]
+        for _ in range(20):
+            sizes = [rnd.randint(0, 7) for _ in range(len(source) // 3)]
+            assert _chunk_tokens(_split(source, sizes)) == expected
+
+
+# ── parse_iter ───────────────────────────────────────────────────────
+
+class TestParseIter:
+    def test_text_file(self):
+        source = _read_example("real_world_scenarios.axon")
+        assert list(parse_iter(io.StringIO(source), chunk_size=7)) == parse(source)
+
+    def test_binary_file_with_multibyte_split(self):
+        source = 'INF(@a>@b): "température 20°C"\nACK(@b>@a): _\n'
+        data = source.encode("utf-8")
+        assert list(parse_iter(io.BytesIO(data), chunk_size=1)) == parse(source)
+
+    def test_iterable_of_chunks(self):
+        source = _read_example("basic.axon")
+        chunks = _split(source, [5] * (len(source) // 5))
+        assert list(parse_iter(chunks)) == parse(source)
+
+    def test_yields_before_stream_ends(self):
+        def endless_log():
+            n = 0
+            while True:
+                n += 1
+                yield f'[id:"m{n}"] PUB(@monitor>@dashboard): {{cpu:{n}%}}\n'
+
+        messages = parse_iter(endless_log())
+        first = next(messages)
+        second = next(messages)
+        assert first.meta.fields["id"].value == "m1"
+        assert second.meta.fields["id"].value == "m2"
+
+    def test_error_positions_are_absolute(self):
+        source = "ACK(@a>@b): _\n" * 50 + "ACK(@a>@b) _\n"
+        with pytest.raises(ParseError, match="at 51:12"):
+            list(parse_iter(io.StringIO(source), chunk_size=16))
+
+
+# ── IncrementalParser ────────────────────────────────────────────────
+
+def _push(chunks):
+    parser = IncrementalParser()
+    messages = []
+    for chunk in chunks:
+        messages.extend(parser.feed(chunk))
+    messages.extend(parser.close())
+    return messages
+
+
+class TestIncrementalParser:
+    @pytest.mark.parametrize("name", ["basic.axon", "advanced.axon", "real_world_scenarios.axon"])
+    def test_matches_parse_with_random_chunks(self, name):
+        source = _read_example(name)
+        rnd = random.Random(name)
+        for _ in range(10):
+            sizes = [rnd.randint(1, 40) for _ in range(len(source) // 10)]
+            assert _push(_split(source, sizes)) == parse(source)
+
+    def test_returns_messages_as_they_complete(self):
+        parser = IncrementalParser()
+        assert parser.feed('[id:"m1"] PUB(@monitor>@dash): {cpu:72%, ') == []
+        assert parser.feed("mem:4.2GB}\n") == []
+        done = parser.feed('[id:"m2"] PUB(@monitor>@dash): {cpu:68%}\n')
+        assert [m.meta.fields["id"].value for m in done] == ["m1"]
+        assert [m.meta.fields["id"].value for m in parser.close()] == ["m2"]
+
+    def test_nested_messages_are_not_split(self):
+        source = "DEL(@ceo>@vp): REQ(*>@team): x -> INF(@a>@b): y\nACK(@vp>@ceo): _"
+        messages = _push([source[:20], source[20:40], source[40:]])
+        assert messages == parse(source)
+        assert len(messages) == 2
+
+    def test_operator_continues_across_chunks(self):
+        messages = _push(["INF(@a>@b): x ->\n", "INF(@c>@d): y\n", "ACK(@b>@a): _"])
+        assert len(messages) == 2
+        assert messages[0].content.op == "->"
+
+    def test_bytes_split_inside_character(self):
+        data = 'INF(@a>@b): "naïve"\nACK(@b>@a): _'.encode("utf-8")
+        assert _push([data[:17], data[17:]]) == parse(data.decode("utf-8"))
+
+    def test_partial_comment_and_string(self):
+        source = '(* note (* nested *) *) INF(@a>@b): "a \\" b"\nACK(@b>@a): _'
+        assert _push([source[i:i + 3] for i in range(0, len(source), 3)]) == parse(source)
+
+    def test_error_raised_at_the_same_token(self):
+        source = "INF(@a>@b): x\nINF(@a>@b) y\nACK(@b>@a): _"
+        with pytest.raises(ParseError) as expected:
+            parse(source)
+        with pytest.raises(ParseError) as actual:
+            _push([source[:5], source[5:]])
+        assert str(actual.value) == str(expected.value)
+
+    def test_line_table_stays_bounded(self):
+        source = "".join(f"INF(@a>@b): {{x:{i}}}\n" for i in range(500))
+        parser = IncrementalParser()
+        for i in range(0, len(source), 7):
+            parser.feed(source[i:i + 7])
+        assert len(parser._lexer.lines._starts) < 5
+        with pytest.raises(ParseError) as e:
+            parser.feed("INF(@a>@b): {x:,}\n")
+            parser.close()
+        assert (e.value.token.line, e.value.token.col) == (501, 16)
+
+    def test_feed_after_close(self):
+        parser = IncrementalParser()
+        parser.close()
+        with pytest.raises(ValueError):
+            parser.feed("x")
+
+
+class TestStreamLimits:
+    def test_parse_iter_with_limits(self):
+        source = "INF(@a>@b): " + "[" * 5000 + "]" * 5000 + "\nACK(@b>@a): _"
+        messages = list(parse_iter(io.StringIO(source), chunk_size=64,
+                                   limits=ParseLimits(max_depth=None)))
+        assert len(messages) == 2 and messages[1] == parse("ACK(@b>@a): _")[0]
+        with pytest.raises(LimitExceeded):
+            list(parse_iter(io.StringIO(source), limits=ParseLimits(max_depth=100)))
+
+    @pytest.mark.parametrize("opening", ['"', "(* "])
+    def test_parse_iter_bounds_unfinished_lexeme(self, opening):
+        def endless():
+            yield "INF(@a>@b): 1\nINF(@a>@b): " + opening
+            while True:
+                yield "x" * 100
+
+        messages = parse_iter(endless(), limits=ParseLimits(max_message_bytes=1000))
+        assert next(messages) == parse("INF(@a>@b): 1")[0]
+        with pytest.raises(LimitExceeded) as info:
+            next(messages)
+        assert info.value.limit == "max_message_bytes"
+        assert (info.value.token.line, info.value.token.col) == (2, 13)
+
+    def test_push_matches_with_limits(self):
+        source = _read_example("real_world_scenarios.axon")
+        parser = IncrementalParser(ParseLimits())
+        messages = []
+        for i in range(0, len(source), 7):
+            messages.extend(parser.feed(source[i:i + 7]))
+        messages.extend(parser.close())
+        assert messages == parse(source)
+
+    def test_push_rejects_oversized_message_early(self):
+        parser = IncrementalParser(ParseLimits(max_message_bytes=1000))
+        parser.feed("INF(@a>@b): [")
+        with pytest.raises(LimitExceeded) as info:
+            for _ in range(200):
+                parser.feed("1, 2, 3, ")
+        assert info.value.limit == "max_message_bytes"
+
+    @pytest.mark.parametrize("opening", ['"', "(* "])
+    def test_push_bounds_leading_unfinished_lexeme(self, opening):
+        parser = IncrementalParser(ParseLimits(max_message_bytes=1000))
+        parser.feed(opening)
+        with pytest.raises(LimitExceeded) as info:
+            for _ in range(20):
+                parser.feed("x" * 100)
+        assert (info.value.token.line, info.value.token.col) == (1, 1)
+
+    def test_push_rejects_unterminated_string_early(self):
+        parser = IncrementalParser(ParseLimits(max_message_bytes=1000))
+        parser.feed('INF(@a>@b): "')
+        with pytest.raises(LimitExceeded):
+            for _ in range(100):
+                parser.feed("x" * 50)
+
+    def test_push_bounds_token_count(self):
+        parser = IncrementalParser(ParseLimits(max_tokens=50))
+        with pytest.raises(LimitExceeded) as info:
+            parser.feed("INF(@a>@b): [" + "1, " * 100)
+        assert info.value.limit == "max_tokens"
@@ -30,6 +30,15 @@ class TestLevel1Syntactic:
         assert not result.valid
         assert any("Parse error" in d.message for d in result.errors)
 
+    def test_parse_error_position(self):
+        result = validate('[id:"m1", %%:1] INF(@a>@b): "hello"\nINF(@a>@b) x')
+        assert (result.errors[0].line, result.errors[0].col) == (2, 12)
+
+    def test_message_diagnostics_have_positions(self):
+        result = validate('[id:"m1", %%:1] INF(@a>@b): 1\n  INF(@a>@b): 2')
+        assert [(d.message_index, d.line, d.col) for d in result.errors] == [(1, 2, 3)]
+        assert "[msg 1] at 2:3" in str(result.errors[0])
+
     def test_empty_input(self):
         result = validate('')
         assert result.valid